@@ -7,6 +7,7 @@ FastAPI routes for the Legal Advisory System.
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 from typing import Any, Dict, List, Optional
 import os
@@ -17,6 +18,7 @@ from backend.common_services.matching_engine import UniversalMatchingEngine
 from backend.common_services.module_registry import ModuleRegistry
 from backend.common_services.logging_config import setup_logging, get_logger
 from backend.conversation import ConversationManager
+from backend.conversation.session_codec import ORJSON_AVAILABLE
 from backend.hybrid_ai import ClaudeAIService, HybridAIOrchestrator
 from backend.modules.order_21 import Order21Module
 from backend.modules.order_21.case_law_manager import get_case_law_manager
@@ -34,6 +36,7 @@ app = FastAPI(
     title="Legal Advisory System v5.0",
     description="Hybrid AI-powered legal cost advisory system for Singapore Rules of Court",
     version="5.0.0",
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse,
 )
 
 # Configure CORS
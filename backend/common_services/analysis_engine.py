@@ -161,17 +161,17 @@ class AnalysisEngine(IAnalysisEngine):
 
         logger.info(f"Starting analysis with module '{module_id}'")
 
-        # Step 1: Validate fields
-        is_valid, validation_errors = module.validate_fields(filled_fields)
+        # Steps 1-2: Validate fields and check completeness together
+        evaluation = module.evaluate_fields(filled_fields)
+        is_valid, validation_errors = evaluation.is_valid, evaluation.errors
+        completeness_score = evaluation.completeness_score
+        missing_fields = evaluation.missing_fields
 
         if not is_valid:
             logger.warning(
                 f"Validation failed for module '{module_id}': {validation_errors}"
             )
 
-        # Step 2: Check completeness
-        completeness_score, missing_fields = module.check_completeness(filled_fields)
-
         logger.debug(
             f"Completeness: {completeness_score:.2%}, Missing: {missing_fields}"
         )
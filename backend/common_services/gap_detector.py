@@ -8,7 +8,7 @@ Part of the Hybrid AI + Logic Tree architecture.
 
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
-from backend.interfaces.data_structures import LogicTreeNode
+from backend.interfaces.data_structures import FieldRequirement, LogicTreeNode
 
 
 @dataclass
@@ -75,6 +75,8 @@ class GapDetector:
             logic_tree_framework: LogicTreeFramework instance
         """
         self.tree_framework = logic_tree_framework
+        # Required field requirements per module (modules are static once registered)
+        self._required_by_module: Dict[str, List[FieldRequirement]] = {}
 
     def validate_against_tree(
         self, module_id: str, filled_fields: Dict[str, Any]
@@ -119,29 +121,28 @@ class GapDetector:
                 can_calculate=False,
             )
 
-        # Get field requirements
-        field_requirements = module.get_field_requirements()
+        # Get required field requirements
+        required_fields = self._required_by_module.get(module_id)
+        if required_fields is None:
+            required_fields = [fr for fr in module.get_field_requirements() if fr.required]
+            self._required_by_module[module_id] = required_fields
 
         # Find gaps - missing required fields
-        gaps = []
-        required_fields = [fr for fr in field_requirements if fr.required]
-
-        for field_req in required_fields:
-            field_name = field_req.field_name
-
-            # Check if field is filled
-            if field_name not in filled_fields or filled_fields[field_name] is None:
-                gap = Gap(
-                    field_name=field_name,
-                    field_type=field_req.field_type,
-                    description=field_req.description,
-                    legal_basis="Order 21",  # TODO: Get from module metadata
-                    priority="required",
-                    context={
-                        "already_filled": list(filled_fields.keys()),
-                    },
-                )
-                gaps.append(gap)
+        get_value = filled_fields.get
+        missing = [fr for fr in required_fields if get_value(fr.field_name) is None]
+        # Shared by every gap's context, so immutable
+        already_filled = tuple(filled_fields) if missing else ()
+        gaps = [
+            Gap(
+                field_name=field_req.field_name,
+                field_type=field_req.field_type,
+                description=field_req.description,
+                legal_basis="Order 21",  # TODO: Get from module metadata
+                priority="required",
+                context={"already_filled": already_filled},
+            )
+            for field_req in missing
+        ]
 
         # Calculate completeness
         total_required = len(required_fields)
@@ -7,10 +7,53 @@ This runs BEFORE AI extraction to catch obvious patterns reliably.
 """
 
 import re
-from typing import Dict, Optional, Any
+from typing import Dict, Iterable, Optional, Any, Pattern, Tuple
 from decimal import Decimal
 
 
+# Patterns are written in lowercase and compiled case-sensitively; every
+# extractor lowercases its input first, which keeps matching off the slower
+# IGNORECASE path.
+
+
+def _compile_map(patterns: Dict[str, str]) -> Dict[str, Pattern]:
+    """Compile a key -> pattern table, preserving key order."""
+    return {key: re.compile(pattern) for key, pattern in patterns.items()}
+
+
+def _compile_list(patterns: Iterable[str]) -> Tuple[Pattern, ...]:
+    """Compile an ordered list of patterns."""
+    return tuple(re.compile(pattern) for pattern in patterns)
+
+
+def _compile_any(patterns: Iterable[str]) -> Pattern:
+    """
+    Fuse patterns into one alternation that matches if any of them would.
+
+    Used as a single-pass prefilter: when it finds nothing, the individual
+    patterns (which decide priority) never need to run.
+    """
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+
+
+def _compile_keyed(patterns: Iterable[str]) -> Pattern:
+    """
+    Fuse patterns into one alternation with a named group per pattern.
+
+    Group ``_k{i}`` wraps the i-th pattern, so a single finditer pass
+    reports every pattern that occurs. Only suitable for tables whose
+    patterns cannot overlap each other in the text.
+    """
+    return re.compile(
+        "|".join(f"(?P<_k{index}>{pattern})" for index, pattern in enumerate(patterns))
+    )
+
+
+# Amount, trial-day and duration patterns all capture digits, so text
+# without any digit can skip them entirely
+_DIGIT_RE = re.compile(r"\d")
+
+
 class PatternExtractor:
     """
     Extracts legal information from natural language using pattern matching.
@@ -138,8 +181,8 @@ class PatternExtractor:
     # Amount patterns (SGD, $, etc.)
     AMOUNT_PATTERNS = [
         r'\$\s*(\d+(?:,\d{3})*(?:\.\d{2})?)',  # $50,000 or $50000.00
-        r'SGD\s*(\d+(?:,\d{3})*(?:\.\d{2})?)',  # SGD 50,000
-        r'(?:SGD|S\$)\s*(\d+(?:,\d{3})*(?:\.\d{2})?)',  # S$ 50,000
+        r'sgd\s*(\d+(?:,\d{3})*(?:\.\d{2})?)',  # SGD 50,000
+        r'(?:sgd|s\$)\s*(\d+(?:,\d{3})*(?:\.\d{2})?)',  # S$ 50,000
         r'\b(\d+(?:,\d{3})*)\s*(?:dollars?|sgd)\b',  # 50,000 dollars
         r'(?:damages?|claim|amount|sum)(?:\s+of)?\s*(\d+(?:,\d{3})*)',  # damages of 300,000
         r'\b(\d{1,3}(?:,\d{3})+)\b',  # Plain numbers with commas: 300,000, 1,500, etc.
@@ -167,10 +210,84 @@ class PatternExtractor:
         r'\brefused\s*(?:mediation|arbitration|adr)',
     ]
 
+    # Compiled forms of the tables above, built once per process
+    _CASE_TYPE_RES = _compile_map(CASE_TYPE_PATTERNS)
+    _CASE_TYPE_ANY = _compile_any(CASE_TYPE_PATTERNS.values())
+    _APPLICATION_TYPE_RES = _compile_map(APPLICATION_TYPE_PATTERNS)
+    _APPLICATION_TYPE_ANY = _compile_any(APPLICATION_TYPE_PATTERNS.values())
+    _TRIAL_CATEGORY_RES = _compile_map(TRIAL_CATEGORY_PATTERNS)
+    _TRIAL_CATEGORY_ANY = _compile_any(TRIAL_CATEGORY_PATTERNS.values())
+    _TRIAL_PHASE_RES = _compile_map(TRIAL_PHASE_PATTERNS)
+    _TRIAL_PHASE_ANY = _compile_any(TRIAL_PHASE_PATTERNS.values())
+    _ORIGINATING_APP_RES = _compile_map(ORIGINATING_APP_PATTERNS)
+    _ORIGINATING_APP_ANY = _compile_any(ORIGINATING_APP_PATTERNS.values())
+    _APPEAL_LEVEL_RES = _compile_map(APPEAL_LEVEL_PATTERNS)
+    _APPEAL_FROM_RES = _compile_map(APPEAL_FROM_PATTERNS)
+    _CONTESTED_RES = _compile_map(CONTESTED_PATTERNS)
+    # Single-pass scanners for keyword tables whose patterns never overlap
+    _COURT_KEYS = tuple(COURT_PATTERNS)
+    _COURT_SCAN = _compile_keyed(COURT_PATTERNS.values())
+    _CLAIM_NATURE_KEYS = tuple(CLAIM_NATURE_PATTERNS)
+    _CLAIM_NATURE_SCAN = _compile_keyed(CLAIM_NATURE_PATTERNS.values())
+    _DURATION_MINUTES_RES = _compile_list(DURATION_MINUTES_PATTERNS)
+    _DURATION_HOURS_RES = _compile_list(DURATION_HOURS_PATTERNS)
+    _AMOUNT_RES = _compile_list(AMOUNT_PATTERNS)
+    _TRIAL_DAYS_RES = _compile_list(TRIAL_DAYS_PATTERNS)
+    _ADR_REFUSAL_ANY = _compile_any(ADR_REFUSAL_PATTERNS)
+
+    # Trial categories checked before the broader ones
+    _SPECIFIC_TRIAL_CATEGORIES = ("medical_negligence", "intellectual_property", "motor_accident", "simple_torts")
+
     def __init__(self):
         """Initialize pattern extractor."""
         pass
 
+    @staticmethod
+    def _first_matching_key(
+        text: str, any_re: Pattern, compiled: Dict[str, Pattern]
+    ) -> Optional[str]:
+        """
+        Return the first key (in table order) whose pattern matches text.
+
+        Args:
+            text: Text to search
+            any_re: Fused prefilter for the table
+            compiled: Compiled key -> pattern table
+
+        Returns:
+            Matching key or None
+        """
+        if not any_re.search(text):
+            return None
+        for key, regex in compiled.items():
+            if regex.search(text):
+                return key
+        return None
+
+    @staticmethod
+    def _highest_priority_key(
+        text: str, scan_re: Pattern, keys: Tuple[str, ...]
+    ) -> Optional[str]:
+        """
+        Scan text once and return the highest-priority key that occurs.
+
+        Args:
+            text: Text to search
+            scan_re: Keyed alternation built by _compile_keyed
+            keys: Table keys in priority order
+
+        Returns:
+            Matching key or None
+        """
+        best = None
+        for match in scan_re.finditer(text):
+            index = int(match.lastgroup[2:])
+            if index == 0:
+                return keys[0]
+            if best is None or index < best:
+                best = index
+        return None if best is None else keys[best]
+
     def extract_all(self, text: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Extract all possible information from text.
@@ -186,85 +303,88 @@ class PatternExtractor:
         extracted = {}
 
         # Extract court level
-        court = self.extract_court_level(text_lower)
+        court = self._extract_court_level(text_lower)
         if court:
             extracted["court_level"] = court
 
         # Extract case type
-        case_type = self.extract_case_type(text_lower)
+        case_type = self._extract_case_type(text_lower)
         if case_type:
             extracted["case_type"] = case_type
 
         # Extract claim nature (liquidated/unliquidated)
-        claim_nature = self.extract_claim_nature(text_lower)
+        claim_nature = self._extract_claim_nature(text_lower)
         if claim_nature:
             extracted["claim_nature"] = claim_nature
 
+        has_digits = _DIGIT_RE.search(text) is not None
+
         # Extract claim amount
-        amount = self.extract_amount(text)
+        amount = self._extract_amount(text_lower) if has_digits else None
         if amount:
             extracted["claim_amount"] = float(amount)
 
         # Extract trial days
-        trial_days = self.extract_trial_days(text_lower)
+        trial_days = self._extract_trial_days(text_lower) if has_digits else None
         if trial_days:
             extracted["trial_days"] = int(trial_days)
 
         # Extract ADR refusal
-        adr_refused = self.extract_adr_refusal(text_lower)
+        adr_refused = self._extract_adr_refusal(text_lower)
         if adr_refused:
             extracted["adr_refused"] = True
 
         # ======== NEW: Appendix G Extractions ========
 
         # Extract application type (Appendix G Part II)
-        app_type = self.extract_application_type(text_lower)
+        app_type = self._extract_application_type(text_lower)
         if app_type:
             extracted["application_type"] = app_type
             extracted["source"] = "appendix_g"
 
         # Extract trial category (Appendix G Part III)
-        trial_category = self.extract_trial_category(text_lower)
+        trial_category = self._extract_trial_category(text_lower)
         if trial_category:
             extracted["trial_category"] = trial_category
             extracted["source"] = "appendix_g"
 
         # Extract trial phase
-        trial_phase = self.extract_trial_phase(text_lower)
+        trial_phase = self._extract_trial_phase(text_lower)
         if trial_phase:
             extracted["trial_phase"] = trial_phase
 
         # Extract originating application type (Appendix G Part IV)
-        orig_app_type = self.extract_originating_app_type(text_lower)
+        orig_app_type = self._extract_originating_app_type(text_lower)
         if orig_app_type:
             extracted["originating_app_type"] = orig_app_type
             extracted["source"] = "appendix_g"
 
         # Extract appeal level (Appendix G Part V)
-        appeal_level = self.extract_appeal_level(text_lower)
+        appeal_level = self._extract_appeal_level(text_lower)
         if appeal_level:
             extracted["appeal_level"] = appeal_level
             extracted["source"] = "appendix_g"
 
         # Extract appeal from (what the appeal is from)
-        appeal_from = self.extract_appeal_from(text_lower)
+        appeal_from = self._extract_appeal_from(text_lower)
         if appeal_from:
             extracted["appeal_from"] = appeal_from
 
         # Extract contested status
-        contested_status = self.extract_contested_status(text_lower)
+        contested_status = self._extract_contested_status(text_lower)
         if contested_status is not None:
             extracted["contested"] = contested_status
 
-        # Extract duration in minutes
-        duration_mins = self.extract_duration_minutes(text_lower)
-        if duration_mins:
-            extracted["duration_minutes"] = duration_mins
+        if has_digits:
+            # Extract duration in minutes
+            duration_mins = self._extract_duration_minutes(text_lower)
+            if duration_mins:
+                extracted["duration_minutes"] = duration_mins
 
-        # Extract duration in hours (convert to minutes)
-        duration_hours = self.extract_duration_hours(text_lower)
-        if duration_hours:
-            extracted["duration_minutes"] = duration_hours * 60
+            # Extract duration in hours (convert to minutes)
+            duration_hours = self._extract_duration_hours(text_lower)
+            if duration_hours:
+                extracted["duration_minutes"] = duration_hours * 60
 
         return extracted
 
@@ -273,28 +393,35 @@ class PatternExtractor:
         Extract court level from text.
 
         Args:
-            text: Lowercase text
+            text: Text to search (any case)
 
         Returns:
             Court level or None
         """
-        for court, pattern in self.COURT_PATTERNS.items():
-            if re.search(pattern, text, re.IGNORECASE):
-                return court
-        return None
+        return self._extract_court_level(text.lower())
+
+    def _extract_court_level(self, text: str) -> Optional[str]:
+        """Extract court level from text (text must already be lowercased)."""
+        return self._highest_priority_key(text, self._COURT_SCAN, self._COURT_KEYS)
 
     def extract_case_type(self, text: str) -> Optional[str]:
         """
         Extract case type from text.
 
         Args:
-            text: Lowercase text
+            text: Text to search (any case)
 
         Returns:
             Case type or None
         """
-        for case_type, pattern in self.CASE_TYPE_PATTERNS.items():
-            if re.search(pattern, text, re.IGNORECASE):
+        return self._extract_case_type(text.lower())
+
+    def _extract_case_type(self, text: str) -> Optional[str]:
+        """Extract case type from text (text must already be lowercased)."""
+        if not self._CASE_TYPE_ANY.search(text):
+            return None
+        for case_type, regex in self._CASE_TYPE_RES.items():
+            if regex.search(text):
                 # Special handling: if text contains "default", prioritize it
                 if "default" in text and case_type == "default_judgment":
                     return case_type
@@ -310,28 +437,35 @@ class PatternExtractor:
         Extract claim nature (liquidated/unliquidated).
 
         Args:
-            text: Lowercase text
+            text: Text to search (any case)
 
         Returns:
             "liquidated" or "unliquidated" or None
         """
-        for nature, pattern in self.CLAIM_NATURE_PATTERNS.items():
-            if re.search(pattern, text, re.IGNORECASE):
-                return nature
-        return None
+        return self._extract_claim_nature(text.lower())
+
+    def _extract_claim_nature(self, text: str) -> Optional[str]:
+        """Extract claim nature (liquidated/unliquidated); text must already be lowercased."""
+        return self._highest_priority_key(
+            text, self._CLAIM_NATURE_SCAN, self._CLAIM_NATURE_KEYS
+        )
 
     def extract_amount(self, text: str) -> Optional[Decimal]:
         """
         Extract monetary amount from text.
 
         Args:
-            text: Text (preserve case for numbers)
+            text: Text to search (any case)
 
         Returns:
             Decimal amount or None
         """
-        for pattern in self.AMOUNT_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+        return self._extract_amount(text.lower())
+
+    def _extract_amount(self, text: str) -> Optional[Decimal]:
+        """Extract monetary amount from text (text must already be lowercased)."""
+        for regex in self._AMOUNT_RES:
+            match = regex.search(text)
             if match:
                 # Get the number, remove commas
                 amount_str = match.group(1).replace(',', '')
@@ -349,13 +483,17 @@ class PatternExtractor:
         Extract trial duration in days.
 
         Args:
-            text: Lowercase text
+            text: Text to search (any case)
 
         Returns:
             Number of days or None
         """
-        for pattern in self.TRIAL_DAYS_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+        return self._extract_trial_days(text.lower())
+
+    def _extract_trial_days(self, text: str) -> Optional[int]:
+        """Extract trial duration in days (text must already be lowercased)."""
+        for regex in self._TRIAL_DAYS_RES:
+            match = regex.search(text)
             if match:
                 try:
                     days = int(match.group(1))
@@ -371,15 +509,16 @@ class PatternExtractor:
         Extract ADR refusal indicator.
 
         Args:
-            text: Lowercase text
+            text: Text to search (any case)
 
         Returns:
             True if ADR refusal detected, False otherwise
         """
-        for pattern in self.ADR_REFUSAL_PATTERNS:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return self._extract_adr_refusal(text.lower())
+
+    def _extract_adr_refusal(self, text: str) -> bool:
+        """Extract ADR refusal indicator (text must already be lowercased)."""
+        return self._ADR_REFUSAL_ANY.search(text) is not None
 
     def extract_field(self, field_name: str, text: str) -> Optional[Any]:
         """
@@ -395,34 +534,34 @@ class PatternExtractor:
         text_lower = text.lower()
 
         if field_name == "court_level":
-            return self.extract_court_level(text_lower)
+            return self._extract_court_level(text_lower)
         elif field_name == "case_type":
-            return self.extract_case_type(text_lower)
+            return self._extract_case_type(text_lower)
         elif field_name == "claim_nature":
-            return self.extract_claim_nature(text_lower)
+            return self._extract_claim_nature(text_lower)
         elif field_name == "claim_amount":
-            amount = self.extract_amount(text)
+            amount = self._extract_amount(text_lower)
             return float(amount) if amount else None
         elif field_name == "trial_days":
-            return self.extract_trial_days(text_lower)
+            return self._extract_trial_days(text_lower)
         elif field_name == "adr_refused":
-            return self.extract_adr_refusal(text_lower)
+            return self._extract_adr_refusal(text_lower)
         elif field_name == "application_type":
-            return self.extract_application_type(text_lower)
+            return self._extract_application_type(text_lower)
         elif field_name == "trial_category":
-            return self.extract_trial_category(text_lower)
+            return self._extract_trial_category(text_lower)
         elif field_name == "trial_phase":
-            return self.extract_trial_phase(text_lower)
+            return self._extract_trial_phase(text_lower)
         elif field_name == "originating_app_type":
-            return self.extract_originating_app_type(text_lower)
+            return self._extract_originating_app_type(text_lower)
         elif field_name == "appeal_level":
-            return self.extract_appeal_level(text_lower)
+            return self._extract_appeal_level(text_lower)
         elif field_name == "appeal_from":
-            return self.extract_appeal_from(text_lower)
+            return self._extract_appeal_from(text_lower)
         elif field_name == "contested":
-            return self.extract_contested_status(text_lower)
+            return self._extract_contested_status(text_lower)
         elif field_name == "duration_minutes":
-            return self.extract_duration_minutes(text_lower)
+            return self._extract_duration_minutes(text_lower)
 
         return None
 
@@ -435,36 +574,45 @@ class PatternExtractor:
         Extract application type (Appendix G Part II).
 
         Args:
-            text: Lowercase text
+            text: Text to search (any case)
 
         Returns:
             Application type key or None
         """
-        for app_type, pattern in self.APPLICATION_TYPE_PATTERNS.items():
-            if re.search(pattern, text, re.IGNORECASE):
-                return app_type
-        return None
+        return self._extract_application_type(text.lower())
+
+    def _extract_application_type(self, text: str) -> Optional[str]:
+        """Extract application type (Appendix G Part II); text must already be lowercased."""
+        return self._first_matching_key(
+            text, self._APPLICATION_TYPE_ANY, self._APPLICATION_TYPE_RES
+        )
 
     def extract_trial_category(self, text: str) -> Optional[str]:
         """
         Extract trial category (Appendix G Part III).
 
         Args:
-            text: Lowercase text
+            text: Text to search (any case)
 
         Returns:
             Trial category key or None
         """
+        return self._extract_trial_category(text.lower())
+
+    def _extract_trial_category(self, text: str) -> Optional[str]:
+        """Extract trial category (Appendix G Part III); text must already be lowercased."""
+        if not self._TRIAL_CATEGORY_ANY.search(text):
+            return None
+
         # Check more specific patterns first
-        for category in ["medical_negligence", "intellectual_property", "motor_accident", "simple_torts"]:
-            pattern = self.TRIAL_CATEGORY_PATTERNS[category]
-            if re.search(pattern, text, re.IGNORECASE):
+        for category in self._SPECIFIC_TRIAL_CATEGORIES:
+            if self._TRIAL_CATEGORY_RES[category].search(text):
                 return category
 
         # Then check broader categories
-        for category, pattern in self.TRIAL_CATEGORY_PATTERNS.items():
-            if category not in ["medical_negligence", "intellectual_property", "motor_accident", "simple_torts"]:
-                if re.search(pattern, text, re.IGNORECASE):
+        for category, regex in self._TRIAL_CATEGORY_RES.items():
+            if category not in self._SPECIFIC_TRIAL_CATEGORIES:
+                if regex.search(text):
                     return category
 
         return None
@@ -474,45 +622,52 @@ class PatternExtractor:
         Extract trial phase.
 
         Args:
-            text: Lowercase text
+            text: Text to search (any case)
 
         Returns:
             Trial phase key or None
         """
-        for phase, pattern in self.TRIAL_PHASE_PATTERNS.items():
-            if re.search(pattern, text, re.IGNORECASE):
-                return phase
-        return None
+        return self._extract_trial_phase(text.lower())
+
+    def _extract_trial_phase(self, text: str) -> Optional[str]:
+        """Extract trial phase (text must already be lowercased)."""
+        return self._first_matching_key(text, self._TRIAL_PHASE_ANY, self._TRIAL_PHASE_RES)
 
     def extract_originating_app_type(self, text: str) -> Optional[str]:
         """
         Extract originating application type (Appendix G Part IV).
 
         Args:
-            text: Lowercase text
+            text: Text to search (any case)
 
         Returns:
             Originating application type key or None
         """
-        for app_type, pattern in self.ORIGINATING_APP_PATTERNS.items():
-            if re.search(pattern, text, re.IGNORECASE):
-                return app_type
-        return None
+        return self._extract_originating_app_type(text.lower())
+
+    def _extract_originating_app_type(self, text: str) -> Optional[str]:
+        """Extract originating application type (Appendix G Part IV); text must already be lowercased."""
+        return self._first_matching_key(
+            text, self._ORIGINATING_APP_ANY, self._ORIGINATING_APP_RES
+        )
 
     def extract_appeal_level(self, text: str) -> Optional[str]:
         """
         Extract appeal level (Appendix G Part V).
 
         Args:
-            text: Lowercase text
+            text: Text to search (any case)
 
         Returns:
             Appeal level key or None
         """
+        return self._extract_appeal_level(text.lower())
+
+    def _extract_appeal_level(self, text: str) -> Optional[str]:
+        """Extract appeal level (Appendix G Part V); text must already be lowercased."""
         # Check in priority order (most specific first)
-        for level in ["court_of_appeal", "appellate_division", "general_division"]:
-            pattern = self.APPEAL_LEVEL_PATTERNS[level]
-            if re.search(pattern, text, re.IGNORECASE):
+        for level in ("court_of_appeal", "appellate_division", "general_division"):
+            if self._APPEAL_LEVEL_RES[level].search(text):
                 return level
         return None
 
@@ -521,13 +676,17 @@ class PatternExtractor:
         Extract what the appeal is from (interlocutory vs trial).
 
         Args:
-            text: Lowercase text
+            text: Text to search (any case)
 
         Returns:
             "interlocutory" or "trial" or None
         """
-        for appeal_from, pattern in self.APPEAL_FROM_PATTERNS.items():
-            if re.search(pattern, text, re.IGNORECASE):
+        return self._extract_appeal_from(text.lower())
+
+    def _extract_appeal_from(self, text: str) -> Optional[str]:
+        """Extract what the appeal is from (interlocutory vs trial); text must already be lowercased."""
+        for appeal_from, regex in self._APPEAL_FROM_RES.items():
+            if regex.search(text):
                 return appeal_from
         return None
 
@@ -536,17 +695,21 @@ class PatternExtractor:
         Extract whether application/matter is contested.
 
         Args:
-            text: Lowercase text
+            text: Text to search (any case)
 
         Returns:
             True if contested, False if uncontested, None if unclear
         """
+        return self._extract_contested_status(text.lower())
+
+    def _extract_contested_status(self, text: str) -> Optional[bool]:
+        """Extract whether application/matter is contested (text must already be lowercased)."""
         # Check uncontested first (more specific)
-        if re.search(self.CONTESTED_PATTERNS["uncontested"], text, re.IGNORECASE):
+        if self._CONTESTED_RES["uncontested"].search(text):
             return False
 
         # Then check contested
-        if re.search(self.CONTESTED_PATTERNS["contested"], text, re.IGNORECASE):
+        if self._CONTESTED_RES["contested"].search(text):
             return True
 
         return None
@@ -556,13 +719,17 @@ class PatternExtractor:
         Extract duration in minutes.
 
         Args:
-            text: Lowercase text
+            text: Text to search (any case)
 
         Returns:
             Duration in minutes or None
         """
-        for pattern in self.DURATION_MINUTES_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+        return self._extract_duration_minutes(text.lower())
+
+    def _extract_duration_minutes(self, text: str) -> Optional[int]:
+        """Extract duration in minutes (text must already be lowercased)."""
+        for regex in self._DURATION_MINUTES_RES:
+            match = regex.search(text)
             if match:
                 try:
                     minutes = int(match.group(1))
@@ -578,13 +745,17 @@ class PatternExtractor:
         Extract duration in hours.
 
         Args:
-            text: Lowercase text
+            text: Text to search (any case)
 
         Returns:
             Duration in hours or None
         """
-        for pattern in self.DURATION_HOURS_PATTERNS:
-            match = re.search(pattern, text, re.IGNORECASE)
+        return self._extract_duration_hours(text.lower())
+
+    def _extract_duration_hours(self, text: str) -> Optional[int]:
+        """Extract duration in hours (text must already be lowercased)."""
+        for regex in self._DURATION_HOURS_RES:
+            match = regex.search(text)
             if match:
                 try:
                     hours = int(match.group(1))
@@ -594,3 +765,8 @@ class PatternExtractor:
                 except (ValueError, IndexError):
                     continue
         return None
+
+
+# Shared, read-only extractor. All pattern tables are compiled at class
+# definition, so one instance can safely serve every caller in the process.
+DEFAULT_PATTERN_EXTRACTOR = PatternExtractor()
@@ -6,19 +6,27 @@ Primary orchestrator for all conversations.
 Manages dialogue flow and information gathering.
 """
 
-import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import asyncio
+import re
+import secrets
+import time
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from backend.common_services.analysis_engine import AnalysisEngine
 from backend.common_services.module_registry import ModuleRegistry
-from backend.common_services.pattern_extractor import PatternExtractor
+from backend.common_services.pattern_extractor import DEFAULT_PATTERN_EXTRACTOR, PatternExtractor
 from backend.common_services.gap_detector import GapDetector
 from backend.common_services.logging_config import get_logger, log_extraction, log_conversation_flow, log_calculation
-from backend.hybrid_ai.hybrid_orchestrator import HybridAIOrchestrator
-from backend.hybrid_ai.hybrid_turn_manager import HybridTurnManager
-from backend.hybrid_ai.natural_question_generator import NaturalQuestionGenerator
-from backend.hybrid_ai.dynamic_result_explainer import DynamicResultExplainer
+from backend.conversation.session_store import InMemorySessionStore, SessionStore
+
+# hybrid_ai pulls in the Anthropic SDK on import; it is imported lazily in
+# ConversationManager.__init__ so importing this module stays cheap. The
+# analysis engine is only needed for annotations since instances are injected.
+if TYPE_CHECKING:
+    from backend.common_services.analysis_engine import AnalysisEngine
+    from backend.hybrid_ai.hybrid_orchestrator import HybridAIOrchestrator
 
 # Set up logging
 logger = get_logger(__name__)
@@ -27,8 +35,42 @@ from backend.interfaces import (
     ConversationResponse,
     ConversationSession,
     ConversationStatus,
+    FieldRequirement,
     MessageRole,
+    QuestionTemplate,
+)
+
+# Number of most recent history entries passed to the hybrid turn manager
+MAX_HISTORY_CONTEXT = 20
+
+# Replies that cannot carry any extractable field (empty, yes/no, punctuation)
+_TRIVIAL_MESSAGE_RE = re.compile(r"^\s*(?:y|n|yes|no|ok|okay)?\s*[.!?]*\s*$", re.IGNORECASE)
+
+# (case_type, claim_nature) pairs extracted together that map to a combined case_type
+_CASE_TYPE_COMBOS = {
+    ("default_judgment", "liquidated"): "default_judgment_liquidated",
+    ("default_judgment", "unliquidated"): "default_judgment_unliquidated",
+}
+
+# Errors expected during a turn (invalid field values, AI service timeouts),
+# logged without a traceback. asyncio.TimeoutError is the builtin
+# TimeoutError from Python 3.11 but a separate class on 3.10.
+_EXPECTED_ERRORS = (ValueError, asyncio.TimeoutError, TimeoutError)
+
+# Number of distinct normalized messages whose pattern extraction is memoized
+EXTRACTION_CACHE_SIZE = 1024
+
+# Role strings used in serialized history entries
+_ROLE_USER = MessageRole.USER.value
+_ROLE_ASSISTANT = MessageRole.ASSISTANT.value
+
+# Final analysis message: explanation, optional recommendations, closing question
+_ANALYSIS_MESSAGE_TEMPLATE = (
+    "{explanation}{recommendations}"
+    "\n\nWould you like more details on any aspect of these costs?"
 )
+_RECOMMENDATIONS_HEADER = "\n\n**RECOMMENDATIONS:**\n"
+MAX_RECOMMENDATIONS_SHOWN = 3
 
 
 class ConversationManager:
@@ -45,9 +87,11 @@ class ConversationManager:
 
     def __init__(
         self,
-        hybrid_ai: HybridAIOrchestrator,
-        analysis_engine: AnalysisEngine,
+        hybrid_ai: "HybridAIOrchestrator",
+        analysis_engine: "AnalysisEngine",
         module_registry: ModuleRegistry,
+        pattern_extractor: Optional[PatternExtractor] = None,
+        session_store: Optional[SessionStore] = None,
     ):
         """
         Initialize Conversation Manager.
@@ -56,13 +100,22 @@ class ConversationManager:
             hybrid_ai: Hybrid AI Orchestrator for AI enhancement
             analysis_engine: Analysis Engine for calculations
             module_registry: Module Registry for module selection
+            pattern_extractor: Pattern extractor (defaults to the shared instance)
+            session_store: Session storage backend (defaults to in-memory)
         """
         self._hybrid_ai = hybrid_ai
         self._analysis_engine = analysis_engine
         self._module_registry = module_registry
-        self._pattern_extractor = PatternExtractor()
+        self._pattern_extractor = pattern_extractor or DEFAULT_PATTERN_EXTRACTOR
+        self._cached_extract_all = lru_cache(maxsize=EXTRACTION_CACHE_SIZE)(
+            self._pattern_extractor.extract_all
+        )
 
         # Initialize hybrid architecture components
+        from backend.hybrid_ai.dynamic_result_explainer import DynamicResultExplainer
+        from backend.hybrid_ai.hybrid_turn_manager import HybridTurnManager
+        from backend.hybrid_ai.natural_question_generator import NaturalQuestionGenerator
+
         self._gap_detector = GapDetector(module_registry.tree_framework)
         self._question_generator = NaturalQuestionGenerator(hybrid_ai._ai_service)
         self._result_explainer = DynamicResultExplainer(hybrid_ai._ai_service)
@@ -71,17 +124,37 @@ class ConversationManager:
             gap_detector=self._gap_detector,
             pattern_extractor=self._pattern_extractor,
             question_generator=self._question_generator,
+            module_registry=module_registry,
+            result_explainer=self._result_explainer,
         )
 
-        # In-memory session store (will be replaced with Redis/Database in Phase 7)
-        self._sessions: Dict[str, ConversationSession] = {}
-
-        # Statistics
-        self._stats = {
-            "total_sessions": 0,
-            "total_messages": 0,
-            "completed_sessions": 0,
-        }
+        # Session storage (in-memory unless a shared store such as Redis is injected)
+        self._sessions: SessionStore = (
+            session_store
+            if session_store is not None
+            else InMemorySessionStore(on_evict=self._on_session_evicted)
+        )
+        # Networked stores (e.g. Redis) are called from a worker thread in
+        # process_message so they do not block the event loop
+        self._store_blocks = getattr(self._sessions, "blocking", False)
+
+        # Per-module lookups built on first use (modules are static once registered)
+        self._modules_by_id: Dict[str, Any] = {}
+        self._required_fields: Dict[str, List[FieldRequirement]] = {}
+        self._template_maps: Dict[str, Dict[str, QuestionTemplate]] = {}
+
+        # Statistics. Counters are only updated on the event loop thread with
+        # no await between read and write, so increments cannot interleave.
+        self._stats: Counter = Counter(
+            total_sessions=0,
+            total_messages=0,
+            completed_sessions=0,
+        )
+        # Sessions per status, maintained by _set_status. These count only
+        # the changes this process made: with a shared store (e.g. Redis),
+        # sessions created or updated by other workers, or expired by TTL,
+        # are not reflected, so get_statistics clamps them at zero.
+        self._status_counts: Counter = Counter()
 
         logger.info("ConversationManager initialized with HYBRID architecture + DynamicResultExplainer")
 
@@ -99,17 +172,19 @@ class ConversationManager:
         Returns:
             New ConversationSession
         """
-        session_id = str(uuid.uuid4())
+        session_id = secrets.token_hex(16)
+        now = time.time_ns()
         session = ConversationSession(
             session_id=session_id,
             user_id=user_id,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
             status=ConversationStatus.ACTIVE,
         )
 
-        self._sessions[session_id] = session
+        self._sessions.set(session)
         self._stats["total_sessions"] += 1
+        self._status_counts[session.status] += 1
 
         return session
 
@@ -125,15 +200,67 @@ class ConversationManager:
         """
         return self._sessions.get(session_id)
 
-    def save_session(self, session: ConversationSession) -> None:
+    def save_session(
+        self, session: ConversationSession, now: Optional[int] = None
+    ) -> None:
         """
         Save session state.
 
         Args:
             session: Session to save
+            now: Timestamp (ns since epoch) for updated_at; read from the
+                clock when not given
+        """
+        session.updated_at = time.time_ns() if now is None else now
+        self._sessions.set(session)
+
+    async def _load_session(self, session_id: str) -> Optional[ConversationSession]:
+        """
+        Retrieve a session without blocking the event loop on a networked store.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            ConversationSession if exists, None otherwise
+        """
+        if self._store_blocks:
+            return await asyncio.to_thread(self.get_session, session_id)
+        return self.get_session(session_id)
+
+    async def _store_session(self, session: ConversationSession, now: int) -> None:
+        """
+        Save a session without blocking the event loop on a networked store.
+
+        Args:
+            session: Session to save
+            now: Timestamp (ns since epoch) for updated_at
+        """
+        if self._store_blocks:
+            await asyncio.to_thread(self.save_session, session, now)
+        else:
+            self.save_session(session, now)
+
+    def _set_status(self, session: ConversationSession, status: ConversationStatus) -> None:
         """
-        session.updated_at = datetime.utcnow()
-        self._sessions[session.session_id] = session
+        Change session status, keeping per-status counts in step.
+
+        Args:
+            session: Session to update
+            status: New status
+        """
+        self._status_counts[session.status] -= 1
+        self._status_counts[status] += 1
+        session.status = status
+
+    def _on_session_evicted(self, session: ConversationSession) -> None:
+        """
+        Stop counting a session the in-memory store has evicted.
+
+        Args:
+            session: Evicted session
+        """
+        self._status_counts[session.status] -= 1
 
     def list_sessions(self, user_id: Optional[str] = None) -> List[ConversationSession]:
         """
@@ -145,10 +272,7 @@ class ConversationManager:
         Returns:
             List of ConversationSession objects
         """
-        sessions = list(self._sessions.values())
-        if user_id:
-            sessions = [s for s in sessions if s.user_id == user_id]
-        return sessions
+        return self._sessions.scan(user_id)
 
     # ============================================
     # MESSAGE PROCESSING
@@ -166,7 +290,7 @@ class ConversationManager:
         3. **HYBRID TURN**: AI extracts + Logic Tree validates + Gap detection
         4. If complete → Calculate
         5. If gaps → AI asks naturally
-        6. Save session
+        6. Save session (once, whatever the outcome)
         7. Return response
 
         Args:
@@ -177,7 +301,7 @@ class ConversationManager:
             ConversationResponse with assistant's reply and session state
         """
         # Load session
-        session = self.get_session(session_id)
+        session = await self._load_session(session_id)
         if not session:
             return ConversationResponse(
                 message="Session not found. Please start a new conversation.",
@@ -186,11 +310,11 @@ class ConversationManager:
                 next_action="restart",
             )
 
+        # One clock read per turn, shared by both messages and the save
+        now = time.time_ns()
+
         # Add user message to history
-        user_msg = ConversationMessage(
-            role=MessageRole.USER, content=user_message, timestamp=datetime.utcnow()
-        )
-        session.messages.append(user_msg)
+        self._append_message(session, MessageRole.USER, _ROLE_USER, user_message, now)
         self._stats["total_messages"] += 1
 
         try:
@@ -201,16 +325,12 @@ class ConversationManager:
             # ========================================
             # HYBRID TURN: AI + Logic Tree
             # ========================================
-            conversation_history = [
-                {"role": msg.role.value, "content": msg.content}
-                for msg in session.messages
-            ]
-
             hybrid_result = await self._hybrid_turn_manager.process_turn(
                 user_message=user_message,
                 module_id=session.module_id,
                 filled_fields=session.filled_fields,
-                conversation_history=conversation_history,
+                conversation_history=self._recent_history(session, MAX_HISTORY_CONTEXT),
+                explain_if_complete=True,
             )
 
             logger.info(
@@ -224,8 +344,13 @@ class ConversationManager:
 
             # Create response based on hybrid result
             if hybrid_result["status"] == "complete":
-                # We have all information - perform calculation
-                response = await self._perform_analysis(session)
+                # We have all information - reuse the calculation and
+                # explanation produced within the hybrid turn when present
+                response = await self._perform_analysis(
+                    session,
+                    calculation_result=hybrid_result.get("calculation_result"),
+                    rich_explanation=hybrid_result.get("rich_explanation"),
+                )
             else:
                 # Still gathering - return the gap questions
                 response = ConversationResponse(
@@ -243,31 +368,88 @@ class ConversationManager:
                 )
 
             # Add assistant message to history
-            assistant_msg = ConversationMessage(
-                role=MessageRole.ASSISTANT,
-                content=response.message,
-                timestamp=datetime.utcnow(),
+            self._append_message(
+                session, MessageRole.ASSISTANT, _ROLE_ASSISTANT, response.message, now
             )
-            session.messages.append(assistant_msg)
-
-            # Save session
-            self.save_session(session)
 
             return response
 
-        except Exception as e:
-            # Error handling
-            logger.error(f"Error processing message: {e}", exc_info=True)
-            session.status = ConversationStatus.ERROR
-            self.save_session(session)
+        except _EXPECTED_ERRORS as e:
+            # Expected failures (bad values, AI timeouts): no traceback needed
+            logger.error("process_message failed for session %s: %r", session_id, e)
+            return self._error_response(session, e)
 
-            return ConversationResponse(
-                message=f"An error occurred: {str(e)}",
-                session_id=session_id,
-                status=ConversationStatus.ERROR,
-                next_action="error",
-                metadata={"error": str(e)},
+        except Exception as e:
+            # Unexpected failures: keep the traceback
+            logger.error(
+                "process_message failed for session %s: %r", session_id, e, exc_info=True
             )
+            return self._error_response(session, e)
+
+        finally:
+            # Single session write per turn, on success or error
+            await self._store_session(session, now)
+
+    def _append_message(
+        self,
+        session: ConversationSession,
+        role: MessageRole,
+        role_value: str,
+        content: str,
+        timestamp: int,
+    ) -> None:
+        """
+        Append a message to the session and its serialized history.
+
+        Args:
+            session: Current session
+            role: Message role
+            role_value: Precomputed role.value (_ROLE_USER / _ROLE_ASSISTANT)
+            content: Message text
+            timestamp: Message time (ns since epoch)
+        """
+        session.messages.append(
+            ConversationMessage(role=role, content=content, timestamp=timestamp)
+        )
+        session.history.append({"role": role_value, "content": content})
+
+    def _error_response(
+        self, session: ConversationSession, error: Exception
+    ) -> ConversationResponse:
+        """
+        Mark the session as errored and build the error response.
+
+        Args:
+            session: Current session
+            error: Exception raised while processing the turn
+
+        Returns:
+            ConversationResponse with error status
+        """
+        self._set_status(session, ConversationStatus.ERROR)
+
+        return ConversationResponse(
+            message=f"An error occurred: {str(error)}",
+            session_id=session.session_id,
+            status=ConversationStatus.ERROR,
+            next_action="error",
+            metadata={"error": str(error)},
+        )
+
+    @staticmethod
+    def _recent_history(session: ConversationSession, count: int) -> List[Dict[str, str]]:
+        """
+        Get the last `count` serialized history entries.
+
+        Args:
+            session: Current session
+            count: Maximum number of entries
+
+        Returns:
+            List of role/content dicts, oldest first
+        """
+        history = session.history
+        return list(islice(history, max(len(history) - count, 0), None))
 
     # ============================================
     # INFORMATION EXTRACTION
@@ -285,32 +467,9 @@ class ConversationManager:
             user_message: User's message
             session: Current session
         """
-        # Build context for AI
-        context = {
-            "current_fields": session.filled_fields,
-            "module_id": session.module_id,
-            "conversation_history": [
-                {"role": msg.role.value, "content": msg.content}
-                for msg in session.messages[-5:]  # Last 5 messages for context
-            ],
-        }
-
-        # Get module to understand what fields we're looking for
-        if session.module_id:
-            module = self._module_registry.get_module(session.module_id)
-            if module:
-                field_requirements = module.get_field_requirements()
-                context["field_requirements"] = [
-                    {
-                        "field_name": fr.field_name,
-                        "field_type": fr.field_type,
-                        "description": fr.description,
-                    }
-                    for fr in field_requirements
-                ]
-
         # For now, use simple keyword extraction
-        # In production, this would use AI to intelligently extract fields
+        # In production, this would use AI to intelligently extract fields,
+        # building its context (recent history, field requirements) there
         await self._simple_extract(user_message, session)
 
     async def _simple_extract(
@@ -326,11 +485,14 @@ class ConversationManager:
             user_message: User's message
             session: Current session
         """
-        # Use pattern extractor to get all possible fields
-        extracted = self._pattern_extractor.extract_all(
-            user_message,
-            context={"current_fields": session.filled_fields}
-        )
+        # Nothing to extract from empty or yes/no style replies
+        if _TRIVIAL_MESSAGE_RE.match(user_message):
+            return
+
+        # Use pattern extractor to get all possible fields. Patterns are
+        # case-insensitive and extract_all does not read its context, so
+        # results are memoized on the normalized message text.
+        extracted = dict(self._cached_extract_all(user_message.strip().lower()))
 
         # Log extraction results
         if extracted:
@@ -349,13 +511,13 @@ class ConversationManager:
                 session.filled_fields[field_name] = value
 
         # Special handling for case type combinations
-        # If we detected "default judgment" + "liquidated", combine them
-        if extracted.get("case_type") == "default_judgment" and extracted.get("claim_nature") == "liquidated":
-            logger.info(f"[{session.session_id[:8]}] Combining: default_judgment + liquidated")
-            session.filled_fields["case_type"] = "default_judgment_liquidated"
-        elif extracted.get("case_type") == "default_judgment" and extracted.get("claim_nature") == "unliquidated":
-            logger.info(f"[{session.session_id[:8]}] Combining: default_judgment + unliquidated")
-            session.filled_fields["case_type"] = "default_judgment_unliquidated"
+        # e.g. "default judgment" + "liquidated" -> default_judgment_liquidated
+        case_type = extracted.get("case_type")
+        claim_nature = extracted.get("claim_nature")
+        combined = _CASE_TYPE_COMBOS.get((case_type, claim_nature))
+        if combined:
+            logger.info(f"[{session.session_id[:8]}] Combining: {case_type} + {claim_nature}")
+            session.filled_fields["case_type"] = combined
 
     # ============================================
     # ACTION DETERMINATION
@@ -373,7 +535,7 @@ class ConversationManager:
             return "select_module"
 
         # Get module to check completeness
-        module = self._module_registry.get_module(session.module_id)
+        module = self._get_module(session.module_id)
         if not module:
             return "select_module"
 
@@ -412,7 +574,7 @@ class ConversationManager:
         session.module_confidence = 0.9
 
         # Update status
-        session.status = ConversationStatus.INFORMATION_GATHERING
+        self._set_status(session, ConversationStatus.INFORMATION_GATHERING)
 
         return ConversationResponse(
             message=(
@@ -439,7 +601,7 @@ class ConversationManager:
             ConversationResponse with questions
         """
         # Get module
-        module = self._module_registry.get_module(session.module_id)
+        module = self._get_module(session.module_id)
         if not module:
             return ConversationResponse(
                 message="Unable to find the selected module.",
@@ -448,27 +610,20 @@ class ConversationManager:
                 next_action="restart",
             )
 
-        # Get missing required fields
-        field_requirements = module.get_field_requirements()
-        required_fields = [fr for fr in field_requirements if fr.required]
-
         # Find first missing required field
-        missing_required = [
-            fr
-            for fr in required_fields
-            if fr.field_name not in session.filled_fields
-            or session.filled_fields[fr.field_name] is None
-        ]
-
-        if missing_required:
-            # Ask about first missing required field
-            first_missing = missing_required[0]
-            question_templates = module.get_question_templates()
+        first_missing = next(
+            (
+                fr
+                for fr in self._get_required_fields(session.module_id, module)
+                if session.filled_fields.get(fr.field_name) is None
+            ),
+            None,
+        )
 
+        if first_missing:
             # Find template for this field
-            template = next(
-                (qt for qt in question_templates if qt.field_name == first_missing.field_name),
-                None,
+            template = self._get_template_map(session.module_id, module).get(
+                first_missing.field_name
             )
 
             if template:
@@ -489,23 +644,85 @@ class ConversationManager:
             # All required fields filled, proceed to analysis
             return await self._perform_analysis(session)
 
+    def _get_module(self, module_id: str) -> Optional[Any]:
+        """
+        Get a registered module, remembering it after the first lookup.
+
+        Only found modules are remembered, so a module registered later is
+        still picked up.
+
+        Args:
+            module_id: Module identifier
+
+        Returns:
+            Module instance if registered, None otherwise
+        """
+        module = self._modules_by_id.get(module_id)
+        if module is None:
+            module = self._module_registry.get_module(module_id)
+            if module is not None:
+                self._modules_by_id[module_id] = module
+        return module
+
+    def _get_required_fields(self, module_id: str, module: Any) -> List[FieldRequirement]:
+        """
+        Get the module's required fields, built once per module.
+
+        Args:
+            module_id: Module identifier
+            module: Module instance
+
+        Returns:
+            Required FieldRequirements in module order
+        """
+        required = self._required_fields.get(module_id)
+        if required is None:
+            required = [fr for fr in module.get_field_requirements() if fr.required]
+            self._required_fields[module_id] = required
+        return required
+
+    def _get_template_map(self, module_id: str, module: Any) -> Dict[str, QuestionTemplate]:
+        """
+        Get the module's question templates keyed by field name, built once per module.
+
+        Args:
+            module_id: Module identifier
+            module: Module instance
+
+        Returns:
+            Dictionary of field name to first QuestionTemplate for that field
+        """
+        template_map = self._template_maps.get(module_id)
+        if template_map is None:
+            template_map = {}
+            for qt in module.get_question_templates():
+                template_map.setdefault(qt.field_name, qt)
+            self._template_maps[module_id] = template_map
+        return template_map
+
     async def _perform_analysis(
-        self, session: ConversationSession
+        self,
+        session: ConversationSession,
+        calculation_result: Optional[Dict[str, Any]] = None,
+        rich_explanation: Optional[str] = None,
     ) -> ConversationResponse:
         """
         Perform analysis with current information.
 
         Args:
             session: Current session
+            calculation_result: Calculation already performed this turn from
+                validated fields, if any (validation is then not repeated)
+            rich_explanation: Explanation already generated this turn, if any
 
         Returns:
             ConversationResponse with results
         """
         # Update status
-        session.status = ConversationStatus.ANALYZING
+        self._set_status(session, ConversationStatus.ANALYZING)
 
         # Get module
-        module = self._module_registry.get_module(session.module_id)
+        module = self._get_module(session.module_id)
         if not module:
             return ConversationResponse(
                 message="Unable to find the selected module.",
@@ -514,13 +731,17 @@ class ConversationManager:
                 next_action="restart",
             )
 
-        # Validate fields
-        is_valid, errors = module.validate_fields(session.filled_fields)
+        # Validate fields, unless the hybrid turn already validated them
+        # before calculating
+        is_valid, errors = (
+            (True, []) if calculation_result is not None
+            else module.validate_fields(session.filled_fields)
+        )
         if not is_valid:
             error_msg = "Please provide the following information:\n" + "\n".join(
                 f"- {error}" for error in errors
             )
-            session.status = ConversationStatus.INFORMATION_GATHERING
+            self._set_status(session, ConversationStatus.INFORMATION_GATHERING)
             return ConversationResponse(
                 message=error_msg,
                 session_id=session.session_id,
@@ -531,12 +752,39 @@ class ConversationManager:
             )
 
         # Perform calculation (100% accurate)
-        calculation_result = module.calculate(session.filled_fields)
+        if calculation_result is None:
+            calculation_result = module.calculate(session.filled_fields)
         session.calculation_result = calculation_result
 
-        # Get arguments and recommendations
-        arguments = module.get_arguments(calculation_result, session.filled_fields)
-        recommendations = module.get_recommendations(calculation_result)
+        # ========================================
+        # GENERATE RICH EXPLANATION WITH CITATIONS
+        # ========================================
+        # Start the explanation first so any AI round-trip it makes overlaps
+        # with building arguments and recommendations below
+        explain_task = None
+        if rich_explanation is None:
+            logger.info("Generating rich explanation with legal citations...")
+            explain_task = asyncio.create_task(
+                self._result_explainer.explain_result(
+                    calculation_result=calculation_result,
+                    filled_fields=session.filled_fields,
+                    decision_path=None  # TODO: Pass actual decision path from logic tree
+                )
+            )
+            # Yield once so the task can issue its request before the CPU work
+            await asyncio.sleep(0)
+
+        # Cancelled by hand rather than via asyncio.TaskGroup: a TaskGroup
+        # would wrap errors in an ExceptionGroup and bypass the expected-error
+        # handling in process_message
+        try:
+            # Get arguments and recommendations
+            arguments = module.get_arguments(calculation_result, session.filled_fields)
+            recommendations = module.get_recommendations(calculation_result)
+        except Exception:
+            if explain_task:
+                explain_task.cancel()
+            raise
 
         # Build comprehensive result
         result = {
@@ -546,28 +794,22 @@ class ConversationManager:
         }
         session.analysis_result = result
 
-        # ========================================
-        # GENERATE RICH EXPLANATION WITH CITATIONS
-        # ========================================
-        logger.info("Generating rich explanation with legal citations...")
-        rich_explanation = await self._result_explainer.explain_result(
-            calculation_result=calculation_result,
-            filled_fields=session.filled_fields,
-            decision_path=None  # TODO: Pass actual decision path from logic tree
-        )
-
-        # Use rich explanation as the message
-        message = rich_explanation
+        if explain_task:
+            rich_explanation = await explain_task
 
-        # Append recommendations if available
+        # Rich explanation followed by the top recommendations, if any
+        recommendations_text = ""
         if recommendations:
-            message += "\n\n**RECOMMENDATIONS:**\n"
-            message += "\n".join(f"• {rec}" for rec in recommendations[:3])
-
-        message += "\n\nWould you like more details on any aspect of these costs?"
+            recommendations_text = _RECOMMENDATIONS_HEADER + "\n".join(
+                "• " + str(rec) for rec in recommendations[:MAX_RECOMMENDATIONS_SHOWN]
+            )
+        message = _ANALYSIS_MESSAGE_TEMPLATE.format(
+            explanation=rich_explanation,
+            recommendations=recommendations_text,
+        )
 
         # Update status to complete
-        session.status = ConversationStatus.COMPLETE
+        self._set_status(session, ConversationStatus.COMPLETE)
         self._stats["completed_sessions"] += 1
 
         return ConversationResponse(
@@ -585,9 +827,17 @@ class ConversationManager:
     # ============================================
 
     def get_statistics(self) -> Dict[str, Any]:
-        """Return conversation statistics"""
+        """
+        Return conversation statistics.
+
+        Per-status counts are per process (see _status_counts); only
+        total_sessions_stored is read from the session store.
+        """
         return {
             **self._stats,
-            "active_sessions": len([s for s in self._sessions.values() if s.status == ConversationStatus.ACTIVE]),
+            "active_sessions": max(self._status_counts[ConversationStatus.ACTIVE], 0),
+            "sessions_by_status": {
+                status.value: count for status, count in self._status_counts.items() if count > 0
+            },
             "total_sessions_stored": len(self._sessions),
         }
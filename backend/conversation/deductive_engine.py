@@ -5,7 +5,8 @@ Legal Advisory System v5.0
 Generates intelligent questions to fill information gaps.
 """
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from backend.interfaces import (
     ConversationSession,
@@ -15,6 +16,12 @@ from backend.interfaces import (
 )
 
 
+@lru_cache(maxsize=256)
+def _field_label(field_name: str) -> str:
+    """Lowercase, space-separated label for a field name (e.g. "claim amount")."""
+    return field_name.replace("_", " ").lower()
+
+
 class QuestioningStrategy:
     """Base class for questioning strategies"""
 
@@ -74,6 +81,11 @@ class RapidCompletionStrategy(QuestioningStrategy):
         return required + optional
 
 
+# Built-in strategies: each keeps every gap and orders it only by its
+# field_name, field_type and required flag, so their orders can be cached
+_CACHEABLE_STRATEGIES = (HighImpactStrategy, UserFriendlyStrategy, RapidCompletionStrategy)
+
+
 class DeductiveQuestioningEngine:
     """
     Generates intelligent questions to fill information gaps.
@@ -91,6 +103,13 @@ class DeductiveQuestioningEngine:
         }
         self.default_strategy = "user_friendly"
 
+        # Strategy order of a requirement set, as indexes into it, keyed by
+        # strategy object and the (field_name, field_type, required) of each
+        # requirement, which is all the built-in strategies sort on
+        self._order_cache: Dict[
+            Tuple[QuestioningStrategy, Tuple[Tuple[str, str, bool], ...]], Tuple[int, ...]
+        ] = {}
+
         # Statistics
         self._stats = {
             "total_questions_generated": 0,
@@ -112,25 +131,35 @@ class DeductiveQuestioningEngine:
         Returns:
             List of InfoGap objects representing missing information
         """
-        gaps = []
-
-        for req in field_requirements:
-            field_value = filled_fields.get(req.field_name)
-
-            # Check if field is missing or None
-            if field_value is None:
-                gap = InfoGap(
-                    field_name=req.field_name,
-                    field_type=req.field_type,
-                    description=req.description,
-                    priority=1 if req.required else 0,
-                    required=req.required,
-                    current_value=None,
-                    validation_rules=req.validation_rules or {},
-                )
-                gaps.append(gap)
-
-        return gaps
+        get_value = filled_fields.get
+
+        # A field is missing when absent or None
+        return [
+            self._gap_for(req)
+            for req in field_requirements
+            if get_value(req.field_name) is None
+        ]
+
+    @staticmethod
+    def _gap_for(req: FieldRequirement) -> InfoGap:
+        """
+        Build the gap for a missing required field.
+
+        Args:
+            req: Field requirement
+
+        Returns:
+            New InfoGap for the field
+        """
+        return InfoGap(
+            field_name=req.field_name,
+            field_type=req.field_type,
+            description=req.description,
+            priority=1 if req.required else 0,
+            required=req.required,
+            current_value=None,
+            validation_rules=req.validation_rules or {},
+        )
 
     def generate_question(
         self,
@@ -151,30 +180,20 @@ class DeductiveQuestioningEngine:
         Returns:
             Question string, or None if no more questions needed
         """
-        # Analyze gaps
-        gaps = self.analyze_gaps(session.filled_fields, field_requirements)
-
-        if not gaps:
-            return None  # No gaps, no questions needed
-
         # Select strategy
-        strategy_name = strategy_name or self.default_strategy
-        strategy = self.strategies.get(strategy_name, self.strategies[self.default_strategy])
+        strategy_name = self._resolve_strategy_name(strategy_name)
 
-        # Prioritize gaps
-        prioritized_gaps = strategy.prioritize_gaps(gaps)
+        # Missing fields in priority order
+        prioritized_gaps = self._prioritized_gaps(session, field_requirements, strategy_name)
 
         if not prioritized_gaps:
-            return None
+            return None  # No gaps, no questions needed
 
         # Get first gap
         first_gap = prioritized_gaps[0]
 
         # Find matching template
-        template = next(
-            (qt for qt in question_templates if qt.field_name == first_gap.field_name),
-            None,
-        )
+        template = self._template_map(question_templates).get(first_gap.field_name)
 
         if template:
             question = template.template
@@ -184,8 +203,7 @@ class DeductiveQuestioningEngine:
 
         # Update statistics
         self._stats["total_questions_generated"] += 1
-        actual_strategy_used = strategy_name if strategy_name in self.strategies else self.default_strategy
-        self._stats["strategy_usage"][actual_strategy_used] += 1
+        self._stats["strategy_usage"][strategy_name] += 1
 
         return question
 
@@ -210,27 +228,21 @@ class DeductiveQuestioningEngine:
         Returns:
             List of question strings
         """
-        # Analyze gaps
-        gaps = self.analyze_gaps(session.filled_fields, field_requirements)
-
-        if not gaps:
-            return []
-
         # Select strategy
-        strategy_name = strategy_name or self.default_strategy
-        strategy = self.strategies.get(strategy_name, self.strategies[self.default_strategy])
+        strategy_name = self._resolve_strategy_name(strategy_name)
 
-        # Prioritize gaps
-        prioritized_gaps = strategy.prioritize_gaps(gaps)
+        # Missing fields in priority order
+        prioritized_gaps = self._prioritized_gaps(session, field_requirements, strategy_name)
+
+        if not prioritized_gaps:
+            return []
 
         # Generate questions for top gaps
+        template_map = self._template_map(question_templates)
         questions = []
         for gap in prioritized_gaps[:max_questions]:
             # Find matching template
-            template = next(
-                (qt for qt in question_templates if qt.field_name == gap.field_name),
-                None,
-            )
+            template = template_map.get(gap.field_name)
 
             if template:
                 question = template.template
@@ -243,11 +255,93 @@ class DeductiveQuestioningEngine:
             self._stats["total_questions_generated"] += 1
 
         if questions:
-            actual_strategy_used = strategy_name if strategy_name in self.strategies else self.default_strategy
-            self._stats["strategy_usage"][actual_strategy_used] += 1
+            self._stats["strategy_usage"][strategy_name] += 1
 
         return questions
 
+    def _resolve_strategy_name(self, strategy_name: Optional[str]) -> str:
+        """
+        Resolve the strategy to use, falling back to the default.
+
+        Args:
+            strategy_name: Requested strategy name, if any
+
+        Returns:
+            Name of a registered strategy
+        """
+        if strategy_name in self.strategies:
+            return strategy_name
+        return self.default_strategy
+
+    def _prioritized_gaps(
+        self,
+        session: ConversationSession,
+        field_requirements: List[FieldRequirement],
+        strategy_name: str,
+    ) -> List[InfoGap]:
+        """
+        Get the session's missing fields in strategy order.
+
+        The built-in strategies sort stably, so ordering every field of a
+        requirement set once and filtering to the missing ones gives the
+        same order as prioritizing the gaps on each call. Only the order is
+        cached; each call builds new gaps from the requirements passed in.
+        Any other strategy is asked to prioritize the gaps on every call.
+
+        Args:
+            session: Current conversation session
+            field_requirements: Field requirements from module
+            strategy_name: Registered strategy name
+
+        Returns:
+            Prioritized list of gaps
+        """
+        strategy = self.strategies[strategy_name]
+        if type(strategy) not in _CACHEABLE_STRATEGIES:
+            return strategy.prioritize_gaps(
+                self.analyze_gaps(session.filled_fields, field_requirements)
+            )
+
+        signature = tuple(
+            (req.field_name, req.field_type, req.required) for req in field_requirements
+        )
+        key = (strategy, signature)
+        order = self._order_cache.get(key)
+        if order is None:
+            gaps = self.analyze_gaps({}, field_requirements)
+            position = {id(gap): i for i, gap in enumerate(gaps)}
+            order = tuple(position[id(gap)] for gap in strategy.prioritize_gaps(gaps))
+            self._order_cache[key] = order
+
+        get_value = session.filled_fields.get
+        return [
+            self._gap_for(req)
+            for req in (field_requirements[i] for i in order)
+            if get_value(req.field_name) is None
+        ]
+
+    @staticmethod
+    def _template_map(question_templates: List[QuestionTemplate]) -> Dict[str, QuestionTemplate]:
+        """
+        Map field names to the templates passed in.
+
+        The first template for a field wins, as with a linear scan.
+
+        Args:
+            question_templates: Question templates from module
+
+        Returns:
+            Dictionary of field_name -> QuestionTemplate
+        """
+        template_map: Dict[str, QuestionTemplate] = {}
+        for qt in question_templates:
+            template_map.setdefault(qt.field_name, qt)
+        return template_map
+
+    def clear_module_cache(self) -> None:
+        """Forget cached field orderings"""
+        self._order_cache.clear()
+
     def _generate_fallback_question(self, gap: InfoGap) -> str:
         """
         Generate a fallback question when no template exists.
@@ -258,18 +352,18 @@ class DeductiveQuestioningEngine:
         Returns:
             Generated question string
         """
-        field_name_formatted = gap.field_name.replace("_", " ").title()
+        label = _field_label(gap.field_name)
 
         if gap.field_type == "enum":
-            return f"What is the {field_name_formatted.lower()}?"
+            return f"What is the {label}?"
         elif gap.field_type == "number":
-            return f"Please provide the {field_name_formatted.lower()}."
+            return f"Please provide the {label}."
         elif gap.field_type == "string":
-            return f"Could you specify the {field_name_formatted.lower()}?"
+            return f"Could you specify the {label}?"
         elif gap.field_type == "date":
-            return f"What is the {field_name_formatted.lower()}?"
+            return f"What is the {label}?"
         else:
-            return f"Please provide information about {field_name_formatted.lower()}."
+            return f"Please provide information about {label}."
 
     def set_default_strategy(self, strategy_name: str) -> bool:
         """
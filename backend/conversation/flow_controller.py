@@ -6,7 +6,7 @@ Manages conversation state transitions and flow patterns.
 """
 
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional
 
 from backend.interfaces import ConversationSession, ConversationStatus
 
@@ -38,6 +38,38 @@ class FlowAction(Enum):
     HANDLE_ERROR = "handle_error"
 
 
+# Session status set on entering a flow state; other states map to ACTIVE
+_TO_STATE_STATUS = {
+    FlowState.INFORMATION_GATHERING: ConversationStatus.INFORMATION_GATHERING,
+    FlowState.ANALYSIS: ConversationStatus.ANALYZING,
+    FlowState.COMPLETE: ConversationStatus.COMPLETE,
+    FlowState.ERROR: ConversationStatus.ERROR,
+}
+
+# Next state for actions whose target does not depend on the session
+_ACTION_NEXT_STATE = {
+    FlowAction.HANDLE_ERROR: FlowState.ERROR,
+    FlowAction.START_CONVERSATION: FlowState.GREETING,
+    FlowAction.SELECT_MODULE: FlowState.MODULE_SELECTION,
+    FlowAction.REQUEST_ANALYSIS: FlowState.ANALYSIS,
+    FlowAction.PRESENT_RESULTS: FlowState.RESULTS_PRESENTATION,
+    FlowAction.ASK_FOLLOW_UP: FlowState.FOLLOW_UP,
+    FlowAction.END_CONVERSATION: FlowState.COMPLETE,
+}
+
+# Recommended action per state; INFORMATION_GATHERING depends on completeness
+_RECOMMENDED_ACTION = {
+    FlowState.INITIAL: "start_conversation",
+    FlowState.GREETING: "select_module",
+    FlowState.MODULE_SELECTION: "gather_information",
+    FlowState.ANALYSIS: "present_results",
+    FlowState.RESULTS_PRESENTATION: "ask_follow_up",
+    FlowState.FOLLOW_UP: "complete_or_continue",
+    FlowState.COMPLETE: "end",
+    FlowState.ERROR: "recover",
+}
+
+
 class ConversationFlowController:
     """
     Manages conversation flow and state transitions.
@@ -49,25 +81,27 @@ class ConversationFlowController:
     def __init__(self):
         """Initialize flow controller"""
         # Define valid state transitions
-        self._transitions = {
-            FlowState.INITIAL: [FlowState.GREETING, FlowState.ERROR],
-            FlowState.GREETING: [FlowState.MODULE_SELECTION, FlowState.ERROR],
-            FlowState.MODULE_SELECTION: [FlowState.INFORMATION_GATHERING, FlowState.ERROR],
-            FlowState.INFORMATION_GATHERING: [
+        self._transitions: Dict[FlowState, FrozenSet[FlowState]] = {
+            FlowState.INITIAL: frozenset({FlowState.GREETING, FlowState.ERROR}),
+            FlowState.GREETING: frozenset({FlowState.MODULE_SELECTION, FlowState.ERROR}),
+            FlowState.MODULE_SELECTION: frozenset({FlowState.INFORMATION_GATHERING, FlowState.ERROR}),
+            FlowState.INFORMATION_GATHERING: frozenset({
                 FlowState.INFORMATION_GATHERING,  # Stay in same state for more questions
                 FlowState.ANALYSIS,
                 FlowState.ERROR,
-            ],
-            FlowState.ANALYSIS: [FlowState.RESULTS_PRESENTATION, FlowState.ERROR],
-            FlowState.RESULTS_PRESENTATION: [FlowState.FOLLOW_UP, FlowState.COMPLETE, FlowState.ERROR],
-            FlowState.FOLLOW_UP: [
+            }),
+            FlowState.ANALYSIS: frozenset({FlowState.RESULTS_PRESENTATION, FlowState.ERROR}),
+            FlowState.RESULTS_PRESENTATION: frozenset(
+                {FlowState.FOLLOW_UP, FlowState.COMPLETE, FlowState.ERROR}
+            ),
+            FlowState.FOLLOW_UP: frozenset({
                 FlowState.INFORMATION_GATHERING,  # User wants to modify
                 FlowState.ANALYSIS,  # Reanalyze
                 FlowState.COMPLETE,  # Done
                 FlowState.ERROR,
-            ],
-            FlowState.COMPLETE: [FlowState.INITIAL],  # Can start new conversation
-            FlowState.ERROR: [FlowState.INITIAL, FlowState.ERROR],  # Can recover or fail again
+            }),
+            FlowState.COMPLETE: frozenset({FlowState.INITIAL}),  # Can start new conversation
+            FlowState.ERROR: frozenset({FlowState.INITIAL, FlowState.ERROR}),  # Can recover or fail again
         }
 
         # Statistics
@@ -90,9 +124,9 @@ class ConversationFlowController:
         # Map ConversationStatus to FlowState
         status = session.status
 
-        if status == ConversationStatus.ACTIVE:
+        if status is ConversationStatus.ACTIVE:
             if not session.module_id:
-                if len(session.messages) == 0:
+                if not session.messages:
                     return FlowState.INITIAL
                 return FlowState.GREETING
             elif session.completeness_score < 0.6:
@@ -100,18 +134,18 @@ class ConversationFlowController:
             else:
                 return FlowState.ANALYSIS
 
-        elif status == ConversationStatus.INFORMATION_GATHERING:
+        elif status is ConversationStatus.INFORMATION_GATHERING:
             return FlowState.INFORMATION_GATHERING
 
-        elif status == ConversationStatus.ANALYZING:
+        elif status is ConversationStatus.ANALYZING:
             return FlowState.ANALYSIS
 
-        elif status == ConversationStatus.COMPLETE:
+        elif status is ConversationStatus.COMPLETE:
             if session.analysis_result:
                 return FlowState.RESULTS_PRESENTATION
             return FlowState.COMPLETE
 
-        elif status == ConversationStatus.ERROR:
+        elif status is ConversationStatus.ERROR:
             return FlowState.ERROR
 
         return FlowState.INITIAL
@@ -133,37 +167,14 @@ class ConversationFlowController:
         Returns:
             Next FlowState
         """
-        # Handle error action
-        if action == FlowAction.HANDLE_ERROR:
-            return FlowState.ERROR
-
-        # Handle specific actions
-        if action == FlowAction.START_CONVERSATION:
-            return FlowState.GREETING
-
-        elif action == FlowAction.SELECT_MODULE:
-            return FlowState.MODULE_SELECTION
-
-        elif action == FlowAction.PROVIDE_INFORMATION:
-            # Check if we have enough information
+        # Next state depends on how much information has been gathered
+        if action is FlowAction.PROVIDE_INFORMATION:
             if session.completeness_score >= 0.6:
                 return FlowState.ANALYSIS
             return FlowState.INFORMATION_GATHERING
 
-        elif action == FlowAction.REQUEST_ANALYSIS:
-            return FlowState.ANALYSIS
-
-        elif action == FlowAction.PRESENT_RESULTS:
-            return FlowState.RESULTS_PRESENTATION
-
-        elif action == FlowAction.ASK_FOLLOW_UP:
-            return FlowState.FOLLOW_UP
-
-        elif action == FlowAction.END_CONVERSATION:
-            return FlowState.COMPLETE
-
-        # Default: stay in current state
-        return current_state
+        # Other actions have a fixed target; default: stay in current state
+        return _ACTION_NEXT_STATE.get(action, current_state)
 
     def can_transition(self, from_state: FlowState, to_state: FlowState) -> bool:
         """
@@ -176,7 +187,7 @@ class ConversationFlowController:
         Returns:
             True if transition is valid
         """
-        valid_transitions = self._transitions.get(from_state, [])
+        valid_transitions = self._transitions.get(from_state, frozenset())
         return to_state in valid_transitions
 
     def transition(
@@ -203,16 +214,7 @@ class ConversationFlowController:
             return False
 
         # Update session status based on new state
-        if to_state == FlowState.INFORMATION_GATHERING:
-            session.status = ConversationStatus.INFORMATION_GATHERING
-        elif to_state == FlowState.ANALYSIS:
-            session.status = ConversationStatus.ANALYZING
-        elif to_state == FlowState.COMPLETE:
-            session.status = ConversationStatus.COMPLETE
-        elif to_state == FlowState.ERROR:
-            session.status = ConversationStatus.ERROR
-        else:
-            session.status = ConversationStatus.ACTIVE
+        session.status = _TO_STATE_STATUS.get(to_state, ConversationStatus.ACTIVE)
 
         # Update statistics
         self._stats["total_transitions"] += 1
@@ -277,28 +279,12 @@ class ConversationFlowController:
         """
         current_state = self.get_current_state(session)
 
-        if current_state == FlowState.INITIAL:
-            return "start_conversation"
-        elif current_state == FlowState.GREETING:
-            return "select_module"
-        elif current_state == FlowState.MODULE_SELECTION:
-            return "gather_information"
-        elif current_state == FlowState.INFORMATION_GATHERING:
+        if current_state is FlowState.INFORMATION_GATHERING:
             if session.completeness_score >= 0.6:
                 return "analyze"
             return "ask_question"
-        elif current_state == FlowState.ANALYSIS:
-            return "present_results"
-        elif current_state == FlowState.RESULTS_PRESENTATION:
-            return "ask_follow_up"
-        elif current_state == FlowState.FOLLOW_UP:
-            return "complete_or_continue"
-        elif current_state == FlowState.COMPLETE:
-            return "end"
-        elif current_state == FlowState.ERROR:
-            return "recover"
-
-        return "unknown"
+
+        return _RECOMMENDED_ACTION.get(current_state, "unknown")
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get flow controller statistics"""
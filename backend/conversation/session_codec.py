@@ -0,0 +1,230 @@
+"""
+Session Codec
+Legal Advisory System v5.0
+
+Serializes conversation sessions to and from JSON bytes for persistence.
+Uses orjson when installed and falls back to the standard library json.
+Decimal, datetime and date values are written as type-tagged objects
+and restored on load, identically on both backends; any other value
+JSON cannot represent raises TypeError rather than being stringified.
+Caller dicts that happen to use the tag key are wrapped on write, so they
+load back unchanged.
+
+Sessions stay plain slotted dataclasses rather than msgspec Structs:
+they carry no validation cost, and msgspec cannot encode the bounded
+deques natively, so flattening to a dict and encoding with orjson is
+both correct and faster.
+"""
+
+import json
+from collections import deque
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict
+
+from backend.interfaces import (
+    ConversationMessage,
+    ConversationSession,
+    ConversationStatus,
+    MessageRole,
+)
+from backend.interfaces.data_structures import MAX_SESSION_MESSAGES
+
+# Try to import orjson, but keep it optional
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Key marking a type-tagged value, e.g. {"__type__": "decimal", "value": "1.50"}.
+# Caller dicts that contain the key are wrapped as {"__type__": "dict", ...}
+# so they are never mistaken for a tag on load.
+_TYPE_KEY = "__type__"
+_DICT_TAG = "dict"
+
+_DECODERS: Dict[str, Callable[[str], Any]] = {
+    "decimal": Decimal,
+    "datetime": datetime.fromisoformat,
+    "date": date.fromisoformat,
+}
+
+
+def _default(value: Any) -> Any:
+    """
+    Encode values JSON does not handle natively as type-tagged objects.
+
+    Args:
+        value: Value the JSON encoder could not serialize
+
+    Returns:
+        Tagged dictionary restored by _decode
+
+    Raises:
+        TypeError: If the value's type is not supported
+    """
+    if isinstance(value, Decimal):
+        return {_TYPE_KEY: "decimal", "value": str(value)}
+    # datetime is a subclass of date, so it is checked first
+    if isinstance(value, datetime):
+        return {_TYPE_KEY: "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {_TYPE_KEY: "date", "value": value.isoformat()}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _escape(value: Any) -> Any:
+    """
+    Wrap caller dicts that use _TYPE_KEY so only _default's tags are decoded.
+
+    Args:
+        value: Caller-supplied value
+
+    Returns:
+        Value with every dict containing _TYPE_KEY wrapped in a dict tag
+    """
+    if isinstance(value, dict):
+        escaped = {key: _escape(item) for key, item in value.items()}
+        if _TYPE_KEY in value:
+            return {_TYPE_KEY: _DICT_TAG, "value": escaped}
+        return escaped
+    if isinstance(value, (list, tuple)):
+        return [_escape(item) for item in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """
+    Restore type-tagged values written by _default.
+
+    Args:
+        value: Decoded JSON value
+
+    Returns:
+        Value with tagged objects replaced by Decimal/datetime/date and
+        wrapped caller dicts unwrapped
+    """
+    if isinstance(value, dict):
+        if len(value) == 2 and _TYPE_KEY in value:
+            tag = value[_TYPE_KEY]
+            if tag == _DICT_TAG:
+                return {key: _decode(item) for key, item in value["value"].items()}
+            decoder = _DECODERS.get(tag)
+            if decoder is not None:
+                return decoder(value["value"])
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+def session_to_dict(session: ConversationSession) -> Dict[str, Any]:
+    """
+    Convert a session to a JSON-compatible dictionary.
+
+    Args:
+        session: Session to convert
+
+    Returns:
+        Dictionary with enums replaced by their values
+    """
+    return {
+        "session_id": session.session_id,
+        "user_id": session.user_id,
+        "created_at": session.created_at,
+        "updated_at": session.updated_at,
+        "status": session.status.value,
+        "module_id": session.module_id,
+        "module_confidence": session.module_confidence,
+        "filled_fields": _escape(session.filled_fields),
+        "completeness_score": session.completeness_score,
+        "missing_fields": session.missing_fields,
+        "messages": [
+            {
+                "role": msg.role.value,
+                "content": msg.content,
+                "timestamp": msg.timestamp,
+                "metadata": _escape(msg.metadata),
+            }
+            for msg in session.messages
+        ],
+        "history": list(session.history),
+        "analysis_result": _escape(session.analysis_result),
+        "calculation_result": _escape(session.calculation_result),
+        "metadata": _escape(session.metadata),
+    }
+
+
+def session_from_dict(data: Dict[str, Any]) -> ConversationSession:
+    """
+    Rebuild a session from a dictionary produced by session_to_dict.
+
+    Args:
+        data: Session dictionary
+
+    Returns:
+        ConversationSession
+    """
+    fields = dict(data)
+    fields["status"] = ConversationStatus(fields["status"])
+    # Only these fields can hold caller-supplied values
+    for name in ("filled_fields", "analysis_result", "calculation_result", "metadata"):
+        if fields.get(name) is not None:
+            fields[name] = _decode(fields[name])
+    fields["messages"] = deque(
+        (
+            ConversationMessage(
+                role=MessageRole(msg["role"]),
+                content=msg["content"],
+                timestamp=msg["timestamp"],
+                metadata=_decode(msg.get("metadata", {})),
+            )
+            for msg in fields.get("messages", [])
+        ),
+        maxlen=MAX_SESSION_MESSAGES,
+    )
+    fields["history"] = deque(fields.get("history", []), maxlen=MAX_SESSION_MESSAGES)
+    return ConversationSession(**fields)
+
+
+def dumps_session(session: ConversationSession) -> bytes:
+    """
+    Serialize a session to JSON bytes.
+
+    Args:
+        session: Session to serialize
+
+    Returns:
+        UTF-8 encoded JSON
+
+    Raises:
+        TypeError: If the session holds a value that cannot be encoded
+    """
+    data = session_to_dict(session)
+    if ORJSON_AVAILABLE:
+        # Datetimes are passed through to _default so both backends tag them the same way
+        return orjson.dumps(
+            data,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+    return json.dumps(data, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+def loads_session(payload: bytes) -> ConversationSession:
+    """
+    Deserialize a session from JSON bytes.
+
+    Args:
+        payload: JSON produced by dumps_session
+
+    Returns:
+        ConversationSession
+    """
+    if ORJSON_AVAILABLE:
+        data = orjson.loads(payload)
+    else:
+        data = json.loads(payload)
+    return session_from_dict(data)
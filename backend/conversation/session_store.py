@@ -0,0 +1,301 @@
+"""
+Session Store
+Legal Advisory System v5.0
+
+Storage backends for conversation sessions. The in-memory store is the
+default; the Redis store lets several workers share sessions and expires
+idle sessions with a TTL.
+"""
+
+import time
+from collections import OrderedDict, defaultdict
+from typing import Callable, Dict, Iterator, List, Optional, Protocol, Union
+
+from backend.conversation.session_codec import dumps_session, loads_session
+from backend.interfaces import ConversationSession
+
+# Try to import redis, but keep it optional
+try:
+    import redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+# Sessions kept by the in-memory store before the least recently used is evicted
+MAX_STORED_SESSIONS = 10_000
+
+
+class SessionStore(Protocol):
+    """Interface for conversation session storage."""
+
+    # True when calls do network I/O, so async callers should run them in a thread
+    blocking: bool
+
+    def get(self, session_id: str) -> Optional[ConversationSession]:
+        """Return the session, or None if it does not exist."""
+        ...
+
+    def set(self, session: ConversationSession) -> None:
+        """Insert or replace a session."""
+        ...
+
+    def delete(self, session_id: str) -> None:
+        """Remove a session if present."""
+        ...
+
+    def scan(self, user_id: Optional[str] = None) -> List[ConversationSession]:
+        """Return all sessions, or only those belonging to user_id."""
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+
+class InMemorySessionStore:
+    """
+    Process-local session store with least-recently-used eviction.
+
+    Keeps a per-user index of session IDs so listing a user's sessions
+    does not walk every stored session. Once max_sessions is reached,
+    storing a new session evicts the one least recently read or written;
+    on_evict can persist it elsewhere.
+    """
+
+    blocking = False
+
+    def __init__(
+        self,
+        max_sessions: int = MAX_STORED_SESSIONS,
+        on_evict: Optional[Callable[[ConversationSession], None]] = None,
+    ):
+        """
+        Initialize in-memory session store.
+
+        Args:
+            max_sessions: Maximum number of sessions kept
+            on_evict: Called with each evicted session
+        """
+        self._sessions: "OrderedDict[str, ConversationSession]" = OrderedDict()
+        # Session IDs per user, in creation order
+        self._user_index: Dict[str, List[str]] = defaultdict(list)
+        self._max_sessions = max_sessions
+        self._on_evict = on_evict
+
+    def get(self, session_id: str) -> Optional[ConversationSession]:
+        """
+        Retrieve a session, marking it as recently used.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            ConversationSession if stored, None otherwise
+        """
+        session = self._sessions.get(session_id)
+        if session is not None:
+            self._sessions.move_to_end(session_id)
+        return session
+
+    def set(self, session: ConversationSession) -> None:
+        """
+        Store a session, evicting the least recently used one if full.
+
+        Args:
+            session: Session to store
+        """
+        session_id = session.session_id
+        if session_id in self._sessions:
+            self._sessions.move_to_end(session_id)
+        else:
+            self._user_index[session.user_id].append(session_id)
+        self._sessions[session_id] = session
+
+        while len(self._sessions) > self._max_sessions:
+            _, evicted = self._sessions.popitem(last=False)
+            self._remove_from_index(evicted)
+            if self._on_evict is not None:
+                self._on_evict(evicted)
+
+    def delete(self, session_id: str) -> None:
+        """
+        Remove a session.
+
+        Args:
+            session_id: Session identifier
+        """
+        session = self._sessions.pop(session_id, None)
+        if session is not None:
+            self._remove_from_index(session)
+
+    def _remove_from_index(self, session: ConversationSession) -> None:
+        """Drop a session from its user's index."""
+        session_ids = self._user_index[session.user_id]
+        session_ids.remove(session.session_id)
+        if not session_ids:
+            del self._user_index[session.user_id]
+
+    def scan(self, user_id: Optional[str] = None) -> List[ConversationSession]:
+        """
+        List sessions, optionally filtered by user.
+
+        Args:
+            user_id: Optional user ID to filter by
+
+        Returns:
+            List of ConversationSession objects
+        """
+        if user_id:
+            return [self._sessions[sid] for sid in self._user_index.get(user_id, ())]
+        return list(self._sessions.values())
+
+    def __setitem__(self, session_id: str, session: ConversationSession) -> None:
+        self.set(session)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sessions)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+class RedisSessionStore:
+    """
+    Redis-backed session store.
+
+    Sessions are stored as JSON under ``session:{id}`` with SETEX so idle
+    sessions expire. Each user's session IDs are kept in the set
+    ``user:{uid}:sessions`` so listing never scans the keyspace; the set
+    expires with the user's latest write and dead IDs are pruned when
+    listed. The sorted set ``sessions:expiry`` scores every session ID by
+    its expiry time, so counting and listing live sessions are index
+    lookups rather than keyspace scans. ``session:{id}:user`` holds the
+    owner's user ID with the same TTL, so deleting a session does not
+    have to load it.
+
+    The client is synchronous; ``blocking`` tells async callers to run
+    store calls in a worker thread.
+    """
+
+    blocking = True
+
+    _EXPIRY_KEY = "sessions:expiry"
+
+    def __init__(self, client: "redis.Redis", ttl_seconds: int = 3600):
+        """
+        Initialize Redis session store.
+
+        Args:
+            client: Synchronous redis client
+            ttl_seconds: Expiry applied on every write
+        """
+        if not REDIS_AVAILABLE:
+            raise ImportError("redis package not installed. Install with: pip install redis")
+        self._client = client
+        self._ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _session_key(session_id: str) -> str:
+        return f"session:{session_id}"
+
+    @staticmethod
+    def _owner_key(session_id: str) -> str:
+        return f"session:{session_id}:user"
+
+    @staticmethod
+    def _user_key(user_id: str) -> str:
+        return f"user:{user_id}:sessions"
+
+    @staticmethod
+    def _decode_id(session_id: Union[bytes, str]) -> str:
+        return session_id.decode() if isinstance(session_id, bytes) else session_id
+
+    def get(self, session_id: str) -> Optional[ConversationSession]:
+        """
+        Retrieve a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            ConversationSession if stored and not expired, None otherwise
+        """
+        payload = self._client.get(self._session_key(session_id))
+        if payload is None:
+            return None
+        return loads_session(payload)
+
+    def set(self, session: ConversationSession) -> None:
+        """
+        Store a session and refresh its expiry.
+
+        Args:
+            session: Session to store
+        """
+        now = time.time()
+        user_key = self._user_key(session.user_id)
+        pipe = self._client.pipeline()
+        pipe.setex(
+            self._session_key(session.session_id),
+            self._ttl_seconds,
+            dumps_session(session),
+        )
+        pipe.setex(self._owner_key(session.session_id), self._ttl_seconds, session.user_id)
+        pipe.sadd(user_key, session.session_id)
+        pipe.expire(user_key, self._ttl_seconds)
+        pipe.zadd(self._EXPIRY_KEY, {session.session_id: now + self._ttl_seconds})
+        # Drop index entries of sessions that have since expired
+        pipe.zremrangebyscore(self._EXPIRY_KEY, "-inf", now)
+        pipe.execute()
+
+    def delete(self, session_id: str) -> None:
+        """
+        Remove a session.
+
+        Args:
+            session_id: Session identifier
+        """
+        user_id = self._client.get(self._owner_key(session_id))
+        if user_id is None:
+            return
+        pipe = self._client.pipeline()
+        pipe.delete(self._session_key(session_id), self._owner_key(session_id))
+        pipe.srem(self._user_key(self._decode_id(user_id)), session_id)
+        pipe.zrem(self._EXPIRY_KEY, session_id)
+        pipe.execute()
+
+    def scan(self, user_id: Optional[str] = None) -> List[ConversationSession]:
+        """
+        List sessions, optionally filtered by user.
+
+        IDs whose session has expired are removed from the user's set.
+
+        Args:
+            user_id: Optional user ID to filter by
+
+        Returns:
+            List of ConversationSession objects (expired sessions are skipped)
+        """
+        if user_id:
+            session_ids = [
+                self._decode_id(sid) for sid in self._client.smembers(self._user_key(user_id))
+            ]
+        else:
+            session_ids = [
+                self._decode_id(sid)
+                for sid in self._client.zrangebyscore(self._EXPIRY_KEY, time.time(), "+inf")
+            ]
+        if not session_ids:
+            return []
+
+        payloads = self._client.mget([self._session_key(sid) for sid in session_ids])
+        dead_ids = [sid for sid, payload in zip(session_ids, payloads) if payload is None]
+        if user_id and dead_ids:
+            self._client.srem(self._user_key(user_id), *dead_ids)
+        return [loads_session(payload) for payload in payloads if payload is not None]
+
+    def __len__(self) -> int:
+        return self._client.zcount(self._EXPIRY_KEY, time.time(), "+inf")
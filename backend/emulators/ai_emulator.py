@@ -5,16 +5,21 @@ Provides deterministic AI responses without making actual API calls.
 """
 
 import asyncio
+import re
 from typing import Dict, Optional
 from dataclasses import dataclass
 from backend.interfaces.ai_service import IAIService
 from backend.interfaces.data_structures import AIRequest, AIResponse, AIProvider
 
+# Prompts mentioning these words (any case) get the legal analysis template
+_LEGAL_KEYWORD_RE = re.compile(r"legal|law", re.IGNORECASE)
+
 
 @dataclass
 class AIEmulatorConfig:
     """Configuration for AI emulator behavior"""
-    simulate_latency: bool = True
+    # Off by default so bulk tests do not pay a sleep per call
+    simulate_latency: bool = False
     latency_ms: int = 50
     deterministic: bool = True
     response_templates: Optional[Dict[str, str]] = None
@@ -34,6 +39,10 @@ class AIEmulator(IAIService):
             "question": "To better assist you, could you please provide: [DETERMINISTIC_QUESTION]",
             "default": "This is a deterministic AI response for testing purposes."
         }
+        # Responses are always one of the templates, so count their tokens once
+        self._template_tokens = {
+            template: len(template.split()) for template in self._templates.values()
+        }
     
     @property
     def model_name(self) -> str:
@@ -48,7 +57,7 @@ class AIEmulator(IAIService):
     async def generate(self, request: AIRequest) -> AIResponse:
         """Generate a deterministic AI response"""
         # Simulate latency
-        if self.config.simulate_latency:
+        if self.config.simulate_latency and self.config.latency_ms > 0:
             await asyncio.sleep(self.config.latency_ms / 1000.0)
         
         self._call_count += 1
@@ -58,7 +67,9 @@ class AIEmulator(IAIService):
         
         # Calculate token usage
         prompt_tokens = len(request.prompt.split())
-        completion_tokens = len(response_content.split())
+        completion_tokens = self._template_tokens.get(response_content)
+        if completion_tokens is None:
+            completion_tokens = len(response_content.split())
         total_tokens = prompt_tokens + completion_tokens
         
         return AIResponse(
@@ -75,10 +86,8 @@ class AIEmulator(IAIService):
     
     def _generate_response(self, prompt: str) -> str:
         """Generate deterministic response based on prompt"""
-        prompt_lower = prompt.lower()
-        
         # Pattern matching for different types of queries
-        if "legal" in prompt_lower or "law" in prompt_lower:
+        if _LEGAL_KEYWORD_RE.search(prompt):
             return self._templates["legal_analysis"]
         elif "?" in prompt:
             return self._templates["question"]
@@ -10,9 +10,59 @@ Useful for:
 """
 
 import re
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from datetime import datetime
 
+# Query patterns, compiled once rather than on every execute() call
+_SELECT_FROM_RE = re.compile(r'FROM\s+(\w+)', re.IGNORECASE)
+_WHERE_RE = re.compile(r'WHERE\s+(.+)', re.IGNORECASE)
+_FIELD_EQ_Q_RE = re.compile(r'(\w+)\s*=\s*\?')
+_INSERT_INTO_RE = re.compile(r'INSERT\s+INTO\s+(\w+)', re.IGNORECASE)
+_COLS_VALUES_RE = re.compile(r'\(([^)]+)\)\s+VALUES', re.IGNORECASE)
+_UPDATE_RE = re.compile(r'UPDATE\s+(\w+)', re.IGNORECASE)
+_SET_RE = re.compile(r'SET\s+(\w+)\s*=\s*\?', re.IGNORECASE)
+_WHERE_FIELD_EQ_Q_RE = re.compile(r'WHERE\s+(\w+)\s*=\s*\?', re.IGNORECASE)
+_DELETE_FROM_RE = re.compile(r'DELETE\s+FROM\s+(\w+)', re.IGNORECASE)
+_CREATE_TABLE_RE = re.compile(r'CREATE\s+TABLE\s+(\w+)', re.IGNORECASE)
+_WORD_RE = re.compile(r'\w+')
+
+# Distinct INSERT query strings whose parse is kept
+MAX_INSERT_PLANS = 256
+
+# Transaction journal entry kinds
+_UNDO_APPEND = "append"  # (kind, table_name): drop the last row
+_UNDO_ROW = "row"  # (kind, row, previous_values): restore an updated row
+_UNDO_TABLE = "table"  # (kind, table_name, previous_rows or None): restore a table
+_UNDO_ALL = "all"  # (kind, previous_tables): restore every table
+
+
+def _table_name(query: str, keywords: Tuple[str, ...], pattern: "re.Pattern") -> Optional[str]:
+    """
+    Read the table name from a query.
+
+    Queries of the plain shape "<keywords> table ..." are split on
+    whitespace; anything else falls back to the regex parse.
+
+    Args:
+        query: SQL query
+        keywords: Leading tokens expected before the table name
+        pattern: Regex whose first group is the table name
+
+    Returns:
+        Table name, or None if the query has none
+    """
+    count = len(keywords)
+    tokens = query.split(None, count + 1)
+    if len(tokens) > count and _WORD_RE.fullmatch(tokens[count]):
+        for token, keyword in zip(tokens, keywords):
+            if token.upper() != keyword:
+                break
+        else:
+            return tokens[count]
+
+    match = pattern.search(query)
+    return match.group(1) if match else None
+
 
 class InMemoryDatabase:
     """
@@ -26,7 +76,19 @@ class InMemoryDatabase:
         self._tables: Dict[str, List[Dict[str, Any]]] = {}
         self._auto_increment: Dict[str, int] = {}
         self._transaction_active = False
-        self._transaction_backup: Optional[Dict] = None
+        # Undo entries recorded while a transaction is active, oldest first
+        self._journal: List[Tuple] = []
+        # Rows by id per table, built on the first WHERE id lookup. Inserts
+        # extend it; any other mutation drops the table's index.
+        self._id_index: Dict[str, Dict[Any, List[Dict[str, Any]]]] = {}
+        # Parsed INSERT statements by query string
+        self._insert_plans: Dict[str, Tuple[str, Optional[Tuple[str, ...]]]] = {}
+        self._query_handlers = {
+            "SELECT": self._execute_select,
+            "INSERT": self._execute_insert,
+            "UPDATE": self._execute_update,
+            "DELETE": self._execute_delete,
+        }
     
     async def execute(self, query: str, params: Optional[Tuple] = None) -> List[Dict[str, Any]]:
         """
@@ -34,124 +96,193 @@ class InMemoryDatabase:
         
         Supports basic operations: SELECT, INSERT, UPDATE, DELETE, CREATE TABLE
         """
-        query = query.strip()
-        query_upper = query.upper()
-        
-        if query_upper.startswith("SELECT"):
-            return self._execute_select(query, params)
-        elif query_upper.startswith("INSERT"):
-            return self._execute_insert(query, params)
-        elif query_upper.startswith("UPDATE"):
-            return self._execute_update(query, params)
-        elif query_upper.startswith("DELETE"):
-            return self._execute_delete(query, params)
-        elif query_upper.startswith("CREATE TABLE"):
+        # Only leading whitespace affects dispatch; trailing whitespace is
+        # ignored by the parsers. Every supported statement starts with a
+        # six-letter keyword, so only that prefix is upper-cased.
+        query = query.lstrip()
+        keyword = query[:6].upper()
+        
+        handler = self._query_handlers.get(keyword)
+        if handler is not None:
+            return handler(query, params)
+        if keyword == "CREATE" and query[6:12].upper() == " TABLE":
             return self._execute_create_table(query)
-        else:
-            raise ValueError(f"Unsupported query type: {query}")
+        raise ValueError(f"Unsupported query type: {query}")
+    
+    async def executemany(self, query: str, params_seq: Iterable[Tuple]) -> List[Dict[str, Any]]:
+        """
+        Execute a SQL query once per parameter tuple.
+        
+        Args:
+            query: SQL query
+            params_seq: Parameter tuples, one per execution
+            
+        Returns:
+            Rows returned by all executions, in order
+        """
+        results = []
+        for params in params_seq:
+            results.extend(await self.execute(query, params))
+        return results
     
     def _execute_select(self, query: str, params: Optional[Tuple]) -> List[Dict[str, Any]]:
         """Execute SELECT query"""
         # Simple parsing: SELECT * FROM table_name WHERE condition
-        match = re.search(r'FROM\s+(\w+)', query, re.IGNORECASE)
-        if not match:
+        table_name = _table_name(query, ("SELECT", "*", "FROM"), _SELECT_FROM_RE)
+        if table_name is None:
             raise ValueError("Invalid SELECT query: table name not found")
         
-        table_name = match.group(1)
-        
-        if table_name not in self._tables:
+        rows = self._tables.get(table_name)
+        if rows is None:
             return []
         
-        results = self._tables[table_name].copy()
-        
-        # Simple WHERE clause support
-        where_match = re.search(r'WHERE\s+(.+)', query, re.IGNORECASE)
-        if where_match and params:
+        # Simple WHERE clause support; only parsed when there is a value to filter by
+        where_match = _WHERE_RE.search(query) if params else None
+        if where_match:
             where_clause = where_match.group(1)
             # Very simple: field = ?
-            field_match = re.search(r'(\w+)\s*=\s*\?', where_clause)
+            field_match = _FIELD_EQ_Q_RE.search(where_clause)
             if field_match:
                 field_name = field_match.group(1)
                 filter_value = params[0]
-                results = [row for row in results if row.get(field_name) == filter_value]
+                if field_name == 'id':
+                    try:
+                        return list(self._rows_by_id(table_name, rows).get(filter_value, ()))
+                    except TypeError:
+                        pass  # Unhashable filter value; fall back to a scan
+                return [row for row in rows if row.get(field_name) == filter_value]
         
-        return results
+        return rows.copy()
+    
+    def _rows_by_id(
+        self, table_name: str, rows: List[Dict[str, Any]]
+    ) -> Dict[Any, List[Dict[str, Any]]]:
+        """Get the id index for a table, building it on first use"""
+        id_index = self._id_index.get(table_name)
+        if id_index is None:
+            id_index = {}
+            for row in rows:
+                id_index.setdefault(row.get('id'), []).append(row)
+            self._id_index[table_name] = id_index
+        return id_index
     
     def _execute_insert(self, query: str, params: Optional[Tuple]) -> List[Dict[str, Any]]:
         """Execute INSERT query"""
         # Parse: INSERT INTO table_name (col1, col2) VALUES (?, ?)
-        match = re.search(r'INSERT\s+INTO\s+(\w+)', query, re.IGNORECASE)
-        if not match:
-            raise ValueError("Invalid INSERT query")
+        # Parsed once per distinct query string; repeats reuse the plan
+        plan = self._insert_plans.get(query)
+        if plan is None:
+            plan = self._parse_insert(query)
+            if len(self._insert_plans) >= MAX_INSERT_PLANS:
+                self._insert_plans.clear()
+            self._insert_plans[query] = plan
+        table_name, columns = plan
         
-        table_name = match.group(1)
+        rows = self._ensure_table(table_name)
         
-        if table_name not in self._tables:
-            self._tables[table_name] = []
+        if columns and params:
+            return [self._append_row(table_name, rows, dict(zip(columns, params)))]
+        
+        return []
+    
+    @staticmethod
+    def _parse_insert(query: str) -> Tuple[str, Optional[Tuple[str, ...]]]:
+        """Parse an INSERT into its table name and column names (None if absent)"""
+        table_name = _table_name(query, ("INSERT", "INTO"), _INSERT_INTO_RE)
+        if table_name is None:
+            raise ValueError("Invalid INSERT query")
         
         # Extract column names
-        cols_match = re.search(r'\(([^)]+)\)\s+VALUES', query, re.IGNORECASE)
-        if cols_match and params:
-            columns = [col.strip() for col in cols_match.group(1).split(',')]
-            
-            # Create row dict
-            row = {}
-            for i, col in enumerate(columns):
-                if i < len(params):
-                    row[col] = params[i]
-            
-            # Add auto-increment ID if not provided
-            if 'id' not in row:
-                if table_name not in self._auto_increment:
-                    self._auto_increment[table_name] = 1
-                row['id'] = self._auto_increment[table_name]
-                self._auto_increment[table_name] += 1
-            
-            # Add timestamp
-            row['created_at'] = datetime.now().isoformat()
-            
-            self._tables[table_name].append(row)
-            
-            return [row]
+        cols_match = _COLS_VALUES_RE.search(query)
+        if cols_match is None:
+            return table_name, None
+        return table_name, tuple(col.strip() for col in cols_match.group(1).split(','))
+    
+    def _ensure_table(self, table_name: str) -> List[Dict[str, Any]]:
+        """Get a table's rows, creating the table if needed"""
+        rows = self._tables.get(table_name)
+        if rows is None:
+            self._record_undo(_UNDO_TABLE, table_name, None)
+            rows = self._tables[table_name] = []
+        return rows
+    
+    def _append_row(
+        self, table_name: str, rows: List[Dict[str, Any]], row: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Store a new row, assigning an id if missing and a created_at timestamp"""
+        # Add auto-increment ID if not provided
+        if 'id' not in row:
+            next_id = self._auto_increment.get(table_name, 1)
+            row['id'] = next_id
+            self._auto_increment[table_name] = next_id + 1
         
-        return []
+        # Add timestamp
+        row['created_at'] = datetime.now().isoformat()
+        
+        rows.append(row)
+        self._record_undo(_UNDO_APPEND, table_name)
+        id_index = self._id_index.get(table_name)
+        if id_index is not None:
+            try:
+                id_index.setdefault(row['id'], []).append(row)
+            except TypeError:
+                del self._id_index[table_name]  # Unhashable id; scan instead
+        
+        return row
+    
+    def insert_row(self, table_name: str, values: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Insert a row without going through SQL parsing.
+        
+        Args:
+            table_name: Table to insert into (created if missing)
+            values: Column values; copied, not stored directly
+            
+        Returns:
+            The stored row, including id and created_at
+        """
+        return self._append_row(table_name, self._ensure_table(table_name), dict(values))
     
     def _execute_update(self, query: str, params: Optional[Tuple]) -> List[Dict[str, Any]]:
         """Execute UPDATE query"""
         # Parse: UPDATE table_name SET col1 = ? WHERE condition
-        match = re.search(r'UPDATE\s+(\w+)', query, re.IGNORECASE)
-        if not match:
+        table_name = _table_name(query, ("UPDATE",), _UPDATE_RE)
+        if table_name is None:
             raise ValueError("Invalid UPDATE query")
         
-        table_name = match.group(1)
-        
-        if table_name not in self._tables:
+        rows = self._tables.get(table_name)
+        if rows is None:
             return []
         
-        # Simple SET clause
-        set_match = re.search(r'SET\s+(\w+)\s*=\s*\?', query, re.IGNORECASE)
-        where_match = re.search(r'WHERE\s+(\w+)\s*=\s*\?', query, re.IGNORECASE)
+        # Simple SET clause; nothing to set without parameters
+        set_match = _SET_RE.search(query) if params else None
         
-        if set_match and params and len(params) >= 1:
+        if set_match:
             set_field = set_match.group(1)
             set_value = params[0]
             
             updated_rows = []
+            # WHERE is only applied when a second parameter supplies its value
+            where_match = _WHERE_FIELD_EQ_Q_RE.search(query) if len(params) >= 2 else None
+            has_where = where_match is not None
+            if has_where:
+                where_field = where_match.group(1)
+                where_value = params[1]
             
-            for row in self._tables[table_name]:
-                # Simple WHERE condition
-                if where_match and len(params) >= 2:
-                    where_field = where_match.group(1)
-                    where_value = params[1]
-                    if row.get(where_field) == where_value:
-                        row[set_field] = set_value
-                        row['updated_at'] = datetime.now().isoformat()
-                        updated_rows.append(row)
-                else:
-                    # Update all rows
-                    row[set_field] = set_value
-                    row['updated_at'] = datetime.now().isoformat()
-                    updated_rows.append(row)
+            # One timestamp for every row touched by this statement
+            updated_at = datetime.now().isoformat()
+            
+            for row in rows:
+                # Simple WHERE condition; without one, update all rows
+                if has_where and not row.get(where_field) == where_value:
+                    continue
+                self._record_undo(_UNDO_ROW, row, dict(row))
+                row[set_field] = set_value
+                row['updated_at'] = updated_at
+                updated_rows.append(row)
+            
+            if set_field == 'id' and updated_rows:
+                self._id_index.pop(table_name, None)
             
             return updated_rows
         
@@ -160,26 +291,33 @@ class InMemoryDatabase:
     def _execute_delete(self, query: str, params: Optional[Tuple]) -> List[Dict[str, Any]]:
         """Execute DELETE query"""
         # Parse: DELETE FROM table_name WHERE condition
-        match = re.search(r'DELETE\s+FROM\s+(\w+)', query, re.IGNORECASE)
-        if not match:
+        table_name = _table_name(query, ("DELETE", "FROM"), _DELETE_FROM_RE)
+        if table_name is None:
             raise ValueError("Invalid DELETE query")
         
-        table_name = match.group(1)
-        
-        if table_name not in self._tables:
+        rows = self._tables.get(table_name)
+        if rows is None:
             return []
         
-        where_match = re.search(r'WHERE\s+(\w+)\s*=\s*\?', query, re.IGNORECASE)
+        where_match = _WHERE_FIELD_EQ_Q_RE.search(query) if params else None
         
-        if where_match and params:
+        if where_match:
             where_field = where_match.group(1)
             where_value = params[0]
             
-            deleted_rows = [row for row in self._tables[table_name] 
-                          if row.get(where_field) == where_value]
+            deleted_rows = []
+            remaining_rows = []
+            delete_row = deleted_rows.append
+            keep_row = remaining_rows.append
+            for row in rows:
+                if row.get(where_field) == where_value:
+                    delete_row(row)
+                else:
+                    keep_row(row)
             
-            self._tables[table_name] = [row for row in self._tables[table_name] 
-                                       if row.get(where_field) != where_value]
+            self._record_undo(_UNDO_TABLE, table_name, rows)
+            self._tables[table_name] = remaining_rows
+            self._id_index.pop(table_name, None)
             
             return deleted_rows
         
@@ -187,48 +325,80 @@ class InMemoryDatabase:
     
     def _execute_create_table(self, query: str) -> List[Dict[str, Any]]:
         """Execute CREATE TABLE query"""
-        match = re.search(r'CREATE\s+TABLE\s+(\w+)', query, re.IGNORECASE)
-        if not match:
+        table_name = _table_name(query, ("CREATE", "TABLE"), _CREATE_TABLE_RE)
+        if table_name is None:
             raise ValueError("Invalid CREATE TABLE query")
-        
-        table_name = match.group(1)
+        self._record_undo(_UNDO_TABLE, table_name, self._tables.get(table_name))
         self._tables[table_name] = []
         self._auto_increment[table_name] = 1
+        self._id_index.pop(table_name, None)
         
         return []
     
+    def _record_undo(self, *entry) -> None:
+        """Journal how to undo a mutation if a transaction is active"""
+        if self._transaction_active:
+            self._journal.append(entry)
+    
     def begin_transaction(self):
-        """Begin a transaction"""
+        """
+        Begin a transaction.
+        
+        Only changes made through this class (execute, insert_row,
+        clear_table, clear_all) are journaled. Rows returned by execute()
+        are the stored rows, so editing them directly is not undone by
+        rollback().
+        """
+        # Mutations are journaled from here instead of copying every table
         self._transaction_active = True
-        # Deep copy current state
-        import copy
-        self._transaction_backup = copy.deepcopy(self._tables)
+        self._journal = []
     
     def commit(self):
         """Commit transaction"""
         self._transaction_active = False
-        self._transaction_backup = None
+        self._journal = []
     
     def rollback(self):
         """Rollback transaction"""
-        if self._transaction_backup:
-            self._tables = self._transaction_backup
+        # Undo newest first so each entry sees the state it was recorded in
+        for entry in reversed(self._journal):
+            kind = entry[0]
+            if kind == _UNDO_APPEND:
+                self._tables[entry[1]].pop()
+            elif kind == _UNDO_ROW:
+                row, previous = entry[1], entry[2]
+                row.clear()
+                row.update(previous)
+            elif kind == _UNDO_TABLE:
+                table_name, previous = entry[1], entry[2]
+                if previous is None:
+                    self._tables.pop(table_name, None)
+                else:
+                    self._tables[table_name] = previous
+            else:
+                self._tables = entry[1]
         self._transaction_active = False
-        self._transaction_backup = None
+        self._journal = []
+        self._id_index = {}
     
     def get_table(self, table_name: str) -> List[Dict[str, Any]]:
-        """Get all rows from a table"""
-        return self._tables.get(table_name, [])
+        """Get copies of all rows from a table"""
+        # Copies keep callers from changing rows behind the journal and id index
+        return [dict(row) for row in self._tables.get(table_name, ())]
     
     def clear_table(self, table_name: str):
         """Clear all data from a table"""
         if table_name in self._tables:
+            self._record_undo(_UNDO_TABLE, table_name, self._tables[table_name])
             self._tables[table_name] = []
+            self._id_index.pop(table_name, None)
     
     def clear_all(self):
         """Clear all tables"""
+        self._record_undo(_UNDO_ALL, self._tables)
         self._tables = {}
         self._auto_increment = {}
+        self._id_index = {}
     
     async def health_check(self) -> bool:
         """Check database health (always healthy)"""
@@ -4,7 +4,9 @@ Matching Engine Emulator for testing.
 Provides deterministic matching results without complex NLP.
 """
 
-from typing import List, Dict, Any
+import math
+from collections import Counter, defaultdict
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple
 from backend.interfaces.matching import IMatchingEngine, MatchResult
 from backend.interfaces.data_structures import LogicTreeNode
 
@@ -20,6 +22,88 @@ class MatchingEmulator(IMatchingEngine):
         """Initialize matching emulator"""
         self._threshold = threshold
         self._match_count = 0
+        # The node objects of the last list matched against. Holding them
+        # keeps their ids from being reused while the caches below are valid.
+        self._indexed_nodes: Tuple[LogicTreeNode, ...] = ()
+        # Lowercased words of each node's dimensions, keyed by id(node) of a
+        # node in _indexed_nodes. Tree nodes are pre-built and not modified
+        # during matching.
+        self._node_words_cache: Dict[int, FrozenSet[str]] = {}
+        # Inverted index (word -> node positions) over _indexed_nodes
+        self._word_index: Optional[Dict[str, List[int]]] = None
+    
+    def _sync_nodes(self, tree_nodes: List[LogicTreeNode]) -> None:
+        """
+        Drop the cached words and index when given different node objects.
+        
+        Nodes are compared by identity, so a rebuilt tree whose nodes reuse
+        the same node_ids but carry different text is not served stale words.
+        
+        Args:
+            tree_nodes: All available tree nodes
+        """
+        indexed = self._indexed_nodes
+        if len(indexed) == len(tree_nodes) and all(
+            cached is node for cached, node in zip(indexed, tree_nodes)
+        ):
+            return
+        self._indexed_nodes = tuple(tree_nodes)
+        self._node_words_cache = {}
+        self._word_index = None
+    
+    def _node_words(self, node: LogicTreeNode) -> FrozenSet[str]:
+        """
+        Get the searchable words of a node, computing them on first use.
+        
+        Args:
+            node: Tree node
+            
+        Returns:
+            Lowercased words from all six dimensions
+        """
+        words = self._node_words_cache.get(id(node))
+        if words is None:
+            # Extract searchable content from node's 6 dimensions
+            node_content = []
+            for dimension in (node.what, node.which, node.if_then,
+                              node.modality, node.given, node.why):
+                for item in dimension:
+                    if isinstance(item, dict):
+                        node_content.extend(str(v) for v in item.values())
+            words = frozenset(" ".join(node_content).lower().split())
+            self._node_words_cache[id(node)] = words
+        return words
+    
+    def _overlap_counts(self, tree_nodes: List[LogicTreeNode], search_words: set) -> Counter:
+        """
+        Count shared words per node using an inverted word index.
+        
+        The index is rebuilt only when the node objects change (see
+        _sync_nodes), so repeated matching against the same tree touches
+        just the postings of the search words instead of intersecting with
+        every node.
+        
+        Args:
+            tree_nodes: All available tree nodes
+            search_words: Lowercased search words
+            
+        Returns:
+            Counter of overlap size by node position (nodes with no
+            shared words are absent)
+        """
+        if self._word_index is None:
+            index = defaultdict(list)
+            for position, node in enumerate(tree_nodes):
+                for word in self._node_words(node):
+                    index[word].append(position)
+            self._word_index = dict(index)
+        
+        counts = Counter()
+        for word in search_words:
+            positions = self._word_index.get(word)
+            if positions:
+                counts.update(positions)
+        return counts
     
     async def match(
         self,
@@ -39,38 +123,36 @@ class MatchingEmulator(IMatchingEngine):
             List of MatchResult objects, sorted by match_score descending
         """
         self._match_count += 1
+        self._sync_nodes(tree_nodes)
         results = []
         
         # Convert filled_fields to searchable text
         search_text = " ".join(str(v).lower() for v in filled_fields.values())
         search_words = set(search_text.split())
+        search_size = len(search_words)
         
-        for node in tree_nodes:
-            # Extract searchable content from node's 6 dimensions
-            node_content = []
-            
-            # Extract from WHAT dimension
-            for item in node.what:
-                if isinstance(item, dict):
-                    node_content.extend([str(v) for v in item.values()])
-            
-            # Extract from WHICH dimension
-            for item in node.which:
-                if isinstance(item, dict):
-                    node_content.extend([str(v) for v in item.values()])
-            
-            # Extract from other dimensions
-            for dimension in [node.if_then, node.modality, node.given, node.why]:
-                for item in dimension:
-                    if isinstance(item, dict):
-                        node_content.extend([str(v) for v in item.values()])
-            
-            # Calculate match score
-            node_text = " ".join(node_content).lower()
-            node_words = set(node_text.split())
+        # Jaccard score is at most min(|a|, |b|) / max(|a|, |b|) and at most
+        # overlap / |a|, so nodes outside these bounds cannot reach threshold.
+        # The slack keeps float rounding from rejecting an exact-threshold match.
+        min_overlap = threshold * search_size - 1e-9
+        max_node_size = search_size / threshold + 1e-9 if threshold > 0 else math.inf
+        
+        if threshold > 0:
+            # A node sharing no words scores 0, so only indexed hits are scored
+            overlaps = self._overlap_counts(tree_nodes, search_words)
+            candidates = ((tree_nodes[position], overlaps[position])
+                          for position in sorted(overlaps))
+        else:
+            candidates = ((node, len(search_words & self._node_words(node)))
+                          for node in tree_nodes)
+        
+        for node, overlap in candidates:
+            node_size = len(self._node_words(node))
+            if node_size < min_overlap or node_size > max_node_size or overlap < min_overlap:
+                continue
             
-            overlap = len(search_words & node_words)
-            total = len(search_words | node_words)
+            # Jaccard similarity; the union size follows from the overlap
+            total = search_size + node_size - overlap
             match_score = overlap / total if total > 0 else 0.0
             
             if match_score >= threshold:
@@ -119,3 +201,6 @@ class MatchingEmulator(IMatchingEngine):
     def reset(self):
         """Reset emulator state"""
         self._match_count = 0
+        self._indexed_nodes = ()
+        self._node_words_cache = {}
+        self._word_index = None
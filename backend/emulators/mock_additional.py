@@ -3,6 +3,8 @@ Mock Tree Framework and Analysis Engine for Testing
 Implements ITreeFramework and IAnalysisEngine interfaces
 """
 
+import asyncio
+import inspect
 from typing import Any, Dict, List, Tuple
 
 from backend.interfaces.analysis import IAnalysisEngine
@@ -10,6 +12,9 @@ from backend.interfaces.data_structures import LogicTreeNode
 from backend.interfaces.legal_module import ILegalModule
 from backend.interfaces.tree import ITreeFramework
 
+# Node attributes query_tree can filter on
+_FILTER_KEYS = ("node_id", "citation", "source_type")
+
 
 class MockTreeFramework(ITreeFramework):
     """
@@ -17,8 +22,12 @@ class MockTreeFramework(ITreeFramework):
     Manages trees in memory for testing purposes.
     """
 
+    __slots__ = ("_trees", "_indexes")
+
     def __init__(self):
         self._trees: Dict[str, List[LogicTreeNode]] = {}
+        # Per module: filter key -> value -> nodes (in tree order)
+        self._indexes: Dict[str, Dict[str, Dict[Any, List[LogicTreeNode]]]] = {}
 
     # ============================================
     # TREE MANAGEMENT
@@ -38,6 +47,7 @@ class MockTreeFramework(ITreeFramework):
             raise ValueError(f"Invalid tree for {module_id}: {errors}")
 
         self._trees[module_id] = nodes
+        self._indexes[module_id] = self._build_indexes(nodes)
 
     def query_tree(self, module_id: str, filters: Dict[str, Any] = None) -> List[LogicTreeNode]:
         """
@@ -57,11 +67,7 @@ class MockTreeFramework(ITreeFramework):
 
         # Apply filters if provided
         if filters:
-            filtered_nodes = []
-            for node in nodes:
-                if self._matches_filters(node, filters):
-                    filtered_nodes.append(node)
-            return filtered_nodes
+            return self._filter_nodes(module_id, nodes, filters)
 
         return nodes
 
@@ -74,34 +80,70 @@ class MockTreeFramework(ITreeFramework):
         if not nodes:
             errors.append("Tree must have at least one node")
 
-        # Check for unique node IDs
-        node_ids = [node.node_id for node in nodes]
-        if len(node_ids) != len(set(node_ids)):
-            errors.append("Duplicate node IDs found")
-
-        # Check each node has required fields
+        # One pass checks unique node IDs and each node's required fields;
+        # the duplicate error is still reported ahead of the per-node ones
+        seen_ids = set()
+        has_duplicates = False
+        node_errors = []
         for node in nodes:
-            if not node.node_id:
-                errors.append("Node missing node_id")
+            node_id = node.node_id
+            if node_id in seen_ids:
+                has_duplicates = True
+            else:
+                seen_ids.add(node_id)
+            if not node_id:
+                node_errors.append("Node missing node_id")
             if not node.citation:
-                errors.append(f"Node {node.node_id} missing citation")
+                node_errors.append(f"Node {node_id} missing citation")
             if not node.module_id:
-                errors.append(f"Node {node.node_id} missing module_id")
+                node_errors.append(f"Node {node_id} missing module_id")
+
+        if has_duplicates:
+            errors.append("Duplicate node IDs found")
+        errors.extend(node_errors)
 
         return (len(errors) == 0, errors)
 
-    def _matches_filters(self, node: LogicTreeNode, filters: Dict[str, Any]) -> bool:
+    @staticmethod
+    def _build_indexes(nodes: List[LogicTreeNode]) -> Dict[str, Dict[Any, List[LogicTreeNode]]]:
+        """
+        Index nodes by each filterable attribute.
         """
-        Check if node matches filters.
+        indexes: Dict[str, Dict[Any, List[LogicTreeNode]]] = {key: {} for key in _FILTER_KEYS}
+        for node in nodes:
+            for key in _FILTER_KEYS:
+                indexes[key].setdefault(getattr(node, key), []).append(node)
+        return indexes
+
+    def _filter_nodes(
+        self, module_id: str, nodes: List[LogicTreeNode], filters: Dict[str, Any]
+    ) -> List[LogicTreeNode]:
         """
-        for key, value in filters.items():
-            if key == "node_id" and node.node_id != value:
-                return False
-            if key == "citation" and node.citation != value:
-                return False
-            if key == "source_type" and node.source_type != value:
-                return False
-        return True
+        Return nodes matching every supported filter; other keys are ignored.
+
+        Starts from the smallest matching index bucket and checks the
+        remaining filters on those nodes only.
+        """
+        conditions = [(key, value) for key, value in filters.items() if key in _FILTER_KEYS]
+        if not conditions:
+            return list(nodes)
+
+        indexes = self._indexes[module_id]
+        best = None
+        for key, value in conditions:
+            try:
+                bucket = indexes[key].get(value, ())
+            except TypeError:  # Unhashable filter value; checked per node below
+                continue
+            if best is None or len(bucket) < len(best):
+                best = bucket
+        candidates = nodes if best is None else best
+
+        return [
+            node
+            for node in candidates
+            if all(getattr(node, key) == value for key, value in conditions)
+        ]
 
     # ============================================
     # UTILITY
@@ -115,7 +157,7 @@ class MockTreeFramework(ITreeFramework):
             self.build_tree("TEST_MODULE", [test_node])
             result = self.query_tree("TEST_MODULE")
             # Clean up
-            del self._trees["TEST_MODULE"]
+            self.clear_tree("TEST_MODULE")
             return len(result) == 1
         except Exception:
             return False
@@ -128,6 +170,20 @@ class MockTreeFramework(ITreeFramework):
         """Remove a tree from the framework"""
         if module_id in self._trees:
             del self._trees[module_id]
+            del self._indexes[module_id]
+
+
+async def _resolve_all(*values: Any) -> List[Any]:
+    """
+    Await any awaitable values concurrently and return all values in order.
+    """
+    results = list(values)
+    pending = [index for index, value in enumerate(results) if inspect.isawaitable(value)]
+    if pending:
+        resolved = await asyncio.gather(*(results[index] for index in pending))
+        for index, value in zip(pending, resolved):
+            results[index] = value
+    return results
 
 
 class MockAnalysisEngine(IAnalysisEngine):
@@ -136,6 +192,8 @@ class MockAnalysisEngine(IAnalysisEngine):
     Orchestrates analysis with predictable results.
     """
 
+    __slots__ = ("_analysis_count",)
+
     def __init__(self):
         self._analysis_count = 0
 
@@ -181,9 +239,12 @@ class MockAnalysisEngine(IAnalysisEngine):
             matched_nodes=tree_nodes[:2], filled_fields=filled_fields  # Use first 2 nodes
         )
 
-        # Get arguments and recommendations
-        arguments = module.get_arguments(calculation_result)
-        recommendations = module.get_recommendations(filled_fields, calculation_result)
+        # Get arguments and recommendations; modules may implement these as
+        # coroutines (as MockLegalModule does), which are awaited concurrently
+        arguments, recommendations = await _resolve_all(
+            module.get_arguments(calculation_result),
+            module.get_recommendations(filled_fields, calculation_result),
+        )
 
         # Build comprehensive result
         result = {
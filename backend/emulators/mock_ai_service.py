@@ -8,6 +8,47 @@ from typing import Any, Dict, Optional
 from backend.interfaces.ai_service import IAIService
 from backend.interfaces.data_structures import AIProvider, AIRequest, AIResponse, AIServiceType
 
+# Canned responses
+_ASK_CASE_TYPE = "To help you better, I need to know: What type of case is this? (civil, criminal, or family)"
+_ASK_AMOUNT = "Thank you. Now, what is the amount claimed in this case?"
+_ASK_COURT_LEVEL = "Great! Which court level will hear this case? (district, high, or appeal)"
+_ALL_INFORMATION = "Thank you for providing all the information. I now have everything needed to analyze your case."
+
+_ANALYSIS_RESPONSE = """Based on the information provided, here is my analysis:
+
+1. **Case Assessment**: This appears to be a standard case with clear parameters.
+2. **Cost Implications**: The calculated costs are in line with typical cases of this nature.
+3. **Procedural Considerations**: Ensure all filing deadlines are met.
+4. **Strategic Recommendations**: The cost-benefit analysis favors proceeding.
+
+This is a mock analysis generated for testing purposes."""
+
+_ENHANCEMENT_RESPONSE = """Enhanced Legal Advisory:
+
+The calculated costs represent a fair assessment based on the applicable rules.
+The breakdown shows transparent allocation across filing, hearing, and miscellaneous fees.
+
+**Legal Basis**: The calculation follows established precedents and court schedules.
+**Next Steps**: Review the detailed breakdown and consider settlement negotiations.
+
+This enhancement provides additional context while preserving calculation accuracy."""
+
+_UNKNOWN_RESPONSE = "Mock response for unknown service type"
+
+# Token counts of the canned responses, so generate() does not split them per call
+_TOKEN_COUNTS = {
+    text: len(text.split())
+    for text in (
+        _ASK_CASE_TYPE,
+        _ASK_AMOUNT,
+        _ASK_COURT_LEVEL,
+        _ALL_INFORMATION,
+        _ANALYSIS_RESPONSE,
+        _ENHANCEMENT_RESPONSE,
+        _UNKNOWN_RESPONSE,
+    )
+}
+
 
 class MockAIService(IAIService):
     """
@@ -15,10 +56,18 @@ class MockAIService(IAIService):
     Returns predictable responses without making real API calls.
     """
 
+    __slots__ = ("_provider", "_model", "_call_count", "_handlers")
+
     def __init__(self):
         self._provider = AIProvider.ANTHROPIC_CLAUDE
         self._model = "mock-claude-v1"
         self._call_count = 0
+        # Constant responses are stored directly; only conversation needs the request
+        self._handlers = {
+            AIServiceType.CONVERSATION: self._generate_conversation_response,
+            AIServiceType.ANALYSIS: _ANALYSIS_RESPONSE,
+            AIServiceType.ENHANCEMENT: _ENHANCEMENT_RESPONSE,
+        }
 
     @property
     def provider(self) -> AIProvider:
@@ -35,19 +84,17 @@ class MockAIService(IAIService):
         self._call_count += 1
 
         # Generate response based on service type
-        if request.service_type == AIServiceType.CONVERSATION:
-            response_text = self._generate_conversation_response(request)
-        elif request.service_type == AIServiceType.ANALYSIS:
-            response_text = self._generate_analysis_response(request)
-        elif request.service_type == AIServiceType.ENHANCEMENT:
-            response_text = self._generate_enhancement_response(request)
-        else:
-            response_text = "Mock response for unknown service type"
+        handler = self._handlers.get(request.service_type, _UNKNOWN_RESPONSE)
+        response_text = handler if isinstance(handler, str) else handler(request)
+
+        tokens_used = _TOKEN_COUNTS.get(response_text)
+        if tokens_used is None:
+            tokens_used = len(response_text.split())
 
         return AIResponse(
             content=response_text,
             service_type=request.service_type,
-            tokens_used=len(response_text.split()),
+            tokens_used=tokens_used,
             finish_reason="stop",
             metadata={"call_number": self._call_count, "mock": True},
         )
@@ -58,48 +105,19 @@ class MockAIService(IAIService):
         filled_fields = context.get("filled_fields", {})
 
         if "case_type" not in filled_fields:
-            return "To help you better, I need to know: What type of case is this? (civil, criminal, or family)"
+            return _ASK_CASE_TYPE
         elif "amount_claimed" not in filled_fields:
-            return "Thank you. Now, what is the amount claimed in this case?"
+            return _ASK_AMOUNT
         elif "court_level" not in filled_fields:
-            return "Great! Which court level will hear this case? (district, high, or appeal)"
+            return _ASK_COURT_LEVEL
         else:
-            return "Thank you for providing all the information. I now have everything needed to analyze your case."
-
-    def _generate_analysis_response(self, request: AIRequest) -> str:
-        """Generate mock analysis response"""
-        return """Based on the information provided, here is my analysis:
-
-1. **Case Assessment**: This appears to be a standard case with clear parameters.
-2. **Cost Implications**: The calculated costs are in line with typical cases of this nature.
-3. **Procedural Considerations**: Ensure all filing deadlines are met.
-4. **Strategic Recommendations**: The cost-benefit analysis favors proceeding.
-
-This is a mock analysis generated for testing purposes."""
-
-    def _generate_enhancement_response(self, request: AIRequest) -> str:
-        """Generate mock enhancement response"""
-        return """Enhanced Legal Advisory:
-
-The calculated costs represent a fair assessment based on the applicable rules.
-The breakdown shows transparent allocation across filing, hearing, and miscellaneous fees.
-
-**Legal Basis**: The calculation follows established precedents and court schedules.
-**Next Steps**: Review the detailed breakdown and consider settlement negotiations.
-
-This enhancement provides additional context while preserving calculation accuracy."""
+            return _ALL_INFORMATION
 
     async def validate_response(
         self, response: AIResponse, expected_format: Optional[Dict[str, Any]] = None
     ) -> bool:
         """Validate AI response"""
-        if not response.content:
-            return False
-        if not response.service_type:
-            return False
-        if response.tokens_used < 0:
-            return False
-        return True
+        return bool(response.content and response.service_type and response.tokens_used >= 0)
 
     async def health_check(self) -> bool:
         """Check if AI service is functioning"""
@@ -14,6 +14,8 @@ class MockCalculator(ICalculator):
     Performs simple mock calculations.
     """
 
+    __slots__ = ("_calculation_count",)
+
     def __init__(self):
         self._calculation_count = 0
 
@@ -28,13 +30,15 @@ class MockCalculator(ICalculator):
         # Simple mock calculation
         amount = filled_fields.get("amount_claimed", 10000)
         base_cost = amount * 0.1
+        # Filing and miscellaneous fees share the same 30% share
+        thirty_percent = base_cost * 0.3
 
         return {
             "total_costs": base_cost,
             "breakdown": {
-                "filing_fee": base_cost * 0.3,
+                "filing_fee": thirty_percent,
                 "hearing_fee": base_cost * 0.4,
-                "miscellaneous": base_cost * 0.3,
+                "miscellaneous": thirty_percent,
             },
             "currency": "SGD",
             "calculation_method": "mock_calculator",
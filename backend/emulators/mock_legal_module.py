@@ -3,7 +3,8 @@ Mock Legal Module for Testing
 Implements ILegalModule interface with test data
 """
 
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
 
 from backend.interfaces.data_structures import (
     FieldRequirement,
@@ -21,135 +22,156 @@ class MockLegalModule(ILegalModule):
     Returns predictable test data.
     """
 
-    def __init__(self):
-        self._metadata = ModuleMetadata(
+    # The test data never changes, so it is built once per process and
+    # shared by every instance rather than rebuilt in __init__
+    __slots__ = ()
+
+    _METADATA = ModuleMetadata(
+        module_id="MOCK_MODULE",
+        module_name="Mock Legal Module for Testing",
+        version="1.0.0",
+        status=ModuleStatus.ACTIVE,
+        author="Test Suite",
+        description="Mock module for testing purposes",
+        effective_date="2024-01-01",
+        last_updated="2024-01-01",
+        dependencies=[],
+        tags=["test", "mock"],
+    )
+
+    _TREE_NODES = [
+        LogicTreeNode(
+            node_id="MOCK_1",
+            citation="Mock Rule 1",
             module_id="MOCK_MODULE",
-            module_name="Mock Legal Module for Testing",
-            version="1.0.0",
-            status=ModuleStatus.ACTIVE,
-            author="Test Suite",
-            description="Mock module for testing purposes",
-            effective_date="2024-01-01",
-            last_updated="2024-01-01",
-            dependencies=[],
-            tags=["test", "mock"],
-        )
+            what=[{"fact": "test_fact", "value": "test_value"}],
+            which=[{"scope": "test", "applies_to": "all"}],
+            if_then=[{"condition": "test", "result": "pass"}],
+            modality=[{"type": "MUST", "action": "test"}],
+            given=[{"assumption": "test_assumption"}],
+            why=[{"reason": "test_reason", "policy": "test_policy"}],
+        ),
+        LogicTreeNode(
+            node_id="MOCK_2",
+            citation="Mock Rule 2",
+            module_id="MOCK_MODULE",
+            what=[{"fact": "another_fact", "value": "another_value"}],
+            which=[{"scope": "limited", "applies_to": "specific"}],
+            if_then=[{"condition": "complex", "result": "conditional"}],
+            modality=[{"type": "MAY", "action": "optional"}],
+            given=[{"assumption": "complex_assumption"}],
+            why=[{"reason": "legal_precedent", "policy": "fairness"}],
+        ),
+    ]
 
-        self._tree_nodes = [
-            LogicTreeNode(
-                node_id="MOCK_1",
-                citation="Mock Rule 1",
-                module_id="MOCK_MODULE",
-                what=[{"fact": "test_fact", "value": "test_value"}],
-                which=[{"scope": "test", "applies_to": "all"}],
-                if_then=[{"condition": "test", "result": "pass"}],
-                modality=[{"type": "MUST", "action": "test"}],
-                given=[{"assumption": "test_assumption"}],
-                why=[{"reason": "test_reason", "policy": "test_policy"}],
-            ),
-            LogicTreeNode(
-                node_id="MOCK_2",
-                citation="Mock Rule 2",
-                module_id="MOCK_MODULE",
-                what=[{"fact": "another_fact", "value": "another_value"}],
-                which=[{"scope": "limited", "applies_to": "specific"}],
-                if_then=[{"condition": "complex", "result": "conditional"}],
-                modality=[{"type": "MAY", "action": "optional"}],
-                given=[{"assumption": "complex_assumption"}],
-                why=[{"reason": "legal_precedent", "policy": "fairness"}],
-            ),
-        ]
+    # Requirements and templates are shared tuples that callers must not
+    # modify (see ILegalModule). get_tree_nodes returns a fresh list because
+    # LogicTreeFramework.register_module_tree requires one.
+    _FIELD_REQUIREMENTS = (
+        FieldRequirement(
+            field_name="case_type",
+            field_type="enum",
+            description="Type of legal case",
+            required=True,
+            validation_rules={"min_length": 1},
+            enum_values=["civil", "criminal", "family"],
+            example="civil",
+        ),
+        FieldRequirement(
+            field_name="amount_claimed",
+            field_type="number",
+            description="Amount claimed in dollars",
+            required=True,
+            validation_rules={"min": 0, "max": 1000000},
+            example="50000",
+        ),
+        FieldRequirement(
+            field_name="court_level",
+            field_type="enum",
+            description="Level of court",
+            required=True,
+            validation_rules={},
+            enum_values=["district", "high", "appeal"],
+            example="district",
+        ),
+    )
 
-        self._field_requirements = [
-            FieldRequirement(
-                field_name="case_type",
-                field_type="enum",
-                description="Type of legal case",
-                required=True,
-                validation_rules={"min_length": 1},
-                enum_values=["civil", "criminal", "family"],
-                example="civil",
-            ),
-            FieldRequirement(
-                field_name="amount_claimed",
-                field_type="number",
-                description="Amount claimed in dollars",
-                required=True,
-                validation_rules={"min": 0, "max": 1000000},
-                example="50000",
-            ),
-            FieldRequirement(
-                field_name="court_level",
-                field_type="enum",
-                description="Level of court",
-                required=True,
-                validation_rules={},
-                enum_values=["district", "high", "appeal"],
-                example="district",
-            ),
-        ]
+    # Loop-invariant views of the requirements used on every validation
+    _REQUIRED_FIELDS = tuple(
+        req.field_name for req in _FIELD_REQUIREMENTS if req.required
+    )
+    _ENUM_SPECS = {
+        req.field_name: (frozenset(req.enum_values), req.enum_values)
+        for req in _FIELD_REQUIREMENTS
+        if req.enum_values
+    }
 
-        self._question_templates = [
-            QuestionTemplate(
-                field_name="case_type",
-                template="What type of case is this? (civil, criminal, or family)",
-                priority=1,
-                context_required=[],
-                validation_pattern="^(civil|criminal|family)$",
-            ),
-            QuestionTemplate(
-                field_name="amount_claimed",
-                template="What is the amount claimed in this case?",
-                priority=2,
-                context_required=["case_type"],
-                validation_pattern=r"^\d+(\.\d{2})?$",
-            ),
-            QuestionTemplate(
-                field_name="court_level",
-                template="Which court level will hear this case?",
-                priority=3,
-                context_required=["case_type", "amount_claimed"],
-                validation_pattern="^(district|high|appeal)$",
-            ),
-        ]
+    _QUESTION_TEMPLATES = (
+        QuestionTemplate(
+            field_name="case_type",
+            template="What type of case is this? (civil, criminal, or family)",
+            priority=1,
+            context_required=[],
+            validation_pattern="^(civil|criminal|family)$",
+        ),
+        QuestionTemplate(
+            field_name="amount_claimed",
+            template="What is the amount claimed in this case?",
+            priority=2,
+            context_required=["case_type"],
+            validation_pattern=r"^\d+(\.\d{2})?$",
+        ),
+        QuestionTemplate(
+            field_name="court_level",
+            template="Which court level will hear this case?",
+            priority=3,
+            context_required=["case_type", "amount_claimed"],
+            validation_pattern="^(district|high|appeal)$",
+        ),
+    )
 
     @property
     def metadata(self) -> ModuleMetadata:
         """Return module metadata"""
-        return self._metadata
+        return self._METADATA
 
     def get_tree_nodes(self) -> List[LogicTreeNode]:
-        """Return pre-built logic tree nodes"""
-        return self._tree_nodes
+        """Return pre-built logic tree nodes (a new list on every call)"""
+        return list(self._TREE_NODES)
 
     def get_tree_version(self) -> str:
         """Return tree version"""
         return "1.0.0"
 
-    def get_field_requirements(self) -> List[FieldRequirement]:
-        """Return field requirements"""
-        return self._field_requirements
+    def get_field_requirements(self) -> Sequence[FieldRequirement]:
+        """Return field requirements (shared, read-only)"""
+        return self._FIELD_REQUIREMENTS
 
-    def get_question_templates(self) -> List[QuestionTemplate]:
+    def get_question_templates(self) -> Sequence[QuestionTemplate]:
         """Return question templates"""
-        return self._question_templates
+        return self._QUESTION_TEMPLATES
 
     def validate_fields(self, filled_fields: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """Validate filled fields against requirements"""
-        errors = []
-
-        for req in self._field_requirements:
-            if req.required and req.field_name not in filled_fields:
-                errors.append(f"Required field missing: {req.field_name}")
+        errors = [
+            f"Required field missing: {field_name}"
+            for field_name in self._REQUIRED_FIELDS
+            if field_name not in filled_fields
+        ]
 
-        for req in self._field_requirements:
-            if req.field_name in filled_fields and req.enum_values:
-                value = filled_fields[req.field_name]
-                if value not in req.enum_values:
-                    errors.append(
-                        f"Invalid value for {req.field_name}: {value}. "
-                        f"Must be one of {req.enum_values}"
-                    )
+        for field_name, (allowed, enum_values) in self._ENUM_SPECS.items():
+            if field_name not in filled_fields:
+                continue
+            value = filled_fields[field_name]
+            try:
+                is_allowed = value in allowed
+            except TypeError:  # Unhashable value; fall back to the list
+                is_allowed = value in enum_values
+            if not is_allowed:
+                errors.append(
+                    f"Invalid value for {field_name}: {value}. "
+                    f"Must be one of {enum_values}"
+                )
 
         if "amount_claimed" in filled_fields:
             amount = filled_fields["amount_claimed"]
@@ -162,7 +184,7 @@ class MockLegalModule(ILegalModule):
 
     def check_completeness(self, filled_fields: Dict[str, Any]) -> float:
         """Calculate information completeness (0.0 to 1.0)"""
-        required_fields = [req.field_name for req in self._field_requirements if req.required]
+        required_fields = self._REQUIRED_FIELDS
         if not required_fields:
             return 1.0
 
@@ -175,13 +197,15 @@ class MockLegalModule(ILegalModule):
         """Perform mock calculation"""
         amount = filled_fields.get("amount_claimed", 10000)
         base_cost = amount * 0.1
+        # Filing and miscellaneous fees share the same 30% share
+        thirty_percent = base_cost * 0.3
 
         return {
             "total_costs": base_cost,
             "breakdown": {
-                "filing_fee": base_cost * 0.3,
+                "filing_fee": thirty_percent,
                 "hearing_fee": base_cost * 0.4,
-                "miscellaneous": base_cost * 0.3,
+                "miscellaneous": thirty_percent,
             },
             "currency": "SGD",
             "calculation_method": "mock_fixed_percentage",
@@ -191,41 +215,57 @@ class MockLegalModule(ILegalModule):
             "notes": "This is a mock calculation for testing purposes",
         }
 
-    async def get_arguments(self, calculation_result: Dict[str, Any]) -> List[str]:
-        """Generate court-ready legal arguments"""
-        return [
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _arguments_for(total_costs: Any) -> Tuple[str, ...]:
+        """Build the arguments for a total cost (cached, pure)"""
+        return (
             "Pursuant to Mock Rule 1, the costs are calculated as follows:",
-            f"- Total costs amount to ${calculation_result.get('total_costs', 0):.2f}",
+            f"- Total costs amount to ${total_costs:.2f}",
             "- This calculation is based on the standardized mock formula",
             "- All fees are in accordance with the mock schedule",
             "The calculation is deterministic and verifiable.",
-        ]
+        )
 
-    async def get_recommendations(
-        self, filled_fields: Dict[str, Any], calculation_result: Dict[str, Any]
-    ) -> List[str]:
-        """Provide strategic recommendations"""
-        amount = filled_fields.get("amount_claimed", 0)
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _recommendations_for(high_amount: bool, is_appeal: bool) -> Tuple[str, ...]:
+        """Build the recommendations for the two input conditions (cached, pure)"""
         recommendations = [
             "Consider the cost-benefit analysis of proceeding",
             "Ensure all documentation is properly filed",
         ]
 
-        if amount > 50000:
+        if high_amount:
             recommendations.append("Given the high claim amount, consider engaging senior counsel")
 
-        if filled_fields.get("court_level") == "appeal":
+        if is_appeal:
             recommendations.append("Prepare comprehensive grounds of appeal")
 
-        return recommendations
+        return tuple(recommendations)
+
+    async def get_arguments(self, calculation_result: Dict[str, Any]) -> List[str]:
+        """Generate court-ready legal arguments"""
+        return list(self._arguments_for(calculation_result.get("total_costs", 0)))
+
+    async def get_recommendations(
+        self, filled_fields: Dict[str, Any], calculation_result: Dict[str, Any]
+    ) -> List[str]:
+        """Provide strategic recommendations"""
+        amount = filled_fields.get("amount_claimed", 0)
+        return list(
+            self._recommendations_for(
+                amount > 50000, filled_fields.get("court_level") == "appeal"
+            )
+        )
 
     async def health_check(self) -> bool:
         """Check if module is functioning correctly"""
         try:
-            assert len(self._tree_nodes) > 0
-            assert len(self._field_requirements) > 0
-            assert len(self._question_templates) > 0
-            assert self._metadata.module_id == "MOCK_MODULE"
+            assert len(self._TREE_NODES) > 0
+            assert len(self._FIELD_REQUIREMENTS) > 0
+            assert len(self._QUESTION_TEMPLATES) > 0
+            assert self._METADATA.module_id == "MOCK_MODULE"
             return True
         except Exception:
             return False
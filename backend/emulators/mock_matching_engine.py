@@ -15,6 +15,12 @@ class MockMatchingEngine(IMatchingEngine):
     Returns predictable match results.
     """
 
+    __slots__ = ("_match_count",)
+
+    # Score by number of filled fields (capped at 3); node content is ignored
+    _SCORE_TABLE = (0.5, 0.6, 0.75, 0.95)
+    _ALL_POSSIBLE_FIELDS = ("case_type", "amount_claimed", "court_level", "trial_duration")
+
     def __init__(self):
         self._match_count = 0
 
@@ -23,45 +29,37 @@ class MockMatchingEngine(IMatchingEngine):
     ) -> List[MatchResult]:
         """Perform mock matching of fields to tree nodes"""
         self._match_count += 1
-        matches = []
 
-        for node in tree_nodes:
-            score = self._calculate_mock_score(filled_fields, node)
+        # Score and missing fields depend only on the filled fields, so every
+        # node gets the same values (and the result needs no sorting)
+        score = self._calculate_mock_score(filled_fields)
+        if score < threshold:
+            return []
+        missing_fields = self._identify_missing_fields(filled_fields)
+        reasoning = f"Mock match with confidence {score:.2f}"
+        # One snapshot of the fields shared by all results; callers must not mutate it
+        matched_fields = dict(filled_fields)
 
-            if score >= threshold:
-                matches.append(
-                    MatchResult(
-                        node_id=node.node_id,
-                        node=node,
-                        match_score=score,
-                        matched_fields=filled_fields.copy(),
-                        missing_fields=self._identify_missing_fields(filled_fields, node),
-                        confidence=score,
-                        reasoning=f"Mock match with confidence {score:.2f}",
-                    )
-                )
-
-        matches.sort(key=lambda x: x.confidence, reverse=True)
-        return matches
+        return [
+            MatchResult(
+                node_id=node.node_id,
+                node=node,
+                match_score=score,
+                matched_fields=matched_fields,
+                missing_fields=list(missing_fields),
+                confidence=score,
+                reasoning=reasoning,
+            )
+            for node in tree_nodes
+        ]
 
-    def _calculate_mock_score(self, filled_fields: Dict[str, Any], node: LogicTreeNode) -> float:
+    def _calculate_mock_score(self, filled_fields: Dict[str, Any]) -> float:
         """Calculate a mock confidence score"""
-        score = 0.5
-        field_count = len(filled_fields)
-        if field_count >= 1:
-            score += 0.1
-        if field_count >= 2:
-            score += 0.15
-        if field_count >= 3:
-            score += 0.2
-        return min(score, 0.95)
+        return self._SCORE_TABLE[min(len(filled_fields), 3)]
 
-    def _identify_missing_fields(
-        self, filled_fields: Dict[str, Any], node: LogicTreeNode
-    ) -> List[str]:
+    def _identify_missing_fields(self, filled_fields: Dict[str, Any]) -> List[str]:
         """Identify fields that could improve the match"""
-        all_possible_fields = ["case_type", "amount_claimed", "court_level", "trial_duration"]
-        missing = [field for field in all_possible_fields if field not in filled_fields]
+        missing = [field for field in self._ALL_POSSIBLE_FIELDS if field not in filled_fields]
         return missing[:3]
 
     async def health_check(self) -> bool:
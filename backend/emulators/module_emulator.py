@@ -4,7 +4,8 @@ Legal Module Emulator for testing.
 Provides a minimal logic tree for testing without full module implementation.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from functools import cached_property
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from backend.interfaces.legal_module import ILegalModule
 from backend.interfaces.data_structures import (
     ModuleMetadata, 
@@ -16,6 +17,60 @@ from backend.interfaces.data_structures import (
 )
 
 
+# Static test data shared by every emulator instance; treat as read-only
+_FIELD_REQUIREMENTS: Tuple[FieldRequirement, ...] = (
+    FieldRequirement(
+        field_name="case_type",
+        field_type="string",
+        description="Type of case (civil/criminal)",
+        required=True,
+        validation_rules={"min_length": 1},
+        enum_values=["civil", "criminal"],
+        example="civil"
+    ),
+    FieldRequirement(
+        field_name="amount",
+        field_type="number",
+        description="Amount in dispute",
+        required=True,
+        validation_rules={"min": 0},
+        example="10000"
+    ),
+    FieldRequirement(
+        field_name="party_count",
+        field_type="integer",
+        description="Number of parties",
+        required=False,
+        validation_rules={"min": 1},
+        example="2"
+    ),
+)
+
+_QUESTION_TEMPLATES: Tuple[QuestionTemplate, ...] = (
+    QuestionTemplate(
+        field_name="case_type",
+        template="What type of case is this?",
+        priority=1,
+        context_required=[],
+        validation_pattern=None
+    ),
+    QuestionTemplate(
+        field_name="amount",
+        template="What is the amount in dispute?",
+        priority=2,
+        context_required=["case_type"],
+        validation_pattern=r"^\d+(\.\d{2})?$"
+    ),
+    QuestionTemplate(
+        field_name="party_count",
+        template="How many parties are involved?",
+        priority=3,
+        context_required=[],
+        validation_pattern=r"^\d+$"
+    ),
+)
+
+
 class ModuleEmulator(ILegalModule):
     """
     Simple legal module emulator with minimal logic tree.
@@ -23,6 +78,10 @@ class ModuleEmulator(ILegalModule):
     Useful for testing without full Order 21 implementation.
     """
     
+    # Fields counted by check_completeness
+    _REQUIRED_FIELDS = frozenset({"case_type", "amount"})
+    _OPTIONAL_FIELDS = frozenset({"party_count"})
+    
     def __init__(self, module_name: str = "EmulatorModule"):
         """Initialize module emulator"""
         self._module_name = module_name
@@ -66,9 +125,9 @@ class ModuleEmulator(ILegalModule):
     # METADATA
     # ============================================
     
-    @property
+    @cached_property
     def metadata(self) -> ModuleMetadata:
-        """Return module metadata"""
+        """Return module metadata (built once per instance)"""
         return ModuleMetadata(
             module_id="TEST_MODULE",
             module_name=self._module_name,
@@ -98,61 +157,13 @@ class ModuleEmulator(ILegalModule):
     # FIELD REQUIREMENTS
     # ============================================
     
-    def get_field_requirements(self) -> List[FieldRequirement]:
-        """Return list of all fields required by this module"""
-        return [
-            FieldRequirement(
-                field_name="case_type",
-                field_type="string",
-                description="Type of case (civil/criminal)",
-                required=True,
-                validation_rules={"min_length": 1},
-                enum_values=["civil", "criminal"],
-                example="civil"
-            ),
-            FieldRequirement(
-                field_name="amount",
-                field_type="number",
-                description="Amount in dispute",
-                required=True,
-                validation_rules={"min": 0},
-                example="10000"
-            ),
-            FieldRequirement(
-                field_name="party_count",
-                field_type="integer",
-                description="Number of parties",
-                required=False,
-                validation_rules={"min": 1},
-                example="2"
-            )
-        ]
+    def get_field_requirements(self) -> Sequence[FieldRequirement]:
+        """Return the fields required by this module (shared, read-only)"""
+        return _FIELD_REQUIREMENTS
     
-    def get_question_templates(self) -> List[QuestionTemplate]:
-        """Return template questions for information gathering"""
-        return [
-            QuestionTemplate(
-                field_name="case_type",
-                template="What type of case is this?",
-                priority=1,
-                context_required=[],
-                validation_pattern=None
-            ),
-            QuestionTemplate(
-                field_name="amount",
-                template="What is the amount in dispute?",
-                priority=2,
-                context_required=["case_type"],
-                validation_pattern=r"^\d+(\.\d{2})?$"
-            ),
-            QuestionTemplate(
-                field_name="party_count",
-                template="How many parties are involved?",
-                priority=3,
-                context_required=[],
-                validation_pattern=r"^\d+$"
-            )
-        ]
+    def get_question_templates(self) -> Sequence[QuestionTemplate]:
+        """Return template questions for information gathering (shared, read-only)"""
+        return _QUESTION_TEMPLATES
     
     # ============================================
     # VALIDATION
@@ -183,15 +194,13 @@ class ModuleEmulator(ILegalModule):
     
     def check_completeness(self, filled_fields: Dict[str, Any]) -> float:
         """Calculate information completeness (0.0 to 1.0)"""
-        required_fields = ["case_type", "amount"]
-        optional_fields = ["party_count"]
-        
-        required_filled = sum(1 for f in required_fields if f in filled_fields)
-        optional_filled = sum(1 for f in optional_fields if f in filled_fields)
+        keys = filled_fields.keys()
+        required_filled = len(keys & self._REQUIRED_FIELDS)
+        optional_filled = len(keys & self._OPTIONAL_FIELDS)
         
         # Required fields worth 80%, optional fields worth 20%
-        required_score = (required_filled / len(required_fields)) * 0.8
-        optional_score = (optional_filled / len(optional_fields)) * 0.2
+        required_score = (required_filled / len(self._REQUIRED_FIELDS)) * 0.8
+        optional_score = (optional_filled / len(self._OPTIONAL_FIELDS)) * 0.2
         
         return required_score + optional_score
     
@@ -12,6 +12,8 @@ THE HYBRID CYCLE:
 5. If complete → Logic Tree calculates → AI explains
 """
 
+import json
+import re
 from typing import Dict, List, Any, Optional
 from backend.common_services.gap_detector import GapDetector, ValidationResult
 from backend.common_services.pattern_extractor import PatternExtractor
@@ -25,6 +27,9 @@ from backend.common_services.logging_config import (
 
 logger = get_logger(__name__)
 
+# Outermost {...} span in an AI reply
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
 
 class HybridTurnManager:
     """
@@ -44,6 +49,8 @@ class HybridTurnManager:
         gap_detector: GapDetector,
         pattern_extractor: PatternExtractor,
         question_generator: NaturalQuestionGenerator,
+        module_registry: Optional[Any] = None,
+        result_explainer: Optional[Any] = None,
     ):
         """
         Initialize hybrid turn manager.
@@ -53,11 +60,15 @@ class HybridTurnManager:
             gap_detector: Logic tree gap detection
             pattern_extractor: Fast pattern extraction
             question_generator: Natural question generation
+            module_registry: Optional registry used to calculate on complete turns
+            result_explainer: Optional explainer used to explain on complete turns
         """
         self.ai_service = ai_service
         self.gap_detector = gap_detector
         self.pattern_extractor = pattern_extractor
         self.question_generator = question_generator
+        self.module_registry = module_registry
+        self.result_explainer = result_explainer
 
         logger.info("HybridTurnManager initialized")
 
@@ -67,6 +78,7 @@ class HybridTurnManager:
         module_id: str,
         filled_fields: Dict[str, Any],
         conversation_history: List[Dict[str, str]],
+        explain_if_complete: bool = False,
     ) -> Dict[str, Any]:
         """
         Process one turn of the hybrid cycle.
@@ -78,6 +90,9 @@ class HybridTurnManager:
             module_id: Active module (e.g., "ORDER_21")
             filled_fields: Fields filled so far in session
             conversation_history: Previous messages
+            explain_if_complete: If the turn completes, also calculate and
+                explain within the same turn ("calculation_result" and
+                "rich_explanation" keys in the result)
 
         Returns:
             Response dictionary with status, message, etc.
@@ -119,7 +134,8 @@ class HybridTurnManager:
         if validation.complete and validation.can_calculate:
             # No gaps - we can calculate!
             return await self._handle_complete(
-                validation, updated_fields, conversation_history, module_id
+                validation, updated_fields, conversation_history, module_id,
+                explain=explain_if_complete,
             )
         else:
             # Gaps found - ask naturally
@@ -228,12 +244,8 @@ Now extract from the user's message:"""
                     max_tokens=200,
                 )
 
-                # Parse JSON response
-                import json
-                import re
-
                 # Extract JSON from response
-                json_match = re.search(r'\{.*\}', response, re.DOTALL)
+                json_match = _JSON_OBJECT_RE.search(response)
                 if json_match:
                     extracted = json.loads(json_match.group())
                     return extracted
@@ -254,13 +266,14 @@ Now extract from the user's message:"""
         filled_fields: Dict[str, Any],
         conversation_history: List[Dict[str, str]],
         module_id: str,
+        explain: bool = False,
     ) -> Dict[str, Any]:
         """
         Handle case where we have all information needed.
 
         Flow:
         1. Summarize understanding
-        2. Calculate (this will be done by analysis engine)
+        2. Calculate (by the caller, or here when explain is set)
         3. Explain naturally
         """
         logger.info("✅ Complete! Ready to calculate")
@@ -268,7 +281,7 @@ Now extract from the user's message:"""
         # Generate summary
         summary = self.question_generator.generate_summary_message(filled_fields)
 
-        return {
+        result = {
             "status": "complete",
             "message": summary + "\n\nLet me calculate the appropriate costs...",
             "completeness_score": 1.0,
@@ -277,6 +290,21 @@ Now extract from the user's message:"""
             "validation": validation.to_dict(),
         }
 
+        if explain and self.module_registry and self.result_explainer:
+            module = self.module_registry.get_module(module_id)
+            if module:
+                is_valid, _ = module.validate_fields(filled_fields)
+                if is_valid:
+                    calculation_result = module.calculate(filled_fields)
+                    result["calculation_result"] = calculation_result
+                    result["rich_explanation"] = await self.result_explainer.explain_result(
+                        calculation_result=calculation_result,
+                        filled_fields=filled_fields,
+                        decision_path=None,
+                    )
+
+        return result
+
     async def _handle_gaps(
         self,
         validation: ValidationResult,
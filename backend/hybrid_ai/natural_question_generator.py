@@ -6,12 +6,41 @@ Converts logic tree gaps into natural, conversational questions.
 Part of the Hybrid AI + Logic Tree architecture.
 """
 
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from backend.common_services.gap_detector import Gap, ValidationResult
 from backend.common_services.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Questions for well-known fields
+_FIELD_QUESTIONS = {
+    "court_level": "Which court is handling this case - High Court, District Court, or Magistrates Court?",
+    "case_type": "How was the case resolved? For example, was it a contested trial, default judgment, or summary judgment?",
+    "claim_amount": "What is the total claim amount in Singapore dollars?",
+    "trial_days": "How many days did the trial last?",
+    "claim_nature": "Was the claim for a liquidated sum (a specific amount owed) or unliquidated damages (assessed by the court)?",
+    "represented_status": "Were the defendants represented by lawyers?",
+    "defendant_count": "How many defendants were involved in the case?",
+}
+
+# Display names for well-known fields
+_NATURAL_FIELD_NAMES = {
+    "court_level": "Court",
+    "case_type": "Case type",
+    "claim_amount": "Claim amount",
+    "trial_days": "Trial duration",
+    "claim_nature": "Claim nature",
+    "represented_status": "Representation",
+    "defendant_count": "Number of defendants",
+}
+
+
+@lru_cache(maxsize=256)
+def _natural_field_name(field_name: str) -> str:
+    """Display name for a field, title-casing unknown field names."""
+    return _NATURAL_FIELD_NAMES.get(field_name) or field_name.replace('_', ' ').title()
+
 
 class NaturalQuestionGenerator:
     """
@@ -198,35 +227,16 @@ Generate the response now (just the response text, no preamble):"""
 
     def _gap_to_question(self, gap: Gap) -> str:
         """Convert a gap to a natural question."""
-        field_questions = {
-            "court_level": "Which court is handling this case - High Court, District Court, or Magistrates Court?",
-            "case_type": "How was the case resolved? For example, was it a contested trial, default judgment, or summary judgment?",
-            "claim_amount": "What is the total claim amount in Singapore dollars?",
-            "trial_days": "How many days did the trial last?",
-            "claim_nature": "Was the claim for a liquidated sum (a specific amount owed) or unliquidated damages (assessed by the court)?",
-            "represented_status": "Were the defendants represented by lawyers?",
-            "defendant_count": "How many defendants were involved in the case?",
-        }
-
-        if gap.field_name in field_questions:
-            return field_questions[gap.field_name]
+        question = _FIELD_QUESTIONS.get(gap.field_name)
+        if question:
+            return question
         else:
             # Generic question
             return f"Could you please provide information about {gap.field_name.replace('_', ' ')}?"
 
     def _field_to_natural(self, field_name: str) -> str:
         """Convert field name to natural language."""
-        natural_names = {
-            "court_level": "Court",
-            "case_type": "Case type",
-            "claim_amount": "Claim amount",
-            "trial_days": "Trial duration",
-            "claim_nature": "Claim nature",
-            "represented_status": "Representation",
-            "defendant_count": "Number of defendants",
-        }
-
-        return natural_names.get(field_name, field_name.replace('_', ' ').title())
+        return _natural_field_name(field_name)
 
     def generate_summary_message(self, filled_fields: Dict[str, Any]) -> str:
         """
@@ -19,6 +19,7 @@ from .data_structures import (
     ConversationResponse,
     ConversationSession,
     ConversationStatus,
+    FieldEvaluation,
     FieldRequirement,
     InfoGap,
     LogicTreeNode,
@@ -49,6 +50,7 @@ __all__ = [
     "InfoGap",
     "ModuleMetadata",
     "FieldRequirement",
+    "FieldEvaluation",
     "QuestionTemplate",
     "AIRequest",
     "AIResponse",
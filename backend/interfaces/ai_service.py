@@ -21,6 +21,8 @@ class IAIService(ABC):
     - AIEmulator (for testing)
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def provider(self) -> AIProvider:
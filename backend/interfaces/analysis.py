@@ -11,6 +11,8 @@ from .data_structures import LogicTreeNode
 class IAnalysisEngine(ABC):
     """Analysis engine orchestration"""
 
+    __slots__ = ()
+
     @abstractmethod
     async def analyze(
         self, module: "ILegalModule", filled_fields: Dict[str, Any], enhance_with_ai: bool = True
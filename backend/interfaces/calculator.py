@@ -11,6 +11,8 @@ from .data_structures import MatchResult
 class ICalculator(ABC):
     """Module-specific calculator"""
 
+    __slots__ = ()
+
     @abstractmethod
     async def calculate(
         self, matched_nodes: List[MatchResult], filled_fields: Dict[str, Any]
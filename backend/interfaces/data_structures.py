@@ -5,10 +5,14 @@ Legal Advisory System v5.0
 These are used across all interfaces and modules.
 """
 
+import re
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Deque, Dict, List, Optional, Pattern
 
 # ============================================
 # ENUMS
@@ -115,9 +119,9 @@ class MatchResult:
             raise ValueError("confidence must be between 0.0 and 1.0")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationError:
-    """Validation error details"""
+    """Validation error details (immutable, so instances can be shared)"""
 
     field_name: str
     error_type: str
@@ -186,6 +190,13 @@ class QuestionTemplate:
     context_required: List[str] = field(default_factory=list)
     validation_pattern: Optional[str] = None
 
+    @cached_property
+    def compiled_pattern(self) -> Optional[Pattern[str]]:
+        """Compiled validation_pattern, built on first use (None if unset)"""
+        if self.validation_pattern is None:
+            return None
+        return re.compile(self.validation_pattern)
+
 
 @dataclass
 class AIRequest:
@@ -233,17 +244,32 @@ class MessageRole(Enum):
     SYSTEM = "system"
 
 
-@dataclass
+# Most recent messages retained per session; older ones are dropped
+MAX_SESSION_MESSAGES = 200
+
+
+def _bounded_message_buffer() -> Deque:
+    """Create a ring buffer holding the last MAX_SESSION_MESSAGES entries."""
+    return deque(maxlen=MAX_SESSION_MESSAGES)
+
+
+@dataclass(slots=True)
 class ConversationMessage:
-    """Single message in conversation"""
+    """
+    Single message in conversation.
+
+    Messages outlive the turn that created them (session history, API
+    responses), so they are never pooled or reused; slots keep each
+    allocation small instead.
+    """
 
     role: MessageRole
     content: str
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: int = field(default_factory=time.time_ns)  # ns since epoch
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationSession:
     """
     Session state for ongoing conversation.
@@ -254,8 +280,8 @@ class ConversationSession:
 
     session_id: str
     user_id: str
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: int = field(default_factory=time.time_ns)  # ns since epoch
+    updated_at: int = field(default_factory=time.time_ns)  # ns since epoch
     status: ConversationStatus = ConversationStatus.ACTIVE
 
     # Module selection
@@ -267,8 +293,12 @@ class ConversationSession:
     completeness_score: float = 0.0
     missing_fields: List[str] = field(default_factory=list)
 
-    # Conversation history
-    messages: List[ConversationMessage] = field(default_factory=list)
+    # Conversation history (bounded to the last MAX_SESSION_MESSAGES)
+    messages: Deque[ConversationMessage] = field(default_factory=_bounded_message_buffer)
+
+    # Role/content dicts mirroring messages, appended alongside them so the
+    # history handed to AI services never has to be rebuilt from scratch
+    history: Deque[Dict[str, str]] = field(default_factory=_bounded_message_buffer)
 
     # Analysis results (when complete)
     analysis_result: Optional[Dict[str, Any]] = None
@@ -278,7 +308,7 @@ class ConversationSession:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationResponse:
     """
     Response to user message in conversation.
@@ -305,7 +335,17 @@ class ConversationResponse:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
+class FieldEvaluation:
+    """Validation and completeness of filled fields, computed together"""
+
+    is_valid: bool
+    errors: List[str]
+    completeness_score: float
+    missing_fields: List[str]
+
+
+@dataclass(slots=True)
 class InfoGap:
     """Information gap that needs to be filled"""
 
@@ -6,9 +6,10 @@ All legal modules (Order 21, Order 5, etc.) must implement this interface.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Sequence, Tuple
 
 from .data_structures import (
+    FieldEvaluation,
     FieldRequirement,
     LogicTreeNode,
     MatchResult,
@@ -25,6 +26,8 @@ class ILegalModule(ABC):
     Each module (Order 21, Order 5, Order 19, etc.) implements this interface.
     """
 
+    __slots__ = ()
+
     # ============================================
     # METADATA
     # ============================================
@@ -91,12 +94,15 @@ class ILegalModule(ABC):
     # ============================================
 
     @abstractmethod
-    def get_field_requirements(self) -> List[FieldRequirement]:
+    def get_field_requirements(self) -> Sequence[FieldRequirement]:
         """
         Return list of all fields required by this module.
 
+        Callers must not modify the returned sequence or the requirements
+        in it; modules may return a shared immutable tuple.
+
         Returns:
-            List of FieldRequirement objects
+            Sequence of FieldRequirement objects
 
         Example:
             [
@@ -113,12 +119,12 @@ class ILegalModule(ABC):
         pass
 
     @abstractmethod
-    def get_question_templates(self) -> List[QuestionTemplate]:
+    def get_question_templates(self) -> Sequence[QuestionTemplate]:
         """
         Return template questions for information gathering.
 
         Returns:
-            List of QuestionTemplate objects
+            Sequence of QuestionTemplate objects (not to be modified)
         """
         pass
 
@@ -158,6 +164,28 @@ class ILegalModule(ABC):
         """
         pass
 
+    def evaluate_fields(self, filled_fields: Dict[str, Any]) -> FieldEvaluation:
+        """
+        Validate fields and check completeness in one call.
+
+        Modules whose validation and completeness checks share work
+        should override this to do it once.
+
+        Args:
+            filled_fields: Currently filled fields
+
+        Returns:
+            FieldEvaluation with validation errors and missing fields
+        """
+        is_valid, errors = self.validate_fields(filled_fields)
+        completeness_score, missing_fields = self.check_completeness(filled_fields)
+        return FieldEvaluation(
+            is_valid=is_valid,
+            errors=errors,
+            completeness_score=completeness_score,
+            missing_fields=missing_fields,
+        )
+
     # ============================================
     # SPECIALIZED LOGIC (100% Accurate)
     # ============================================
@@ -11,6 +11,8 @@ from .data_structures import LogicTreeNode, MatchResult
 class IMatchingEngine(ABC):
     """Matching engine for finding relevant tree nodes"""
 
+    __slots__ = ()
+
     @abstractmethod
     async def match(
         self, tree_nodes: List[LogicTreeNode], filled_fields: Dict[str, Any], threshold: float = 0.6
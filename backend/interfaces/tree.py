@@ -11,6 +11,8 @@ from .data_structures import LogicTreeNode
 class ITreeFramework(ABC):
     """Tree framework for managing logic trees"""
 
+    __slots__ = ()
+
     @abstractmethod
     def build_tree(self, rules: List[Dict[str, Any]]) -> List[LogicTreeNode]:
         """Build tree from rules"""
@@ -11,6 +11,8 @@ from .data_structures import ValidationError
 class IValidator(ABC):
     """Validator for AI outputs and user inputs"""
 
+    __slots__ = ()
+
     @abstractmethod
     async def validate(
         self, data: Dict[str, Any], schema: Dict[str, Any]
@@ -10,10 +10,12 @@ This module provides 100% accurate cost calculations based on:
 - Appendix G Practice Directions (detailed costs for summonses, trials, appeals, and specific applications)
 """
 
-from typing import Any, Dict, List, Tuple
-from datetime import datetime
+from bisect import bisect_left
+from typing import Any, Dict, List, Sequence, Tuple
+from datetime import datetime, timezone
 
 from backend.interfaces import (
+    FieldEvaluation,
     FieldRequirement,
     ILegalModule,
     LogicTreeNode,
@@ -25,6 +27,77 @@ from backend.modules.order_21.tree_data import get_all_order21_nodes
 from backend.modules.order_21.case_law_manager import get_case_law_manager
 
 
+# Fields needed for any calculation, and fields that improve it
+_REQUIRED_FIELDS = ("court_level", "case_type", "claim_amount")
+_RECOMMENDED_FIELDS = ("complexity_level", "basis_of_taxation", "party_type")
+
+# ============================================
+# APPENDIX 1 COST SCALES (High Court base)
+# ============================================
+# Each scale is (upper claim-amount bounds, tiers); tier i applies when the
+# claim amount is <= bounds[i], the last tier applies above every bound.
+# Tiers are (base_cost, min_cost, max_cost, calculation_basis).
+
+_CLAIM_AMOUNT_SCALES: Dict[str, Tuple[Tuple[float, ...], Tuple[Tuple[float, float, float, str], ...]]] = {
+    # Default judgment - liquidated claim
+    "default_judgment_liquidated": (
+        (5000, 20000, 60000, 250000),
+        (
+            (1150.0, 800.0, 1500.0, "Order 21, Appendix 1, Section B, Para 1 (≤$5,000)"),
+            (2250.0, 1500.0, 3000.0, "Order 21, Appendix 1, Section B, Para 1 ($5,001-$20,000)"),
+            (4000.0, 3000.0, 5000.0, "Order 21, Appendix 1, Section B, Para 1 ($20,001-$60,000)"),
+            (7500.0, 5000.0, 10000.0, "Order 21, Appendix 1, Section B, Para 1 ($60,001-$250,000)"),
+            (12500.0, 10000.0, 15000.0, "Order 21, Appendix 1, Section B, Para 1 (>$250,000)"),
+        ),
+    ),
+    # Default judgment - unliquidated claim (with assessment)
+    "default_judgment_unliquidated": (
+        (20000, 60000),
+        (
+            (3000.0, 2000.0, 4000.0, "Order 21, Appendix 1, Section B, Para 2 (≤$20,000)"),
+            (5500.0, 4000.0, 7000.0, "Order 21, Appendix 1, Section B, Para 2 ($20,001-$60,000)"),
+            (9500.0, 7000.0, 12000.0, "Order 21, Appendix 1, Section B, Para 2 (>$60,000)"),
+        ),
+    ),
+}
+
+# Contested trial: upper trial-day bounds (1-2, 3-5, 6+ days), each with a claim amount scale
+_TRIAL_DAY_BOUNDS = (2, 5)
+_TRIAL_SCALES = (
+    (
+        (60000, 250000),
+        (
+            (11500.0, 8000.0, 15000.0, "Order 21, Appendix 1, Section D - Trial 1-2 days (≤$60k)"),
+            (22500.0, 15000.0, 30000.0, "Order 21, Appendix 1, Section D - Trial 1-2 days ($60k-$250k)"),
+            (40000.0, 30000.0, 50000.0, "Order 21, Appendix 1, Section D - Trial 1-2 days (>$250k)"),
+        ),
+    ),
+    (
+        (60000, 250000),
+        (
+            (22500.0, 15000.0, 30000.0, "Order 21, Appendix 1, Section D - Trial 3-5 days (≤$60k)"),
+            (45000.0, 30000.0, 60000.0, "Order 21, Appendix 1, Section D - Trial 3-5 days ($60k-$250k)"),
+            (80000.0, 60000.0, 100000.0, "Order 21, Appendix 1, Section D - Trial 3-5 days (>$250k)"),
+        ),
+    ),
+    (
+        (60000, 250000),
+        (
+            (40000.0, 30000.0, 50000.0, "Order 21, Appendix 1, Section D - Trial 6+ days (≤$60k)"),
+            (75000.0, 50000.0, 100000.0, "Order 21, Appendix 1, Section D - Trial 6+ days ($60k-$250k)"),
+            (150000.0, 100000.0, 200000.0, "Order 21, Appendix 1, Section D - Trial 6+ days (>$250k)"),
+        ),
+    ),
+)
+
+# Contested trial base cost multipliers by complexity (moderate = 1.0)
+_TRIAL_COMPLEXITY_FACTORS = {
+    "simple": 0.8,
+    "complex": 1.2,
+    "very_complex": 1.4,
+}
+
+
 class Order21Module(ILegalModule):
     """
     Order 21 Module - Party-and-Party Costs Calculator
@@ -37,6 +110,10 @@ class Order21Module(ILegalModule):
         """Initialize Order 21 module with pre-built logic tree"""
         self._tree_nodes = get_all_order21_nodes()
         self._tree_version = "1.0.0"
+        # Static per module; built once and copied out to callers
+        # Built once and handed out as shared tuples (see ILegalModule)
+        self._field_requirements = tuple(self._build_field_requirements())
+        self._question_templates = tuple(self._build_question_templates())
 
     # ============================================
     # METADATA
@@ -81,8 +158,13 @@ class Order21Module(ILegalModule):
     # FIELD REQUIREMENTS
     # ============================================
 
-    def get_field_requirements(self) -> List[FieldRequirement]:
-        """Return list of all fields required by Order 21 calculations"""
+    def get_field_requirements(self) -> Sequence[FieldRequirement]:
+        """Return all fields required by Order 21 calculations (shared, read-only)"""
+        return self._field_requirements
+
+    @staticmethod
+    def _build_field_requirements() -> List[FieldRequirement]:
+        """Build the Order 21 field requirements"""
         return [
             FieldRequirement(
                 field_name="court_level",
@@ -166,8 +248,13 @@ class Order21Module(ILegalModule):
             ),
         ]
 
-    def get_question_templates(self) -> List[QuestionTemplate]:
-        """Return template questions for information gathering"""
+    def get_question_templates(self) -> Sequence[QuestionTemplate]:
+        """Return template questions for information gathering (shared, read-only)"""
+        return self._question_templates
+
+    @staticmethod
+    def _build_question_templates() -> List[QuestionTemplate]:
+        """Build the Order 21 question templates"""
         return [
             QuestionTemplate(
                 field_name="court_level",
@@ -218,15 +305,67 @@ class Order21Module(ILegalModule):
             filled_fields: Dictionary of field_name -> value
 
         Returns:
-            Tuple of (is_valid: bool, errors: List[str])
+            Tuple of (is_valid, errors)
         """
-        errors = []
+        return self._validate_fields(filled_fields, self._missing_required(filled_fields))
 
-        # Required fields
-        required = ["court_level", "case_type", "claim_amount"]
-        for field in required:
-            if field not in filled_fields or filled_fields[field] is None:
-                errors.append(f"{field} is required")
+    def check_completeness(self, filled_fields: Dict[str, Any]) -> Tuple[float, List[str]]:
+        """
+        Calculate information completeness and identify missing fields.
+
+        Args:
+            filled_fields: Currently filled fields
+
+        Returns:
+            Tuple of (completeness_score, missing_fields)
+            - completeness_score: Float between 0.0 and 1.0
+            - missing_fields: List of field names that are missing
+        """
+        return self._check_completeness(filled_fields, self._missing_required(filled_fields))
+
+    def evaluate_fields(self, filled_fields: Dict[str, Any]) -> FieldEvaluation:
+        """
+        Validate fields and check completeness, scanning required fields once.
+
+        Args:
+            filled_fields: Currently filled fields
+
+        Returns:
+            FieldEvaluation with validation errors and missing fields
+        """
+        missing_required = self._missing_required(filled_fields)
+        is_valid, errors = self._validate_fields(filled_fields, missing_required)
+        completeness_score, missing_fields = self._check_completeness(
+            filled_fields, missing_required
+        )
+        return FieldEvaluation(
+            is_valid=is_valid,
+            errors=errors,
+            completeness_score=completeness_score,
+            missing_fields=missing_fields,
+        )
+
+    @staticmethod
+    def _required_fields(filled_fields: Dict[str, Any]) -> Tuple[str, ...]:
+        """Required fields; trial_days becomes required for contested trials"""
+        if filled_fields.get("case_type") == "contested_trial":
+            return _REQUIRED_FIELDS + ("trial_days",)
+        return _REQUIRED_FIELDS
+
+    def _missing_required(self, filled_fields: Dict[str, Any]) -> List[str]:
+        """Required fields that are absent or None, in order"""
+        return [
+            f for f in self._required_fields(filled_fields) if filled_fields.get(f) is None
+        ]
+
+    @staticmethod
+    def _validate_fields(
+        filled_fields: Dict[str, Any], missing_required: List[str]
+    ) -> Tuple[bool, List[str]]:
+        """Validation rules, given the missing required fields"""
+        errors = [
+            f"{field} is required" for field in missing_required if field != "trial_days"
+        ]
 
         # Validate court_level
         if "court_level" in filled_fields:
@@ -267,64 +406,28 @@ class Order21Module(ILegalModule):
                 errors.append("trial_days must be a valid integer")
 
         # If contested trial, require trial_days
-        if filled_fields.get("case_type") == "contested_trial":
-            if "trial_days" not in filled_fields or filled_fields["trial_days"] is None:
-                errors.append("trial_days is required for contested trials")
+        if "trial_days" in missing_required:
+            errors.append("trial_days is required for contested trials")
 
         return len(errors) == 0, errors
 
-    def check_completeness(self, filled_fields: Dict[str, Any]) -> Tuple[float, List[str]]:
-        """
-        Calculate information completeness and identify missing fields.
-
-        Args:
-            filled_fields: Currently filled fields
-
-        Returns:
-            Tuple of (completeness_score, missing_fields)
-            - completeness_score: Float between 0.0 and 1.0
-            - missing_fields: List of field names that are missing
-        """
-        # Required fields
-        required = ["court_level", "case_type", "claim_amount"]
-
-        # Optional but recommended fields
-        recommended = ["complexity_level", "basis_of_taxation", "party_type"]
-
-        # For contested trials, trial_days becomes required
-        if filled_fields.get("case_type") == "contested_trial":
-            required.append("trial_days")
-
-        # Count filled required fields
-        filled_required = sum(
-            1 for f in required if f in filled_fields and filled_fields[f] is not None
-        )
-        filled_recommended = sum(
-            1
-            for f in recommended
-            if f in filled_fields and filled_fields[f] is not None
-        )
+    def _check_completeness(
+        self, filled_fields: Dict[str, Any], missing_required: List[str]
+    ) -> Tuple[float, List[str]]:
+        """Completeness score, given the missing required fields"""
+        required_count = len(self._required_fields(filled_fields))
+        filled_required = required_count - len(missing_required)
+        missing_recommended = [
+            f for f in _RECOMMENDED_FIELDS if filled_fields.get(f) is None
+        ]
+        filled_recommended = len(_RECOMMENDED_FIELDS) - len(missing_recommended)
 
         # Calculate score: 70% weight on required, 30% on recommended
-        required_score = filled_required / len(required) if required else 1.0
-        recommended_score = (
-            filled_recommended / len(recommended) if recommended else 1.0
-        )
+        required_score = filled_required / required_count
+        recommended_score = filled_recommended / len(_RECOMMENDED_FIELDS)
         completeness_score = 0.7 * required_score + 0.3 * recommended_score
 
-        # Identify missing fields
-        missing = [
-            f for f in required if f not in filled_fields or filled_fields[f] is None
-        ]
-        missing.extend(
-            [
-                f
-                for f in recommended
-                if f not in filled_fields or filled_fields[f] is None
-            ]
-        )
-
-        return completeness_score, missing
+        return completeness_score, missing_required + missing_recommended
 
     # ============================================
     # SPECIALIZED LOGIC (100% Accurate)
@@ -490,7 +593,7 @@ class Order21Module(ILegalModule):
             "assumptions": assumptions,
             "rules_applied": rules_applied,
             "confidence": "high",  # 100% accurate deterministic calculation
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             # Case law
             "case_law": case_law,
         }
@@ -508,87 +611,26 @@ class Order21Module(ILegalModule):
         Returns:
             Tuple of (base_cost, min_cost, max_cost, calculation_basis)
         """
-        # Default judgment - liquidated claim
-        if case_type == "default_judgment_liquidated":
-            if claim_amount <= 5000:
-                return 1150.0, 800.0, 1500.0, "Order 21, Appendix 1, Section B, Para 1 (≤$5,000)"
-            elif claim_amount <= 20000:
-                return 2250.0, 1500.0, 3000.0, "Order 21, Appendix 1, Section B, Para 1 ($5,001-$20,000)"
-            elif claim_amount <= 60000:
-                return 4000.0, 3000.0, 5000.0, "Order 21, Appendix 1, Section B, Para 1 ($20,001-$60,000)"
-            elif claim_amount <= 250000:
-                return 7500.0, 5000.0, 10000.0, "Order 21, Appendix 1, Section B, Para 1 ($60,001-$250,000)"
-            else:
-                return 12500.0, 10000.0, 15000.0, "Order 21, Appendix 1, Section B, Para 1 (>$250,000)"
-
-        # Default judgment - unliquidated claim (with assessment)
-        elif case_type == "default_judgment_unliquidated":
-            if claim_amount <= 20000:
-                return 3000.0, 2000.0, 4000.0, "Order 21, Appendix 1, Section B, Para 2 (≤$20,000)"
-            elif claim_amount <= 60000:
-                return 5500.0, 4000.0, 7000.0, "Order 21, Appendix 1, Section B, Para 2 ($20,001-$60,000)"
-            else:
-                return 9500.0, 7000.0, 12000.0, "Order 21, Appendix 1, Section B, Para 2 (>$60,000)"
+        # Default judgment scales: tier lookup by claim amount
+        scale = _CLAIM_AMOUNT_SCALES.get(case_type)
+        if scale is not None:
+            bounds, tiers = scale
+            return tiers[bisect_left(bounds, claim_amount)]
 
         # Summary judgment
-        elif case_type == "summary_judgment":
+        if case_type == "summary_judgment":
             return 7500.0, 5000.0, 10000.0, "Order 21, Appendix 1, Section C - Summary Judgment"
 
         # Contested trial
         elif case_type == "contested_trial":
             days = int(trial_days) if trial_days else 2
 
-            # Determine trial duration category
-            if days <= 2:
-                # 1-2 day trial
-                if claim_amount <= 60000:
-                    base = 11500.0
-                    min_cost, max_cost = 8000.0, 15000.0
-                    basis = "Order 21, Appendix 1, Section D - Trial 1-2 days (≤$60k)"
-                elif claim_amount <= 250000:
-                    base = 22500.0
-                    min_cost, max_cost = 15000.0, 30000.0
-                    basis = "Order 21, Appendix 1, Section D - Trial 1-2 days ($60k-$250k)"
-                else:
-                    base = 40000.0
-                    min_cost, max_cost = 30000.0, 50000.0
-                    basis = "Order 21, Appendix 1, Section D - Trial 1-2 days (>$250k)"
-            elif days <= 5:
-                # 3-5 day trial
-                if claim_amount <= 60000:
-                    base = 22500.0
-                    min_cost, max_cost = 15000.0, 30000.0
-                    basis = "Order 21, Appendix 1, Section D - Trial 3-5 days (≤$60k)"
-                elif claim_amount <= 250000:
-                    base = 45000.0
-                    min_cost, max_cost = 30000.0, 60000.0
-                    basis = "Order 21, Appendix 1, Section D - Trial 3-5 days ($60k-$250k)"
-                else:
-                    base = 80000.0
-                    min_cost, max_cost = 60000.0, 100000.0
-                    basis = "Order 21, Appendix 1, Section D - Trial 3-5 days (>$250k)"
-            else:
-                # 6+ day trial
-                if claim_amount <= 60000:
-                    base = 40000.0
-                    min_cost, max_cost = 30000.0, 50000.0
-                    basis = "Order 21, Appendix 1, Section D - Trial 6+ days (≤$60k)"
-                elif claim_amount <= 250000:
-                    base = 75000.0
-                    min_cost, max_cost = 50000.0, 100000.0
-                    basis = "Order 21, Appendix 1, Section D - Trial 6+ days ($60k-$250k)"
-                else:
-                    base = 150000.0
-                    min_cost, max_cost = 100000.0, 200000.0
-                    basis = "Order 21, Appendix 1, Section D - Trial 6+ days (>$250k)"
+            # Determine trial duration category, then claim amount tier
+            bounds, tiers = _TRIAL_SCALES[bisect_left(_TRIAL_DAY_BOUNDS, days)]
+            base, min_cost, max_cost, basis = tiers[bisect_left(bounds, claim_amount)]
 
             # Apply complexity adjustment
-            if complexity == "simple":
-                base *= 0.8
-            elif complexity == "complex":
-                base *= 1.2
-            elif complexity == "very_complex":
-                base *= 1.4
+            base *= _TRIAL_COMPLEXITY_FACTORS.get(complexity, 1.0)
 
             return base, min_cost, max_cost, basis
 
@@ -0,0 +1,45 @@
+"""
+Tests for Gap Detector
+Legal Advisory System v5.0
+"""
+
+import pytest
+
+from backend.common_services import module_registry
+from backend.common_services.gap_detector import GapDetector
+from backend.emulators.mock_legal_module import MockLegalModule
+
+
+class StubRegistry:
+    """Registry that serves one mock module"""
+
+    def get_module(self, module_id):
+        return MockLegalModule() if module_id == "MOCK_MODULE" else None
+
+
+@pytest.fixture
+def gap_detector(monkeypatch):
+    """Create a gap detector backed by the stub registry"""
+    monkeypatch.setattr(module_registry, "get_global_registry", lambda: StubRegistry())
+    return GapDetector(logic_tree_framework=None)
+
+
+def test_gaps_report_missing_required_fields(gap_detector):
+    """Test each missing required field becomes a gap"""
+    result = gap_detector.validate_against_tree("MOCK_MODULE", {"case_type": "civil"})
+
+    assert [g.field_name for g in result.gaps] == ["amount_claimed", "court_level"]
+    assert result.completeness_score == pytest.approx(1 / 3)
+    assert result.can_calculate is False
+
+
+def test_gap_contexts_cannot_affect_each_other(gap_detector):
+    """Test the already-filled fields shared by gaps are immutable"""
+    result = gap_detector.validate_against_tree("MOCK_MODULE", {"case_type": "civil"})
+    first, second = result.gaps
+
+    assert first.context["already_filled"] == ("case_type",)
+    with pytest.raises(AttributeError):
+        first.context["already_filled"].append("court_level")
+    first.context["already_filled"] = ()
+    assert second.context["already_filled"] == ("case_type",)
@@ -237,3 +237,29 @@ class TestPatternExtractorRobustness:
         extracted = self.extractor.extract_all(text)
         assert extracted["court_level"] == "High Court"
         assert extracted["claim_amount"] == 50000.0
+
+    def test_overlapping_patterns_keep_table_priority(self):
+        """Test the fused prefilter does not change which pattern wins."""
+        # "pre-trial" also contains "trial"; table order must still decide
+        assert self.extractor.extract_trial_phase("pre-trial review") == "pre_trial"
+        assert self.extractor.extract_application_type(
+            "summary judgment granted after adjournment"
+        ) == "adjournment"
+
+    def test_text_without_digits_skips_numeric_fields(self):
+        """Test numeric fields are only extracted when the text has digits."""
+        extracted = self.extractor.extract_all("High Court contested trial, liquidated claim")
+        assert "claim_amount" not in extracted
+        assert "trial_days" not in extracted
+        assert "duration_minutes" not in extracted
+
+        extracted = self.extractor.extract_all("High Court 3 day trial for $50,000, 2 hours hearing")
+        assert extracted["claim_amount"] == 50000.0
+        assert extracted["trial_days"] == 3
+        assert extracted["duration_minutes"] == 120
+
+    def test_single_pass_scan_keeps_table_priority(self):
+        """Test the keyed scan returns the earliest table entry, not the leftmost hit."""
+        assert self.extractor.extract_court_level("dc or high court?") == "High Court"
+        assert self.extractor.extract_claim_nature("unliquidated, then liquidated") == "liquidated"
+        assert self.extractor.extract_claim_nature("unliquidated damages") == "unliquidated"
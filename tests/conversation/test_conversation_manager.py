@@ -3,12 +3,20 @@ Tests for Conversation Manager
 Legal Advisory System v5.0
 """
 
+import asyncio
+import threading
+
 import pytest
 from backend.common_services.analysis_engine import AnalysisEngine
 from backend.common_services.logic_tree_framework import LogicTreeFramework
 from backend.common_services.matching_engine import UniversalMatchingEngine
 from backend.common_services.module_registry import ModuleRegistry
+from backend.common_services.pattern_extractor import (
+    DEFAULT_PATTERN_EXTRACTOR,
+    PatternExtractor,
+)
 from backend.conversation import ConversationManager
+from backend.conversation.session_store import InMemorySessionStore
 from backend.hybrid_ai import ClaudeAIService, HybridAIOrchestrator
 from backend.interfaces import ConversationStatus
 from backend.modules.order_21 import Order21Module
@@ -69,6 +77,7 @@ def test_create_session(conversation_manager):
     session = conversation_manager.create_session(user_id="user_123")
 
     assert session.session_id is not None
+    assert len(session.session_id) == 32
     assert session.user_id == "user_123"
     assert session.status == ConversationStatus.ACTIVE
     assert len(session.filled_fields) == 0
@@ -127,6 +136,9 @@ def test_list_sessions(conversation_manager):
     assert len(user1_sessions) == 2
     assert all(s.user_id == "user_1" for s in user1_sessions)
 
+    # Unknown user
+    assert conversation_manager.list_sessions(user_id="user_3") == []
+
 
 # ============================================
 # MESSAGE PROCESSING TESTS
@@ -209,6 +221,38 @@ async def test_information_extraction_claim_amount(conversation_manager):
     assert updated_session.filled_fields.get("claim_amount") == 50000.0
 
 
+@pytest.mark.asyncio
+async def test_simple_extract(conversation_manager):
+    """Test pattern extraction fills session fields"""
+    session = conversation_manager.create_session(user_id="user_123")
+
+    await conversation_manager._simple_extract("High Court claim of $50,000", session)
+    await conversation_manager._simple_extract("yes", session)
+
+    assert session.filled_fields == {"court_level": "High Court", "claim_amount": 50000.0}
+
+
+@pytest.mark.asyncio
+async def test_simple_extract_combines_case_type(conversation_manager):
+    """Test default judgment + claim nature combine into one case type"""
+    session = conversation_manager.create_session(user_id="user_123")
+
+    await conversation_manager._simple_extract("Default judgment, unliquidated claim", session)
+
+    assert session.filled_fields["case_type"] == "default_judgment_unliquidated"
+
+
+@pytest.mark.asyncio
+async def test_simple_extract_memoizes_normalized_message(conversation_manager):
+    """Test repeated messages reuse the cached extraction"""
+    session = conversation_manager.create_session(user_id="user_123")
+
+    await conversation_manager._simple_extract("High Court", session)
+    await conversation_manager._simple_extract("  HIGH COURT ", session)
+
+    assert conversation_manager._cached_extract_all.cache_info().hits == 1
+
+
 @pytest.mark.asyncio
 async def test_message_history_tracking(conversation_manager):
     """Test that messages are tracked in history"""
@@ -229,6 +273,52 @@ async def test_message_history_tracking(conversation_manager):
     assert len(updated_session.messages) >= 4  # 2 user + 2 assistant minimum
 
 
+@pytest.mark.asyncio
+async def test_history_mirrors_messages(conversation_manager):
+    """Test that serialized history is kept in step with messages"""
+    session = conversation_manager.create_session(user_id="user_123")
+
+    await conversation_manager.process_message(
+        user_message="First message", session_id=session.session_id
+    )
+
+    updated_session = conversation_manager.get_session(session.session_id)
+    assert len(updated_session.history) == len(updated_session.messages)
+    assert updated_session.history[0] == {"role": "user", "content": "First message"}
+    assert updated_session.history[1]["role"] == "assistant"
+
+
+@pytest.mark.asyncio
+async def test_turn_uses_single_timestamp(conversation_manager):
+    """Test both messages and the save share one timestamp per turn"""
+    session = conversation_manager.create_session(user_id="user_123")
+
+    await conversation_manager.process_message(
+        user_message="First message", session_id=session.session_id
+    )
+
+    user_msg, assistant_msg = session.messages
+    assert user_msg.timestamp == assistant_msg.timestamp == session.updated_at
+    assert session.updated_at >= session.created_at
+
+
+@pytest.mark.asyncio
+async def test_message_history_is_bounded(conversation_manager):
+    """Test sessions keep only the most recent messages"""
+    from backend.interfaces.data_structures import MAX_SESSION_MESSAGES
+
+    session = conversation_manager.create_session(user_id="user_123")
+    for i in range(MAX_SESSION_MESSAGES // 2 + 1):
+        await conversation_manager.process_message(
+            user_message=f"Message {i}", session_id=session.session_id
+        )
+
+    assert len(session.messages) == MAX_SESSION_MESSAGES
+    assert len(session.history) == MAX_SESSION_MESSAGES
+    assert session.messages[0].content != "Message 0"
+    assert len(conversation_manager._recent_history(session, 5)) == 5
+
+
 # ============================================
 # COMPLETE CONVERSATION FLOW TESTS
 # ============================================
@@ -297,6 +387,104 @@ async def test_conversation_with_all_fields(conversation_manager):
     assert final_session.filled_fields.get("claim_amount") == 75000.0
 
 
+@pytest.mark.asyncio
+async def test_ask_for_information_uses_template(conversation_manager):
+    """Test that the first missing required field is asked via its template"""
+    session = conversation_manager.create_session(user_id="user_123")
+    session.module_id = "ORDER_21"
+    session.filled_fields = {"court_level": "High Court"}
+
+    response = await conversation_manager._ask_for_information(session)
+
+    assert response.next_action == "ask_question"
+    assert "type of case" in response.message
+    assert response.questions == [response.message]
+
+
+@pytest.mark.asyncio
+async def test_completing_turn_explains_once(conversation_manager, monkeypatch):
+    """Test that a completing turn calculates and explains exactly once"""
+    explainer = conversation_manager._result_explainer
+    original_explain = explainer.explain_result
+    calls = []
+
+    async def counting_explain(**kwargs):
+        calls.append(kwargs)
+        return await original_explain(**kwargs)
+
+    monkeypatch.setattr(explainer, "explain_result", counting_explain)
+
+    session = conversation_manager.create_session(user_id="user_123")
+    session.filled_fields["case_type"] = "default_judgment_liquidated"
+
+    response = await conversation_manager.process_message(
+        user_message="High Court claim of $50,000", session_id=session.session_id
+    )
+
+    assert response.status == ConversationStatus.COMPLETE
+    assert response.result["calculation"] is not None
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_perform_analysis_generates_explanation(conversation_manager):
+    """Test analysis builds explanation alongside arguments and recommendations"""
+    session = conversation_manager.create_session(user_id="user_123")
+    session.module_id = "ORDER_21"
+    session.filled_fields = {
+        "court_level": "High Court",
+        "case_type": "default_judgment_liquidated",
+        "claim_amount": 50000.0,
+    }
+
+    response = await conversation_manager._perform_analysis(session)
+
+    assert response.status == ConversationStatus.COMPLETE
+    assert "LEGAL BASIS" in response.message
+    assert set(response.result) == {"calculation", "arguments", "recommendations"}
+    assert response.message.endswith("Would you like more details on any aspect of these costs?")
+    if response.result["recommendations"]:
+        recs = response.message.split("**RECOMMENDATIONS:**\n", 1)[1].split("\n\n", 1)[0]
+        assert recs.splitlines()[0] == f"• {response.result['recommendations'][0]}"
+        assert len(recs.splitlines()) <= 3
+
+
+@pytest.mark.asyncio
+async def test_perform_analysis_error_cancels_explanation(
+    conversation_manager, order21_module, monkeypatch
+):
+    """Test a failure building arguments cancels the explanation and propagates unwrapped"""
+    session = conversation_manager.create_session(user_id="user_123")
+    session.module_id = "ORDER_21"
+    session.filled_fields = {
+        "court_level": "High Court",
+        "case_type": "default_judgment_liquidated",
+        "claim_amount": 50000.0,
+    }
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def slow_explain(**kwargs):
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    def failing_arguments(*args):
+        raise ValueError("bad arguments")
+
+    monkeypatch.setattr(conversation_manager._result_explainer, "explain_result", slow_explain)
+    monkeypatch.setattr(order21_module, "get_arguments", failing_arguments)
+
+    with pytest.raises(ValueError):
+        await conversation_manager._perform_analysis(session)
+
+    await asyncio.sleep(0)
+    assert started.is_set() and cancelled.is_set()
+
+
 # ============================================
 # MODULE SELECTION TESTS
 # ============================================
@@ -337,6 +525,33 @@ async def test_error_handling(conversation_manager):
     assert response.status == ConversationStatus.ERROR
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error_class", [TimeoutError, asyncio.TimeoutError])
+async def test_expected_error_sets_error_status(
+    conversation_manager, monkeypatch, caplog, error_class
+):
+    """Test expected errors return an error response without a traceback"""
+    session = conversation_manager.create_session(user_id="user_123")
+
+    async def failing_turn(**kwargs):
+        raise error_class("AI service timed out")
+
+    monkeypatch.setattr(
+        conversation_manager._hybrid_turn_manager, "process_turn", failing_turn
+    )
+
+    response = await conversation_manager.process_message(
+        user_message="Hello", session_id=session.session_id
+    )
+
+    assert response.status == ConversationStatus.ERROR
+    assert response.metadata["error"] == "AI service timed out"
+    assert session.status == ConversationStatus.ERROR
+    assert all(record.exc_info is None for record in caplog.records)
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(session.session_id in m and "AI service timed out" in m for m in messages)
+
+
 # ============================================
 # STATISTICS TESTS
 # ============================================
@@ -355,6 +570,74 @@ def test_statistics_tracking(conversation_manager):
     assert stats["active_sessions"] >= 2
 
 
+def test_status_counts_with_shared_store_never_go_negative(
+    hybrid_ai, analysis_engine, module_registry
+):
+    """Test a worker changing another worker's session reports no negative counts"""
+    shared = InMemorySessionStore()
+    creator = ConversationManager(hybrid_ai, analysis_engine, module_registry, session_store=shared)
+    other = ConversationManager(hybrid_ai, analysis_engine, module_registry, session_store=shared)
+    session = creator.create_session(user_id="user_1")
+
+    other._set_status(other.get_session(session.session_id), ConversationStatus.COMPLETE)
+    stats = other.get_statistics()
+
+    assert stats["active_sessions"] == 0
+    assert stats["sessions_by_status"] == {"complete": 1}
+    assert stats["total_sessions_stored"] == 1
+
+
+class ThreadRecordingStore(InMemorySessionStore):
+    """Store marked as blocking that records which thread each call runs on"""
+
+    blocking = True
+
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def get(self, session_id):
+        self.threads.append(threading.get_ident())
+        return super().get(session_id)
+
+    def set(self, session):
+        self.threads.append(threading.get_ident())
+        super().set(session)
+
+
+@pytest.mark.asyncio
+async def test_blocking_store_is_called_off_the_event_loop(
+    hybrid_ai, analysis_engine, module_registry
+):
+    """Test process_message runs a blocking store's get and set in a worker thread"""
+    store = ThreadRecordingStore()
+    manager = ConversationManager(hybrid_ai, analysis_engine, module_registry, session_store=store)
+    session = manager.create_session(user_id="user_1")
+    store.threads.clear()
+
+    await manager.process_message("I need help with costs", session.session_id)
+
+    assert len(store.threads) == 2
+    assert threading.get_ident() not in store.threads
+
+
+@pytest.mark.asyncio
+async def test_active_sessions_statistics_follow_status(conversation_manager):
+    """Test active session count tracks status changes"""
+    session = conversation_manager.create_session(user_id="user_1")
+    conversation_manager.create_session(user_id="user_2")
+    assert conversation_manager.get_statistics()["active_sessions"] == 2
+
+    await conversation_manager._select_module(session)
+
+    assert session.status == ConversationStatus.INFORMATION_GATHERING
+    assert conversation_manager.get_statistics()["active_sessions"] == 1
+    assert conversation_manager.get_statistics()["sessions_by_status"] == {
+        "active": 1,
+        "information_gathering": 1,
+    }
+
+
 @pytest.mark.asyncio
 async def test_message_count_statistics(conversation_manager):
     """Test message count tracking"""
@@ -435,3 +718,54 @@ def test_conversation_manager_initialization(
     assert manager._analysis_engine is not None
     assert manager._module_registry is not None
     assert len(manager._sessions) == 0
+
+
+def test_pattern_extractor_shared_by_default(hybrid_ai, analysis_engine, module_registry):
+    """Test managers share the process-wide extractor unless one is injected"""
+    first = ConversationManager(hybrid_ai, analysis_engine, module_registry)
+    second = ConversationManager(hybrid_ai, analysis_engine, module_registry)
+    custom = PatternExtractor()
+    injected = ConversationManager(
+        hybrid_ai, analysis_engine, module_registry, pattern_extractor=custom
+    )
+
+    assert first._pattern_extractor is DEFAULT_PATTERN_EXTRACTOR
+    assert second._pattern_extractor is DEFAULT_PATTERN_EXTRACTOR
+    assert injected._pattern_extractor is custom
+
+
+def test_injected_session_store(hybrid_ai, analysis_engine, module_registry):
+    """Test sessions are kept in an injected store"""
+    store = InMemorySessionStore()
+    manager = ConversationManager(
+        hybrid_ai, analysis_engine, module_registry, session_store=store
+    )
+
+    session = manager.create_session(user_id="user_1")
+
+    assert store.get(session.session_id) is session
+    assert manager.list_sessions(user_id="user_1") == [session]
+
+
+@pytest.mark.asyncio
+async def test_extract_information_fills_fields(conversation_manager):
+    """Test extraction updates fields without needing a selected module"""
+    session = conversation_manager.create_session(user_id="user_123")
+
+    await conversation_manager._extract_information("High Court claim of $50,000", session)
+
+    assert session.filled_fields["court_level"] == "High Court"
+    assert session.filled_fields["claim_amount"] == 50000.0
+
+
+def test_evicted_sessions_leave_statistics(conversation_manager):
+    """Test sessions evicted from the in-memory store stop counting as active"""
+    conversation_manager._sessions._max_sessions = 1
+
+    conversation_manager.create_session(user_id="user_1")
+    conversation_manager.create_session(user_id="user_2")
+
+    stats = conversation_manager.get_statistics()
+    assert stats["active_sessions"] == 1
+    assert stats["total_sessions_stored"] == 1
+    assert stats["total_sessions"] == 2
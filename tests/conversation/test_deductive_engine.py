@@ -5,6 +5,7 @@ Legal Advisory System v5.0
 
 import pytest
 from backend.conversation import DeductiveQuestioningEngine
+from backend.conversation.deductive_engine import QuestioningStrategy, UserFriendlyStrategy
 from backend.interfaces import (
     ConversationSession,
     ConversationStatus,
@@ -290,6 +291,122 @@ def test_invalid_strategy_uses_default(
     assert question is not None  # Should still work with default
 
 
+@pytest.mark.parametrize("strategy_name", ["high_impact", "user_friendly", "rapid"])
+def test_cached_order_matches_sorting_gaps(
+    questioning_engine, sample_session, sample_field_requirements, strategy_name
+):
+    """Test the per-module cached ordering gives the same gaps as sorting per call"""
+    sample_session.module_id = "ORDER_21"
+    strategy = questioning_engine.strategies[strategy_name]
+
+    for filled in ({}, {"court_level": "High Court"}, {"case_type": "trial", "claim_amount": None}):
+        sample_session.filled_fields = filled
+        expected = strategy.prioritize_gaps(
+            questioning_engine.analyze_gaps(filled, sample_field_requirements)
+        )
+
+        cached = questioning_engine._prioritized_gaps(
+            sample_session, sample_field_requirements, strategy_name
+        )
+
+        assert [g.field_name for g in cached] == [g.field_name for g in expected]
+
+    assert len(questioning_engine._order_cache) == 1
+    questioning_engine.clear_module_cache()
+    assert questioning_engine._order_cache == {}
+
+
+def test_replaced_strategy_is_not_served_from_cache(
+    questioning_engine, sample_session, sample_field_requirements, sample_question_templates
+):
+    """Test replacing a registered strategy takes effect, and custom strategies are not cached"""
+
+    class NothingStrategy(QuestioningStrategy):
+        def prioritize_gaps(self, gaps):
+            return []
+
+    questioning_engine.generate_question(
+        sample_session, sample_field_requirements, sample_question_templates
+    )
+    questioning_engine.strategies["user_friendly"] = NothingStrategy()
+
+    assert questioning_engine.generate_question(
+        sample_session, sample_field_requirements, sample_question_templates
+    ) is None
+    questioning_engine.strategies["user_friendly"] = UserFriendlyStrategy()
+    assert questioning_engine.generate_question(
+        sample_session, sample_field_requirements, sample_question_templates
+    ) is not None
+    assert not any(
+        isinstance(strategy, NothingStrategy) for strategy, _ in questioning_engine._order_cache
+    )
+
+
+def test_cached_order_follows_requirements_passed_in(questioning_engine, sample_session):
+    """Test a different requirement set for the same module is not answered from the cache"""
+    sample_session.module_id = "ORDER_21"
+    reqs_a = [FieldRequirement(
+        field_name="field_a", field_type="string", description="A", required=True,
+        validation_rules={},
+    )]
+    reqs_b = [FieldRequirement(
+        field_name="field_b", field_type="string", description="B", required=True,
+        validation_rules={},
+    )]
+
+    question_a = questioning_engine.generate_question(sample_session, reqs_a, [])
+    question_b = questioning_engine.generate_question(sample_session, reqs_b, [])
+
+    assert "field a" in question_a
+    assert "field b" in question_b
+
+
+def test_prioritized_gaps_are_not_shared(questioning_engine, sample_session, sample_field_requirements):
+    """Test callers get new gaps, so mutating one does not affect later calls"""
+    sample_session.module_id = "ORDER_21"
+
+    first = questioning_engine._prioritized_gaps(sample_session, sample_field_requirements, "rapid")
+    first[0].validation_rules["changed"] = True
+    first.clear()
+    second = questioning_engine._prioritized_gaps(sample_session, sample_field_requirements, "rapid")
+
+    assert len(second) == 4
+    assert "changed" not in second[0].validation_rules
+
+
+def test_multiple_questions_use_templates(
+    questioning_engine, sample_session, sample_field_requirements, sample_question_templates
+):
+    """Test templates are resolved through the field-name map"""
+    sample_session.module_id = "ORDER_21"
+
+    questions = questioning_engine.generate_multiple_questions(
+        sample_session, sample_field_requirements, sample_question_templates, max_questions=3
+    )
+
+    # The three required fields come first and all have templates
+    assert sorted(questions) == sorted(qt.template for qt in sample_question_templates)
+
+
+def test_templates_follow_templates_passed_in(
+    questioning_engine, sample_session, sample_field_requirements, sample_question_templates
+):
+    """Test different templates for the same module are not answered from a cache"""
+    sample_session.module_id = "ORDER_21"
+    first = questioning_engine.generate_question(
+        sample_session, sample_field_requirements, sample_question_templates
+    )
+    replacement = [QuestionTemplate(field_name=first_field, template="Replaced?", priority=1)
+                   for first_field in ("court_level", "case_type", "claim_amount")]
+
+    second = questioning_engine.generate_question(
+        sample_session, sample_field_requirements, replacement
+    )
+
+    assert first != "Replaced?"
+    assert second == "Replaced?"
+
+
 # ============================================
 # STRATEGY CONFIGURATION TESTS
 # ============================================
@@ -57,6 +57,21 @@ def test_determine_next_state(flow_controller, sample_session):
     assert next_state == FlowState.GREETING
 
 
+@pytest.mark.parametrize(
+    "completeness_score,expected",
+    [(0.3, FlowState.INFORMATION_GATHERING), (0.6, FlowState.ANALYSIS)],
+)
+def test_determine_next_state_provide_information(
+    flow_controller, sample_session, completeness_score, expected
+):
+    """Test providing information moves to analysis once enough is known"""
+    sample_session.completeness_score = completeness_score
+    next_state = flow_controller.determine_next_state(
+        FlowState.INFORMATION_GATHERING, FlowAction.PROVIDE_INFORMATION, sample_session
+    )
+    assert next_state == expected
+
+
 def test_can_transition_valid(flow_controller):
     """Test valid transition check"""
     can_transition = flow_controller.can_transition(
@@ -106,6 +121,25 @@ def test_get_recommended_action_initial(flow_controller, sample_session):
     assert action == "start_conversation"
 
 
+@pytest.mark.parametrize(
+    "status,completeness_score,expected",
+    [
+        (ConversationStatus.INFORMATION_GATHERING, 0.3, "ask_question"),
+        (ConversationStatus.INFORMATION_GATHERING, 0.8, "analyze"),
+        (ConversationStatus.ANALYZING, 0.8, "present_results"),
+        (ConversationStatus.COMPLETE, 1.0, "end"),
+        (ConversationStatus.ERROR, 0.0, "recover"),
+    ],
+)
+def test_get_recommended_action_by_state(
+    flow_controller, sample_session, status, completeness_score, expected
+):
+    """Test recommended action follows the current state"""
+    sample_session.status = status
+    sample_session.completeness_score = completeness_score
+    assert flow_controller.get_recommended_action(sample_session) == expected
+
+
 def test_statistics_tracking(flow_controller, sample_session):
     """Test statistics tracking"""
     initial_stats = flow_controller.get_statistics()
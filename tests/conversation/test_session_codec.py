@@ -0,0 +1,114 @@
+"""
+Tests for Session Codec
+Legal Advisory System v5.0
+"""
+
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from backend.conversation import session_codec
+from backend.conversation.session_codec import dumps_session, loads_session
+from backend.interfaces import (
+    ConversationMessage,
+    ConversationSession,
+    ConversationStatus,
+    MessageRole,
+)
+
+
+def make_session():
+    """Create a session with messages and results"""
+    session = ConversationSession(
+        session_id="abc123",
+        user_id="user_1",
+        status=ConversationStatus.COMPLETE,
+        module_id="ORDER_21",
+        filled_fields={"court_level": "High Court", "claim_amount": 50000.0},
+        calculation_result={"total_costs": 4000.0},
+    )
+    session.messages.append(ConversationMessage(role=MessageRole.USER, content="Hello"))
+    session.history.append({"role": "user", "content": "Hello"})
+    return session
+
+
+def test_round_trip():
+    """Test a session survives serialization unchanged"""
+    session = make_session()
+
+    restored = loads_session(dumps_session(session))
+
+    assert restored == session
+    assert restored.status is ConversationStatus.COMPLETE
+    assert restored.messages[0].role is MessageRole.USER
+
+
+def test_dumps_returns_json_bytes():
+    """Test serialized form is JSON bytes"""
+    payload = dumps_session(make_session())
+
+    assert isinstance(payload, bytes)
+    assert json.loads(payload)["status"] == "complete"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_decimal_and_datetime_round_trip(monkeypatch, use_orjson):
+    """Test Decimal and datetime values come back with their types on both backends"""
+    if use_orjson and not session_codec.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(session_codec, "ORJSON_AVAILABLE", use_orjson)
+    session = make_session()
+    session.filled_fields["claim_amount"] = Decimal("50000.10")
+    session.filled_fields["filed_on"] = date(2024, 3, 1)
+    session.calculation_result["breakdown"] = [{"fee": Decimal("1.50")}]
+    session.metadata["seen_at"] = datetime(2024, 3, 1, 9, 30, tzinfo=timezone.utc)
+
+    payload = dumps_session(session)
+    restored = loads_session(payload)
+
+    assert restored == session
+    assert isinstance(restored.filled_fields["claim_amount"], Decimal)
+    assert json.loads(payload)["metadata"]["seen_at"] == {
+        "__type__": "datetime",
+        "value": "2024-03-01T09:30:00+00:00",
+    }
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_caller_dicts_shaped_like_tags_round_trip(monkeypatch, use_orjson):
+    """Test caller dicts using the tag key come back as dicts, not decoded values"""
+    if use_orjson and not session_codec.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(session_codec, "ORJSON_AVAILABLE", use_orjson)
+    session = make_session()
+    session.filled_fields["amount"] = {"__type__": "decimal", "value": "1.50"}
+    session.metadata["bad"] = {"__type__": "date", "value": "not a date"}
+    session.calculation_result["nested"] = [{"__type__": "dict", "value": {"x": 1}}]
+    session.messages[0].metadata["kind"] = {"__type__": "custom"}
+
+    restored = loads_session(dumps_session(session))
+
+    assert restored == session
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_unsupported_values_raise(monkeypatch, use_orjson):
+    """Test values with no JSON form raise instead of being stringified"""
+    if use_orjson and not session_codec.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(session_codec, "ORJSON_AVAILABLE", use_orjson)
+    session = make_session()
+    session.filled_fields["parties"] = {"Alice", "Bob"}
+
+    with pytest.raises(TypeError):
+        dumps_session(session)
+
+
+def test_stdlib_fallback(monkeypatch):
+    """Test serialization works without orjson"""
+    monkeypatch.setattr(session_codec, "ORJSON_AVAILABLE", False)
+    session = make_session()
+
+    assert loads_session(dumps_session(session)) == session
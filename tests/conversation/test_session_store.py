@@ -0,0 +1,239 @@
+"""
+Tests for Session Store
+Legal Advisory System v5.0
+"""
+
+import time
+
+import pytest
+
+from backend.conversation import session_store
+from backend.conversation.session_store import InMemorySessionStore, RedisSessionStore
+from backend.interfaces import ConversationSession
+
+
+@pytest.fixture
+def store():
+    """Create in-memory session store"""
+    return InMemorySessionStore()
+
+
+def test_set_and_get(store):
+    """Test stored sessions can be retrieved"""
+    session = ConversationSession(session_id="s1", user_id="u1")
+
+    store.set(session)
+
+    assert store.get("s1") is session
+    assert store.get("missing") is None
+    assert len(store) == 1
+
+
+def test_scan_by_user(store):
+    """Test scanning filters by user in creation order"""
+    store.set(ConversationSession(session_id="s1", user_id="u1"))
+    store.set(ConversationSession(session_id="s2", user_id="u2"))
+    store.set(ConversationSession(session_id="s3", user_id="u1"))
+
+    assert [s.session_id for s in store.scan("u1")] == ["s1", "s3"]
+    assert len(store.scan()) == 3
+    assert store.scan("nobody") == []
+
+
+def test_set_existing_session_does_not_duplicate_index(store):
+    """Test re-saving a session keeps a single index entry"""
+    session = ConversationSession(session_id="s1", user_id="u1")
+
+    store.set(session)
+    store.set(session)
+
+    assert len(store.scan("u1")) == 1
+
+
+def test_delete(store):
+    """Test deleting removes the session and its index entry"""
+    store.set(ConversationSession(session_id="s1", user_id="u1"))
+
+    store.delete("s1")
+    store.delete("s1")
+
+    assert store.get("s1") is None
+    assert store.scan("u1") == []
+    assert len(store) == 0
+
+
+def test_least_recently_used_session_is_evicted():
+    """Test the store evicts the least recently used session when full"""
+    evicted = []
+    store = InMemorySessionStore(max_sessions=2, on_evict=evicted.append)
+    store.set(ConversationSession(session_id="s1", user_id="u1"))
+    store.set(ConversationSession(session_id="s2", user_id="u1"))
+
+    store.get("s1")  # s2 is now least recently used
+    store.set(ConversationSession(session_id="s3", user_id="u2"))
+
+    assert [s.session_id for s in evicted] == ["s2"]
+    assert "s2" not in store
+    assert [s.session_id for s in store.scan("u1")] == ["s1"]
+    assert len(store) == 2
+
+
+# ============================================
+# REDIS STORE TESTS
+# ============================================
+
+
+class FakeRedis:
+    """In-process stand-in for the redis commands RedisSessionStore uses"""
+
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+        self.zsets = {}
+        self.expires = {}
+        self.scanned = False
+
+    def _alive(self, key):
+        expires_at = self.expires.get(key)
+        if expires_at is not None and expires_at <= time.time():
+            for data in (self.values, self.sets, self.zsets, self.expires):
+                data.pop(key, None)
+        return key in self.values or key in self.sets or key in self.zsets
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def get(self, key):
+        return self.values.get(key) if self._alive(key) else None
+
+    def mget(self, keys):
+        return [self.get(key) for key in keys]
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+        self.expires[key] = time.time() + ttl
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+            self.expires.pop(key, None)
+
+    def expire(self, key, ttl):
+        if self._alive(key):
+            self.expires[key] = time.time() + ttl
+
+    def sadd(self, key, *members):
+        self._alive(key)
+        self.sets.setdefault(key, set()).update(members)
+
+    def srem(self, key, *members):
+        self.sets.get(key, set()).difference_update(members)
+
+    def smembers(self, key):
+        return {m.encode() for m in self.sets.get(key, ())} if self._alive(key) else set()
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, member):
+        self.zsets.get(key, {}).pop(member, None)
+
+    def zremrangebyscore(self, key, low, high):
+        zset = self.zsets.get(key, {})
+        for member in [m for m, score in zset.items() if float(low) <= score <= float(high)]:
+            del zset[member]
+
+    def zrangebyscore(self, key, low, high):
+        return [
+            m.encode()
+            for m, score in self.zsets.get(key, {}).items()
+            if float(low) <= score <= float(high)
+        ]
+
+    def zcount(self, key, low, high):
+        return len(self.zrangebyscore(key, low, high))
+
+    def scan_iter(self, match=None):
+        self.scanned = True
+        return iter(list(self.values))
+
+
+class FakePipeline:
+    """Queues commands and runs them on execute"""
+
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._commands.append((getattr(self._client, name), args, kwargs))
+
+        return queue
+
+    def execute(self):
+        return [command(*args, **kwargs) for command, args, kwargs in self._commands]
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    """Fake redis client, with the redis package treated as installed"""
+    monkeypatch.setattr(session_store, "REDIS_AVAILABLE", True)
+    return FakeRedis()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable wall clock shared by the store and the fake client"""
+    now = [1_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+def test_redis_set_get_and_delete(redis_client, clock):
+    """Test sessions round-trip through Redis and can be deleted"""
+    store = RedisSessionStore(redis_client, ttl_seconds=60)
+    session = ConversationSession(session_id="s1", user_id="u1")
+
+    store.set(session)
+
+    assert store.get("s1") == session
+    assert len(store) == 1
+    redis_client.values["session:s1"] = b"not a session"  # delete must not decode it
+    store.delete("s1")
+    assert store.get("s1") is None
+    assert len(store) == 0
+    assert redis_client.sets["user:u1:sessions"] == set()
+    assert redis_client.values == {}
+
+
+def test_redis_scan_by_user_and_all(redis_client, clock):
+    """Test listing by user and listing everything use the indexes, not SCAN"""
+    store = RedisSessionStore(redis_client, ttl_seconds=60)
+    store.set(ConversationSession(session_id="s1", user_id="u1"))
+    store.set(ConversationSession(session_id="s2", user_id="u1"))
+    store.set(ConversationSession(session_id="s3", user_id="u2"))
+
+    assert sorted(s.session_id for s in store.scan("u1")) == ["s1", "s2"]
+    assert sorted(s.session_id for s in store.scan()) == ["s1", "s2", "s3"]
+    assert len(store) == 3
+    assert redis_client.scanned is False
+
+
+def test_redis_expired_sessions(redis_client, clock):
+    """Test expired sessions are skipped, pruned from the user set and not counted"""
+    store = RedisSessionStore(redis_client, ttl_seconds=60)
+    store.set(ConversationSession(session_id="old", user_id="u1"))
+    clock[0] += 30
+    store.set(ConversationSession(session_id="new", user_id="u1"))
+    clock[0] += 45
+
+    assert store.get("old") is None
+    assert [s.session_id for s in store.scan("u1")] == ["new"]
+    assert redis_client.sets["user:u1:sessions"] == {"new"}
+    assert len(store) == 1
+
+    # The user set itself expires with the user's last write
+    clock[0] += 60
+    assert store.scan("u1") == []
+    assert "user:u1:sessions" not in redis_client.sets
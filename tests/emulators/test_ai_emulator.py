@@ -72,3 +72,40 @@ async def test_ai_emulator_health_check():
     
     health = await emulator.health_check()
     assert health is True
+
+
+@pytest.mark.asyncio
+async def test_ai_emulator_token_counts():
+    """Test token usage counts whitespace-separated words"""
+    emulator = AIEmulator(AIEmulatorConfig(simulate_latency=False))
+    
+    request = AIRequest(
+        prompt="  What   is\nthe legal\tanalysis?  ",
+        service_type=AIServiceType.ANALYSIS,
+        max_tokens=100
+    )
+    
+    response = await emulator.generate(request)
+    
+    assert response.metadata["prompt_tokens"] == 5
+    assert response.metadata["completion_tokens"] == len(response.content.split())
+    assert response.tokens_used == 5 + len(response.content.split())
+
+
+@pytest.mark.asyncio
+async def test_ai_emulator_latency_opt_in(monkeypatch):
+    """Test latency is only simulated when enabled"""
+    sleeps = []
+    
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+    
+    monkeypatch.setattr("backend.emulators.ai_emulator.asyncio.sleep", fake_sleep)
+    request = AIRequest(prompt="Hello", service_type=AIServiceType.ANALYSIS, max_tokens=100)
+    
+    await AIEmulator().generate(request)
+    await AIEmulator(AIEmulatorConfig(simulate_latency=True, latency_ms=0)).generate(request)
+    assert sleeps == []
+    
+    await AIEmulator(AIEmulatorConfig(simulate_latency=True, latency_ms=50)).generate(request)
+    assert sleeps == [0.05]
@@ -32,6 +32,34 @@ async def test_insert():
     assert "id" in result[0]
 
 
+@pytest.mark.asyncio
+async def test_executemany_reuses_insert_plan():
+    """Test repeated INSERTs parse the query once"""
+    db = InMemoryDatabase()
+    query = "INSERT INTO users (name, email) VALUES (?, ?)"
+    
+    results = await db.executemany(
+        query, [("Alice", "alice@example.com"), ("Bob", "bob@example.com")]
+    )
+    
+    assert [row["id"] for row in results] == [1, 2]
+    assert results[1]["email"] == "bob@example.com"
+    assert db._insert_plans[query] == ("users", ("name", "email"))
+
+
+def test_insert_row():
+    """Test direct row insert assigns an id and copies the values"""
+    db = InMemoryDatabase()
+    values = {"name": "Alice"}
+    
+    row = db.insert_row("users", values)
+    
+    assert row["id"] == 1
+    assert "created_at" in row
+    assert "id" not in values
+    assert db.get_table("users") == [row]
+
+
 @pytest.mark.asyncio
 async def test_select():
     """Test SELECT"""
@@ -64,6 +92,26 @@ async def test_select_with_where():
     assert results[0]["name"] == "Alice"
 
 
+@pytest.mark.asyncio
+async def test_select_by_id_uses_index():
+    """Test lookups by id stay correct as rows are inserted and deleted"""
+    db = InMemoryDatabase()
+    
+    await db.execute("CREATE TABLE users")
+    await db.execute("INSERT INTO users (name) VALUES (?)", ("Alice",))
+    
+    results = await db.execute("SELECT * FROM users WHERE id = ?", (1,))
+    assert [row["name"] for row in results] == ["Alice"]
+    assert "users" in db._id_index
+    
+    await db.execute("INSERT INTO users (name) VALUES (?)", ("Bob",))
+    results = await db.execute("SELECT * FROM users WHERE id = ?", (2,))
+    assert [row["name"] for row in results] == ["Bob"]
+    
+    await db.execute("DELETE FROM users WHERE id = ?", (2,))
+    assert await db.execute("SELECT * FROM users WHERE id = ?", (2,)) == []
+
+
 @pytest.mark.asyncio
 async def test_update():
     """Test UPDATE"""
@@ -78,6 +126,22 @@ async def test_update():
     assert results[0]["name"] == "Jane"
 
 
+@pytest.mark.asyncio
+async def test_update_all_rows_share_timestamp():
+    """Test an UPDATE without WHERE stamps every row with one timestamp"""
+    db = InMemoryDatabase()
+    
+    await db.execute("CREATE TABLE users")
+    await db.execute("INSERT INTO users (name) VALUES (?)", ("John",))
+    await db.execute("INSERT INTO users (name) VALUES (?)", ("Jane",))
+    
+    updated = await db.execute("UPDATE users SET status = ?", ("active",))
+    
+    assert len(updated) == 2
+    assert {row["status"] for row in updated} == {"active"}
+    assert updated[0]["updated_at"] == updated[1]["updated_at"]
+
+
 @pytest.mark.asyncio
 async def test_delete():
     """Test DELETE"""
@@ -113,6 +177,75 @@ async def test_transactions():
     assert results[0]["name"] == "John"
 
 
+@pytest.mark.asyncio
+async def test_rollback_undoes_update_delete_and_create():
+    """Test rollback restores updated and deleted rows and drops new tables"""
+    db = InMemoryDatabase()
+    
+    await db.execute("CREATE TABLE users")
+    await db.execute("INSERT INTO users (name) VALUES (?)", ("John",))
+    await db.execute("INSERT INTO users (name) VALUES (?)", ("Jane",))
+    users = db._tables["users"]
+    
+    db.begin_transaction()
+    await db.execute("UPDATE users SET name = ? WHERE name = ?", ("Jim", "John"))
+    await db.execute("DELETE FROM users WHERE name = ?", ("Jane",))
+    await db.execute("CREATE TABLE orders")
+    db.rollback()
+    
+    assert db._tables["users"] is users
+    assert [row["name"] for row in users] == ["John", "Jane"]
+    assert "updated_at" not in users[0]
+    assert await db.execute("SELECT * FROM orders") == []
+    assert "orders" not in db._tables
+
+
+@pytest.mark.asyncio
+async def test_get_table_returns_copies():
+    """Test editing get_table() results changes neither the table nor the id index"""
+    db = InMemoryDatabase()
+    
+    await db.execute("INSERT INTO users (name) VALUES (?)", ("John",))
+    assert len(await db.execute("SELECT * FROM users WHERE id = ?", (1,))) == 1
+    
+    db.begin_transaction()
+    table = db.get_table("users")
+    table[0]["name"] = "Jim"
+    table.append({"id": 2, "name": "Jane"})
+    
+    assert db.get_table("users") == [{"id": 1, "name": "John", "created_at": table[0]["created_at"]}]
+    assert await db.execute("SELECT * FROM users WHERE id = ?", (2,)) == []
+    db.rollback()
+    assert [row["name"] for row in db.get_table("users")] == ["John"]
+
+
+@pytest.mark.asyncio
+async def test_rollback_from_empty_database():
+    """Test rollback of a transaction begun before any table existed"""
+    db = InMemoryDatabase()
+    
+    db.begin_transaction()
+    await db.execute("CREATE TABLE users")
+    await db.execute("INSERT INTO users (name) VALUES (?)", ("John",))
+    db.rollback()
+    
+    assert db._tables == {}
+
+
+@pytest.mark.asyncio
+async def test_commit_keeps_changes():
+    """Test committed changes survive a later rollback"""
+    db = InMemoryDatabase()
+    
+    await db.execute("CREATE TABLE users")
+    db.begin_transaction()
+    await db.execute("INSERT INTO users (name) VALUES (?)", ("John",))
+    db.commit()
+    db.rollback()
+    
+    assert len(db.get_table("users")) == 1
+
+
 @pytest.mark.asyncio
 async def test_health_check():
     """Test health check"""
@@ -120,3 +253,20 @@ async def test_health_check():
     
     health = await db.health_check()
     assert health is True
+
+
+@pytest.mark.asyncio
+async def test_query_dispatch():
+    """Test keyword dispatch is case-insensitive and rejects unsupported queries"""
+    db = InMemoryDatabase()
+    
+    await db.execute("  create table users")
+    await db.execute("insert into users(name) values (?)", ("Alice",))
+    
+    results = await db.execute("select name from users where name = ?", ("Alice",))
+    assert len(results) == 1
+    
+    with pytest.raises(ValueError, match="Unsupported query type"):
+        await db.execute("CREATE INDEX idx ON users (name)")
+    with pytest.raises(ValueError, match="Unsupported query type"):
+        await db.execute("DROP TABLE users")
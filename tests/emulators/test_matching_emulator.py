@@ -85,3 +85,72 @@ async def test_matching_health_check():
     
     health = await emulator.health_check()
     assert health is True
+
+
+@pytest.mark.asyncio
+async def test_matching_caches_node_words(sample_nodes):
+    """Test node words are computed once and cleared on reset"""
+    emulator = MatchingEmulator(threshold=0.1)
+    
+    first = await emulator.find_matches("What are the court fees?", sample_nodes)
+    cached = emulator._node_words_cache[id(sample_nodes[0])]
+    second = await emulator.find_matches("What are the court fees?", sample_nodes)
+    
+    assert emulator._node_words_cache[id(sample_nodes[0])] is cached
+    assert "fees?" in cached
+    assert [r.match_score for r in first] == [r.match_score for r in second]
+    
+    emulator.reset()
+    assert emulator._node_words_cache == {}
+
+
+@pytest.mark.asyncio
+async def test_matching_keeps_exact_threshold_scores():
+    """Test nodes scoring exactly the threshold survive the bound checks"""
+    nodes = [
+        LogicTreeNode(node_id="exact", citation="C-1", module_id="TEST_MODULE",
+                      what=[{"text": "alpha beta gamma"}]),
+        LogicTreeNode(node_id="below", citation="C-2", module_id="TEST_MODULE",
+                      what=[{"text": "alpha beta"}]),
+        LogicTreeNode(node_id="large", citation="C-3", module_id="TEST_MODULE",
+                      what=[{"text": "alpha beta gamma delta epsilon " + " ".join(f"x{i}" for i in range(20))}]),
+    ]
+    emulator = MatchingEmulator()
+    
+    results = await emulator.match(nodes, {"query": "alpha beta gamma delta epsilon"}, threshold=0.6)
+    
+    assert [r.node_id for r in results] == ["exact"]
+    assert results[0].match_score == 0.6
+
+
+@pytest.mark.asyncio
+async def test_matching_word_index_follows_node_list(sample_nodes):
+    """Test the word index is reused for the same nodes and rebuilt for new ones"""
+    emulator = MatchingEmulator(threshold=0.1)
+    
+    await emulator.find_matches("court fees", sample_nodes)
+    index = emulator._word_index
+    await emulator.find_matches("case type", sample_nodes)
+    assert emulator._word_index is index
+    
+    results = await emulator.find_matches("court fees", sample_nodes[1:])
+    assert emulator._word_index is not index
+    assert all(r.node_id != "node1" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_matching_rebuilt_nodes_with_same_ids_are_rescanned():
+    """Test a rebuilt tree reusing node_ids is matched on its new text"""
+    def build(text):
+        return [LogicTreeNode(node_id="node1", citation="C-1", module_id="TEST_MODULE",
+                              what=[{"text": text}])]
+    emulator = MatchingEmulator()
+    
+    old = await emulator.match(build("filing fees"), {"query": "filing fees"}, threshold=0.5)
+    new = await emulator.match(build("appeal deadline"), {"query": "filing fees"}, threshold=0.5)
+    rebuilt = await emulator.match(build("appeal deadline"), {"query": "appeal deadline"}, threshold=0.5)
+    
+    assert [r.node_id for r in old] == ["node1"]
+    assert new == []
+    assert [r.node_id for r in rebuilt] == ["node1"]
+
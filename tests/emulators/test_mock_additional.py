@@ -0,0 +1,78 @@
+"""Tests for Mock Tree Framework and Analysis Engine"""
+
+import pytest
+from backend.emulators.mock_additional import MockAnalysisEngine, MockTreeFramework
+from backend.emulators.mock_legal_module import MockLegalModule
+from backend.interfaces.data_structures import LogicTreeNode
+
+
+@pytest.fixture
+def framework():
+    """Create a framework with one registered tree"""
+    framework = MockTreeFramework()
+    framework.build_tree(
+        "TEST_MODULE",
+        [
+            LogicTreeNode(node_id="N1", citation="Rule 1", module_id="TEST_MODULE"),
+            LogicTreeNode(
+                node_id="N2", citation="Rule 1", module_id="TEST_MODULE", source_type="case"
+            ),
+            LogicTreeNode(node_id="N3", citation="Rule 2", module_id="TEST_MODULE"),
+        ],
+    )
+    return framework
+
+
+@pytest.mark.parametrize(
+    "filters,expected",
+    [
+        ({"node_id": "N2"}, ["N2"]),
+        ({"node_id": "missing"}, []),
+        ({"citation": "Rule 1"}, ["N1", "N2"]),
+        ({"citation": "Rule 1", "source_type": "rule"}, ["N1"]),
+        ({"unknown": "ignored"}, ["N1", "N2", "N3"]),
+    ],
+)
+def test_query_tree_filters(framework, filters, expected):
+    """Test filtered queries return matching nodes in tree order"""
+    nodes = framework.query_tree("TEST_MODULE", filters)
+    assert [node.node_id for node in nodes] == expected
+
+
+def test_clear_tree_drops_indexes(framework):
+    """Test clearing a tree removes it and its indexes"""
+    framework.clear_tree("TEST_MODULE")
+
+    assert framework.get_registered_modules() == []
+    with pytest.raises(KeyError):
+        framework.query_tree("TEST_MODULE", {"node_id": "N1"})
+
+
+def test_validate_tree_reports_duplicates_before_node_errors():
+    """Test duplicate IDs are reported first, then each node's missing fields"""
+    framework = MockTreeFramework()
+    nodes = [
+        LogicTreeNode(node_id="N1", citation="Rule 1", module_id=""),
+        LogicTreeNode(node_id="N1", citation="Rule 2", module_id="TEST_MODULE"),
+    ]
+
+    is_valid, errors = framework._validate_tree_structure(nodes)
+
+    assert is_valid is False
+    assert errors == ["Duplicate node IDs found", "Node N1 missing module_id"]
+    assert framework._validate_tree_structure([]) == (False, ["Tree must have at least one node"])
+
+
+@pytest.mark.asyncio
+async def test_analysis_engine_awaits_async_module_methods():
+    """Test arguments and recommendations from async module methods are awaited"""
+    engine = MockAnalysisEngine()
+    filled_fields = {"case_type": "civil", "amount_claimed": 60000, "court_level": "high"}
+
+    result = await engine.analyze(MockLegalModule(), filled_fields, enhance_with_ai=False)
+
+    assert result["success"] is True
+    assert isinstance(result["arguments"], list)
+    assert (
+        "Given the high claim amount, consider engaging senior counsel" in result["recommendations"]
+    )
@@ -0,0 +1,57 @@
+"""Tests for Mock AI Service"""
+
+import pytest
+from backend.emulators.mock_ai_service import MockAIService
+from backend.interfaces.data_structures import AIRequest, AIResponse, AIServiceType
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content,service_type,tokens_used,expected",
+    [
+        ("Hello", AIServiceType.CONVERSATION, 5, True),
+        ("Hello", AIServiceType.CONVERSATION, 0, True),
+        ("", AIServiceType.CONVERSATION, 5, False),
+        ("Hello", None, 5, False),
+        ("Hello", AIServiceType.CONVERSATION, -1, False),
+    ],
+)
+async def test_validate_response(content, service_type, tokens_used, expected):
+    """Test responses need content, a service type and non-negative tokens"""
+    service = MockAIService()
+    response = AIResponse(
+        content=content, service_type=service_type, tokens_used=tokens_used, finish_reason="stop"
+    )
+
+    assert await service.validate_response(response) is expected
+
+
+@pytest.mark.asyncio
+async def test_health_check():
+    """Test the health check round-trips a conversation request"""
+    service = MockAIService()
+
+    assert await service.health_check() is True
+    assert service.get_call_count() == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "service_type,context,expected_start",
+    [
+        (AIServiceType.CONVERSATION, {}, "To help you better"),
+        (AIServiceType.CONVERSATION, {"filled_fields": {"case_type": "civil"}}, "Thank you. Now"),
+        (AIServiceType.ANALYSIS, {}, "Based on the information provided"),
+        (AIServiceType.ENHANCEMENT, {}, "Enhanced Legal Advisory"),
+    ],
+)
+async def test_generate_dispatches_by_service_type(service_type, context, expected_start):
+    """Test each service type gets its canned response"""
+    service = MockAIService()
+
+    request = AIRequest(service_type=service_type, prompt="p", context=context)
+
+    response = await service.generate(request)
+
+    assert response.content.startswith(expected_start)
+    assert response.tokens_used == len(response.content.split())
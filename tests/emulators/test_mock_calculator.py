@@ -0,0 +1,32 @@
+"""Tests for Mock Calculator"""
+
+import pytest
+from backend.emulators.mock_calculator import MockCalculator
+from backend.interfaces.data_structures import LogicTreeNode
+
+
+@pytest.mark.asyncio
+async def test_calculate_breakdown():
+    """Test breakdown shares of the base cost"""
+    calculator = MockCalculator()
+
+    result = await calculator.calculate([], {"amount_claimed": 1000})
+
+    assert result["total_costs"] == 1000 * 0.1
+    assert result["breakdown"] == {
+        "filing_fee": 100.0 * 0.3,
+        "hearing_fee": 100.0 * 0.4,
+        "miscellaneous": 100.0 * 0.3,
+    }
+
+
+@pytest.mark.asyncio
+async def test_applicable_rules():
+    """Test rules come from matched nodes, with a default when none match"""
+    calculator = MockCalculator()
+    nodes = [LogicTreeNode(node_id="N1", citation="Rule 1", module_id="TEST")]
+
+    assert (await calculator.calculate(nodes, {}))["applicable_rules"] == ["Rule 1"]
+    assert (await calculator.calculate([], {}))["applicable_rules"] == ["MOCK_RULE"]
+    assert (await calculator.calculate(None, {}))["applicable_rules"] == ["MOCK_RULE"]
+    assert calculator.get_calculation_count() == 3
@@ -0,0 +1,118 @@
+"""Tests for Mock Legal Module"""
+
+import pytest
+from backend.emulators.mock_legal_module import MockLegalModule
+
+
+def test_validate_fields_reports_missing_and_invalid():
+    """Test validation reports missing required fields before invalid values"""
+    module = MockLegalModule()
+
+    is_valid, errors = module.validate_fields({"case_type": "tax", "amount_claimed": -1})
+
+    assert is_valid is False
+    assert errors == [
+        "Required field missing: court_level",
+        "Invalid value for case_type: tax. Must be one of ['civil', 'criminal', 'family']",
+        "amount_claimed must be non-negative",
+    ]
+
+
+def test_validate_fields_unhashable_value():
+    """Test an unhashable enum value is reported rather than raising"""
+    module = MockLegalModule()
+
+    is_valid, errors = module.validate_fields(
+        {"case_type": ["civil"], "amount_claimed": 100, "court_level": "high"}
+    )
+
+    assert is_valid is False
+    assert len(errors) == 1
+
+
+def test_check_completeness():
+    """Test completeness is the share of required fields filled"""
+    module = MockLegalModule()
+
+    assert module.check_completeness({}) == 0.0
+    assert module.check_completeness({"case_type": "civil"}) == 1 / 3
+    assert (
+        module.check_completeness(
+            {"case_type": "civil", "amount_claimed": 1, "court_level": "high"}
+        )
+        == 1.0
+    )
+
+
+def test_getters_return_expected_sequence_types():
+    """Test requirements and templates are shared tuples and tree nodes a fresh list"""
+    module = MockLegalModule()
+
+    assert isinstance(module.get_field_requirements(), tuple)
+    assert module.get_field_requirements() is module.get_field_requirements()
+    assert isinstance(module.get_question_templates(), tuple)
+    assert isinstance(module.get_tree_nodes(), list)
+    assert module.get_tree_nodes() is not module.get_tree_nodes()
+
+
+@pytest.mark.asyncio
+async def test_arguments_and_recommendations_are_fresh_lists():
+    """Test cached arguments and recommendations are returned as new lists"""
+    module = MockLegalModule()
+
+    arguments = await module.get_arguments({"total_costs": 1234.5})
+    arguments.append("extra")
+
+    assert await module.get_arguments({"total_costs": 1234.5}) == [
+        "Pursuant to Mock Rule 1, the costs are calculated as follows:",
+        "- Total costs amount to $1234.50",
+        "- This calculation is based on the standardized mock formula",
+        "- All fees are in accordance with the mock schedule",
+        "The calculation is deterministic and verifiable.",
+    ]
+
+    recommendations = await module.get_recommendations(
+        {"amount_claimed": 60000, "court_level": "appeal"}, {}
+    )
+    recommendations.clear()
+
+    assert (
+        len(
+            await module.get_recommendations({"amount_claimed": 60000, "court_level": "appeal"}, {})
+        )
+        == 4
+    )
+    assert len(await module.get_recommendations({}, {})) == 2
+
+
+def test_static_data_is_shared_between_instances():
+    """Test the test data is built once rather than per instance"""
+    first, second = MockLegalModule(), MockLegalModule()
+
+    assert first.metadata is second.metadata
+    assert first.get_tree_nodes()[0] is second.get_tree_nodes()[0]
+    assert first.get_field_requirements() is second.get_field_requirements()
+    assert first.get_question_templates() is second.get_question_templates()
+
+
+def test_tree_node_list_is_not_shared():
+    """Test appending to the returned node list leaves other instances untouched"""
+    first, second = MockLegalModule(), MockLegalModule()
+
+    first.get_tree_nodes().append(first.get_tree_nodes()[0])
+
+    assert len(second.get_tree_nodes()) == 2
+
+
+@pytest.mark.asyncio
+async def test_calculate_applicable_rules():
+    """Test rules come from matched nodes, with a default when none match"""
+    module = MockLegalModule()
+
+    with_nodes = await module.calculate(module.get_tree_nodes(), {"amount_claimed": 1000})
+    without_nodes = await module.calculate([], {})
+
+    assert with_nodes["applicable_rules"] == ["Mock Rule 1", "Mock Rule 2"]
+    assert with_nodes["breakdown"]["filing_fee"] == with_nodes["breakdown"]["miscellaneous"]
+    assert without_nodes["applicable_rules"] == ["MOCK_1"]
+    assert (await module.calculate(None, {}))["applicable_rules"] == ["MOCK_1"]
@@ -0,0 +1,67 @@
+"""Tests for Mock Matching Engine"""
+
+import pytest
+from backend.emulators.mock_matching_engine import MockMatchingEngine
+from backend.interfaces.data_structures import LogicTreeNode
+
+
+@pytest.fixture
+def nodes():
+    """Create sample nodes"""
+    return [
+        LogicTreeNode(node_id="N1", citation="Rule 1", module_id="TEST"),
+        LogicTreeNode(node_id="N2", citation="Rule 2", module_id="TEST"),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "filled_fields,expected_score",
+    [
+        ({}, 0.5),
+        ({"case_type": "civil"}, 0.6),
+        ({"case_type": "civil", "amount_claimed": 1}, 0.75),
+        ({"case_type": "civil", "amount_claimed": 1, "court_level": "high", "x": 1}, 0.95),
+    ],
+)
+async def test_match_scores_by_field_count(nodes, filled_fields, expected_score):
+    """Test every node gets the score for the number of filled fields"""
+    engine = MockMatchingEngine()
+
+    results = await engine.match(filled_fields, nodes, threshold=0.0)
+
+    assert [r.node_id for r in results] == ["N1", "N2"]
+    assert {r.match_score for r in results} == {expected_score}
+
+
+@pytest.mark.asyncio
+async def test_match_below_threshold(nodes):
+    """Test no nodes match when the score is below threshold"""
+    engine = MockMatchingEngine()
+
+    assert await engine.match({"case_type": "civil"}, nodes, threshold=0.7) == []
+    assert engine.get_match_count() == 1
+
+
+@pytest.mark.asyncio
+async def test_match_missing_fields_not_shared(nodes):
+    """Test each result has its own missing-fields list"""
+    engine = MockMatchingEngine()
+
+    results = await engine.match({"case_type": "civil"}, nodes, threshold=0.0)
+
+    assert results[0].missing_fields == ["amount_claimed", "court_level", "trial_duration"]
+    assert results[0].missing_fields is not results[1].missing_fields
+
+
+@pytest.mark.asyncio
+async def test_match_snapshots_filled_fields(nodes):
+    """Test results share one snapshot that is independent of the input"""
+    engine = MockMatchingEngine()
+    filled_fields = {"case_type": "civil"}
+
+    results = await engine.match(filled_fields, nodes, threshold=0.0)
+    filled_fields["amount_claimed"] = 1
+
+    assert results[0].matched_fields == {"case_type": "civil"}
+    assert results[0].matched_fields is results[1].matched_fields
@@ -0,0 +1,145 @@
+"""Tests for Mock Validator"""
+
+import pytest
+from backend.emulators.mock_validator import MockValidator
+
+
+@pytest.fixture
+def validator():
+    """Create a validator"""
+    return MockValidator()
+
+
+def test_terminology_reports_each_term_once_in_table_order(validator):
+    """Test misspellings are reported once each, whatever order they appear in"""
+    enhanced = {"summary": "Aproximate costs are definitly set", "notes": ["aproximate"]}
+
+    errors = validator.validate_legal_terminology(enhanced)
+
+    assert [e.message for e in errors] == [
+        "Incorrect spelling: 'definitly' should be 'definitely'",
+        "Incorrect spelling: 'aproximate' should be 'approximate'",
+    ]
+    assert all(e.error_type == "incorrect_terminology" for e in errors)
+
+
+def test_terminology_finds_overlapping_terms(validator):
+    """Test terms sharing characters are all detected"""
+    errors = validator.validate_legal_terminology({"text": "guarranteedefinitly"})
+
+    assert [e.current_value for e in errors] == ["guaranteed", "definitely"]
+
+
+def test_terminology_clean_content(validator):
+    """Test correctly spelled content passes"""
+    assert validator.validate_legal_terminology({"text": "definitely guaranteed"}) == []
+
+
+@pytest.mark.asyncio
+async def test_validate_reports_protected_and_citation_errors(validator):
+    """Test modified protected fields and suspicious citations are errors"""
+    original = {"total_costs": 100.0}
+    enhanced = {"total_costs": 200.0, "citations": ["Hallucinated v Case"]}
+
+    is_valid, errors = await validator.validate(original, enhanced)
+
+    assert is_valid is False
+    assert [e.field_name for e in errors] == ["total_costs", "citations"]
+
+
+def test_terminology_scans_nested_text_and_keys(validator):
+    """Test text is found in nested values and keys but not across leaves"""
+    enhanced = {
+        "total_costs": 4000.0,
+        "sections": [{"Definitly": "ok"}, ("fine", {"costs are aproximate"})],
+        "split": ["guarran", "teed"],
+    }
+    enhanced["self"] = enhanced
+
+    errors = validator.validate_legal_terminology(enhanced)
+
+    assert [e.current_value for e in errors] == ["definitely", "approximate"]
+
+
+def test_add_protected_field_ignores_duplicates(validator):
+    """Test protected fields keep their order and are added once"""
+    validator.add_protected_field("court_fee")
+    validator.add_protected_field("court_fee")
+    validator.add_protected_field("total_costs")
+
+    assert validator.get_protected_fields() == (
+        "total_costs",
+        "breakdown",
+        "calculation_method",
+        "applicable_rules",
+        "court_fee",
+    )
+
+
+def test_get_protected_fields_returns_shared_tuple(validator):
+    """Test the protected fields snapshot is reused until a field is added"""
+    fields = validator.get_protected_fields()
+
+    assert validator.get_protected_fields() is fields
+    validator.add_protected_field("court_fee")
+    assert validator.get_protected_fields()[-1] == "court_fee"
+    assert "court_fee" not in fields
+
+
+@pytest.mark.asyncio
+async def test_fail_fast_stops_at_first_failing_check():
+    """Test fail-fast mode returns the first check's errors only"""
+    original = {"total_costs": 100.0}
+    enhanced = {"total_costs": 200.0, "citations": ["Hallucinated v Case"], "text": "definitly"}
+
+    is_valid, errors = await MockValidator(fail_fast=True).validate(original, enhanced)
+    assert is_valid is False
+    assert [e.field_name for e in errors] == ["total_costs"]
+
+    is_valid, errors = await MockValidator(fail_fast=True).validate({}, enhanced)
+    assert is_valid is False
+    assert [e.field_name for e in errors] == ["citations"]
+
+    is_valid, errors = await MockValidator().validate(original, enhanced)
+    assert [e.field_name for e in errors] == ["total_costs", "citations", "content"]
+
+
+def test_protected_fields_passed_through_by_reference(validator):
+    """Test unchanged values pass whether shared or copied, and changes are caught"""
+
+    class NoCompare(dict):
+        def __ne__(self, other):
+            raise AssertionError("deep comparison should be skipped")
+
+    breakdown = NoCompare(filing_fee=30.0)
+    original = {"breakdown": breakdown, "total_costs": 100.0}
+
+    assert (
+        validator.validate_protected_fields(
+            original, {"breakdown": breakdown, "total_costs": 100.0}
+        )
+        == []
+    )
+    errors = validator.validate_protected_fields(
+        {"breakdown": {"filing_fee": 30.0}}, {"breakdown": {"filing_fee": 31.0}}
+    )
+    assert [e.field_name for e in errors] == ["breakdown"]
+
+
+@pytest.mark.asyncio
+async def test_health_check_does_no_validation(validator):
+    """Test the liveness probe skips validation while self_test runs it"""
+    assert await validator.health_check() is True
+    assert validator.get_validation_count() == 0
+
+    assert await validator.self_test() is True
+    assert validator.get_validation_count() == 1
+
+
+def test_validator_has_no_instance_dict():
+    """Test the validator keeps its state in slots"""
+    validator = MockValidator()
+
+    assert not hasattr(validator, "__dict__")
+    with pytest.raises(AttributeError):
+        validator.unexpected = True
@@ -136,3 +136,31 @@ async def test_health_check():
     
     health = await emulator.health_check()
     assert health is True
+
+
+def test_static_data_is_reused():
+    """Test metadata and requirements are built once and shared"""
+    emulator = ModuleEmulator()
+    other = ModuleEmulator("Other")
+    
+    assert emulator.metadata is emulator.metadata
+    assert other.metadata.module_name == "Other"
+    assert emulator.get_field_requirements() is other.get_field_requirements()
+    assert emulator.get_question_templates() is other.get_question_templates()
+
+
+@pytest.mark.parametrize(
+    "filled_fields,expected",
+    [
+        ({}, 0.0),
+        ({"case_type": "civil", "other": 1}, 0.4),
+        ({"case_type": "civil", "amount": 100}, 0.8),
+        ({"case_type": "civil", "amount": 100, "party_count": 2}, 1.0),
+        ({"party_count": 2}, 0.2),
+    ],
+)
+def test_check_completeness(filled_fields, expected):
+    """Test required fields are worth 80% and optional fields 20%"""
+    emulator = ModuleEmulator()
+    
+    assert emulator.check_completeness(filled_fields) == pytest.approx(expected)
@@ -6,6 +6,8 @@ Tests boundary conditions, invalid inputs, malformed data,
 timeout scenarios, and other edge cases across the system.
 """
 
+from collections.abc import Sequence
+
 import pytest
 from backend.api.routes import conversation_manager, module_registry
 from backend.interfaces import ConversationStatus
@@ -284,7 +286,8 @@ async def test_module_with_no_tree():
 
     # Field requirements should work even if tree is empty
     field_reqs = module.get_field_requirements()
-    assert isinstance(field_reqs, list)
+    assert isinstance(field_reqs, Sequence)
+    assert len(field_reqs) > 0
 
 
 @pytest.mark.asyncio
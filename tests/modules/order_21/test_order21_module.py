@@ -159,6 +159,16 @@ def test_question_templates_cover_required_fields(order21_module):
     assert "claim_amount" in question_fields
 
 
+def test_requirements_built_once_and_shared(order21_module):
+    """Test requirements and templates are built once and shared as tuples"""
+    requirements = order21_module.get_field_requirements()
+
+    assert isinstance(requirements, tuple)
+    assert len(requirements) > 0
+    assert requirements is order21_module.get_field_requirements()
+    assert order21_module.get_question_templates() is order21_module.get_question_templates()
+
+
 # ============================================
 # VALIDATION TESTS
 # ============================================
@@ -287,6 +297,25 @@ def test_check_completeness_required_only(order21_module):
     assert len(missing) > 0
 
 
+def test_evaluate_fields_matches_separate_checks(order21_module):
+    """Test the fused evaluation agrees with validate_fields and check_completeness"""
+    filled_fields = {
+        "court_level": "High Court",
+        "case_type": "contested_trial",
+        "claim_amount": 50000,
+        "party_type": "plaintiff",
+    }
+
+    evaluation = order21_module.evaluate_fields(filled_fields)
+
+    assert (evaluation.is_valid, evaluation.errors) == order21_module.validate_fields(filled_fields)
+    assert (evaluation.completeness_score, evaluation.missing_fields) == (
+        order21_module.check_completeness(filled_fields)
+    )
+    assert evaluation.missing_fields[0] == "trial_days"
+    assert "trial_days is required for contested trials" in evaluation.errors
+
+
 def test_check_completeness_empty(order21_module):
     """Test completeness with no fields"""
     filled_fields = {}
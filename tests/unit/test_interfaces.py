@@ -7,6 +7,10 @@ import pytest
 from backend.interfaces import AIProvider  # ← ADD THIS
 from backend.interfaces import AIServiceType  # ← ADD THIS
 from backend.interfaces import (
+    ConversationMessage,
+    ConversationResponse,
+    ConversationSession,
+    ConversationStatus,
     IAIService,
     IAnalysisEngine,
     ICalculator,
@@ -14,10 +18,14 @@ from backend.interfaces import (
     IMatchingEngine,
     ITreeFramework,
     IValidator,
+    InfoGap,
     LogicTreeNode,
     MatchResult,
     ModuleMetadata,
+    MessageRole,
     ModuleStatus,
+    QuestionTemplate,
+    ValidationError,
 )
 
 
@@ -117,3 +125,44 @@ def test_enums():
     assert ModuleStatus.ACTIVE.value == "active"
     assert AIProvider.ANTHROPIC_CLAUDE.value == "anthropic_claude"
     assert AIServiceType.CONVERSATION.value == "conversation"
+
+
+def test_conversation_structures_use_slots():
+    """Test per-turn conversation objects carry no instance __dict__"""
+    message = ConversationMessage(role=MessageRole.USER, content="Hi")
+    session = ConversationSession(session_id="s1", user_id="u1")
+    response = ConversationResponse(
+        message="Hi", session_id="s1", status=ConversationStatus.ACTIVE
+    )
+    gap = InfoGap(
+        field_name="court_level", field_type="enum", description="Court",
+        priority=1, required=True,
+    )
+
+    for obj in (message, session, response, gap):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_question_template_compiled_pattern():
+    """Test the validation pattern is compiled once and reused"""
+    template = QuestionTemplate(
+        field_name="amount", template="Amount?", priority=1,
+        validation_pattern=r"^\d+(\.\d{2})?$",
+    )
+
+    assert template.compiled_pattern is template.compiled_pattern
+    assert template.compiled_pattern.match("100.50")
+    assert not template.compiled_pattern.match("abc")
+    assert QuestionTemplate(field_name="x", template="X?", priority=1).compiled_pattern is None
+
+
+def test_validation_error_is_slotted_and_frozen():
+    """Test validation errors carry no __dict__ and cannot be modified"""
+    error = ValidationError(
+        field_name="total_costs", error_type="protected_field_modified",
+        message="modified", current_value="200.0",
+    )
+
+    assert not hasattr(error, "__dict__")
+    with pytest.raises(AttributeError):
+        error.message = "changed"